@@ -143,6 +143,9 @@ SCRAPING = {
     "delay_between_requests": 1.5,  # seconds
     "max_retries": 3,
     "timeout": 30,
+    "pool_connections": 8,  # hosts kept in the keep-alive pool
+    "pool_maxsize": 32,  # connections kept per host
+    "use_selectolax": True,  # scan listing page links with selectolax when installed
     "user_agent": "ImmoAgent/1.0 (Contact: immo-agent@example.com)"
 }
 
@@ -5,10 +5,14 @@ Uses Claude to intelligently extract structured data from HTML
 import os
 import json
 import hashlib
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple
 from datetime import datetime, date
 from dataclasses import dataclass, asdict
+import requests
 from loguru import logger
 
 try:
@@ -71,6 +75,69 @@ class ExtractedAuctionData:
             self.extraction_notes = []
 
 
+def _clean_page_html(html: str) -> str:
+    """
+    Clean HTML to reduce token usage while preserving important content
+    """
+    from bs4 import BeautifulSoup
+
+    soup = BeautifulSoup(html, 'html.parser')
+
+    # Remove scripts, styles, and other non-content elements
+    for tag in soup.find_all(['script', 'style', 'nav', 'footer', 'header', 'noscript', 'iframe']):
+        tag.decompose()
+
+    # Remove comments
+    from bs4 import Comment
+    for comment in soup.find_all(string=lambda text: isinstance(text, Comment)):
+        comment.extract()
+
+    # Get text with some structure preserved
+    # Keep important semantic elements
+    text_parts = []
+
+    # Extract title
+    title = soup.find('title')
+    if title:
+        text_parts.append(f"TITRE: {title.get_text(strip=True)}")
+
+    # Extract main content areas
+    main_content = soup.find('main') or soup.find('article') or soup.find(class_=lambda x: x and 'content' in str(x).lower())
+    if main_content:
+        soup = main_content
+
+    # Get all text with paragraph breaks
+    text = soup.get_text(separator='\n', strip=True)
+
+    # Clean up excessive whitespace
+    import re
+    text = re.sub(r'\n{3,}', '\n\n', text)
+    text = re.sub(r' {2,}', ' ', text)
+
+    # Also extract image URLs
+    images = []
+    for img in soup.find_all('img', src=True):
+        src = img.get('src', '')
+        if src and not any(x in src.lower() for x in ['logo', 'icon', 'avatar', 'sprite']):
+            images.append(src)
+
+    # Extract document links
+    docs = []
+    for link in soup.find_all('a', href=True):
+        href = link.get('href', '')
+        link_text = link.get_text(strip=True)
+        if '.pdf' in href.lower() or any(x in link_text.lower() for x in ['cahier', 'pv', 'document', 'télécharger']):
+            docs.append(f"{link_text}: {href}")
+
+    result = text_parts + [text]
+    if images:
+        result.append(f"\nIMAGES: {', '.join(images[:10])}")
+    if docs:
+        result.append(f"\nDOCUMENTS: {', '.join(docs)}")
+
+    return '\n'.join(result)[:15000]  # Limit to ~15k chars to stay within token limits
+
+
 class LLMExtractor:
     """
     Extracts structured auction data from HTML using Claude
@@ -126,17 +193,29 @@ Retourne un JSON avec cette structure exacte:
 Si une information n'est pas trouvée, utilise null.
 Retourne UNIQUEMENT le JSON, pas d'explication."""
 
-    def __init__(self, api_key: Optional[str] = None, model: str = "claude-3-5-haiku-20241022"):
+    # Processes used to clean the pages of a batch, and the batch size from which
+    # they are worth their start-up cost
+    PARSE_WORKERS = os.cpu_count() or 1
+    PARSE_PROCESS_MIN_PAGES = 16
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        model: str = "claude-3-5-haiku-20241022",
+        session: Optional[requests.Session] = None
+    ):
         """
         Initialize the LLM extractor
 
         Args:
             api_key: Anthropic API key (defaults to ANTHROPIC_API_KEY env var)
             model: Claude model to use (haiku is fast and cheap for extraction)
+            session: HTTP session for page fetches (shared to reuse its keep-alive connections)
         """
         self.api_key = api_key or os.environ.get("ANTHROPIC_API_KEY")
         self.model = model
         self._client = None
+        self.session = session or requests.Session()
 
         # Cache directory for extracted data
         self.cache_dir = Path(__file__).parent.parent.parent / "data" / "extraction_cache"
@@ -156,15 +235,21 @@ Retourne UNIQUEMENT le JSON, pas d'explication."""
             self._client = anthropic.Anthropic(api_key=self.api_key)
         return self._client
 
-    def _get_cache_key(self, html: str, url: str) -> str:
-        """Generate cache key from URL and HTML hash"""
-        content_hash = hashlib.md5(html.encode()).hexdigest()[:8]
-        url_hash = hashlib.md5(url.encode()).hexdigest()[:8]
-        return f"{url_hash}_{content_hash}"
+    def _get_cache_key(self, url: str, html: str) -> str:
+        """
+        Generate cache key from the model name, prompt, URL and raw page, so a changed
+        prompt or model never reuses stale results. Keyed on the raw HTML so that a
+        hit is found before the (BeautifulSoup) cleaning step.
+        """
+        return hashlib.sha256(f"{self.model}\0{self.EXTRACTION_PROMPT}\0{url}\0{html}".encode()).hexdigest()
+
+    def _cache_file(self, cache_key: str) -> Path:
+        """Cache file for a key, sharded by its first two hex digits"""
+        return self.cache_dir / cache_key[:2] / f"{cache_key}.json"
 
     def _load_from_cache(self, cache_key: str) -> Optional[ExtractedAuctionData]:
         """Load extracted data from cache"""
-        cache_file = self.cache_dir / f"{cache_key}.json"
+        cache_file = self._cache_file(cache_key)
         if cache_file.exists():
             try:
                 with open(cache_file) as f:
@@ -177,8 +262,9 @@ Retourne UNIQUEMENT le JSON, pas d'explication."""
 
     def _save_to_cache(self, cache_key: str, data: ExtractedAuctionData):
         """Save extracted data to cache"""
-        cache_file = self.cache_dir / f"{cache_key}.json"
+        cache_file = self._cache_file(cache_key)
         try:
+            cache_file.parent.mkdir(exist_ok=True)
             with open(cache_file, "w") as f:
                 json.dump(asdict(data), f, ensure_ascii=False, indent=2)
             logger.debug(f"[LLMExtractor] Saved to cache: {cache_key}")
@@ -186,66 +272,87 @@ Retourne UNIQUEMENT le JSON, pas d'explication."""
             logger.warning(f"[LLMExtractor] Cache save error: {e}")
 
     def _clean_html(self, html: str) -> str:
+        """Clean HTML to reduce token usage while preserving important content"""
+        return _clean_page_html(html)
+
+    def _clean_pages(self, htmls: List[str]) -> List[str]:
         """
-        Clean HTML to reduce token usage while preserving important content
+        Clean several pages, across processes when there are enough of them
+        (BeautifulSoup parsing is CPU-bound and holds the GIL)
         """
-        from bs4 import BeautifulSoup
-
-        soup = BeautifulSoup(html, 'html.parser')
-
-        # Remove scripts, styles, and other non-content elements
-        for tag in soup.find_all(['script', 'style', 'nav', 'footer', 'header', 'noscript', 'iframe']):
-            tag.decompose()
-
-        # Remove comments
-        from bs4 import Comment
-        for comment in soup.find_all(string=lambda text: isinstance(text, Comment)):
-            comment.extract()
-
-        # Get text with some structure preserved
-        # Keep important semantic elements
-        text_parts = []
-
-        # Extract title
-        title = soup.find('title')
-        if title:
-            text_parts.append(f"TITRE: {title.get_text(strip=True)}")
-
-        # Extract main content areas
-        main_content = soup.find('main') or soup.find('article') or soup.find(class_=lambda x: x and 'content' in str(x).lower())
-        if main_content:
-            soup = main_content
-
-        # Get all text with paragraph breaks
-        text = soup.get_text(separator='\n', strip=True)
-
-        # Clean up excessive whitespace
-        import re
-        text = re.sub(r'\n{3,}', '\n\n', text)
-        text = re.sub(r' {2,}', ' ', text)
-
-        # Also extract image URLs
-        images = []
-        for img in soup.find_all('img', src=True):
-            src = img.get('src', '')
-            if src and not any(x in src.lower() for x in ['logo', 'icon', 'avatar', 'sprite']):
-                images.append(src)
-
-        # Extract document links
-        docs = []
-        for link in soup.find_all('a', href=True):
-            href = link.get('href', '')
-            link_text = link.get_text(strip=True)
-            if '.pdf' in href.lower() or any(x in link_text.lower() for x in ['cahier', 'pv', 'document', 'télécharger']):
-                docs.append(f"{link_text}: {href}")
-
-        result = text_parts + [text]
-        if images:
-            result.append(f"\nIMAGES: {', '.join(images[:10])}")
-        if docs:
-            result.append(f"\nDOCUMENTS: {', '.join(docs)}")
-
-        return '\n'.join(result)[:15000]  # Limit to ~15k chars to stay within token limits
+        workers = min(self.PARSE_WORKERS, len(htmls))
+        if workers < 2 or len(htmls) < self.PARSE_PROCESS_MIN_PAGES:
+            return [self._clean_html(html) for html in htmls]
+
+        try:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                return list(executor.map(_clean_page_html, htmls, chunksize=4))
+        except (OSError, BrokenProcessPool) as e:
+            logger.warning(f"[LLMExtractor] Process pool unavailable, cleaning pages serially: {e}")
+            return [self._clean_html(html) for html in htmls]
+
+    def _build_content(self, url: str, cleaned_html: str) -> str:
+        """User message for a page: its URL and its cleaned HTML"""
+        return f"URL: {url}\n\nCONTENU DE LA PAGE:\n{cleaned_html}"
+
+    def _request_params(self, content: str) -> Dict[str, Any]:
+        """Messages API parameters for a page (shared by single and batched requests)"""
+        # The instructions are the same for every page and go in the system prompt;
+        # the user message only carries the page itself
+        return {
+            "model": self.model,
+            "max_tokens": 2000,
+            "system": self.EXTRACTION_PROMPT,
+            "messages": [
+                {
+                    "role": "user",
+                    "content": content
+                }
+            ]
+        }
+
+    def _parse_response(self, response_text: str) -> ExtractedAuctionData:
+        """Parse the model's JSON answer (raises json.JSONDecodeError if malformed)"""
+        response_text = response_text.strip()
+
+        # Handle potential markdown code blocks
+        if response_text.startswith("```"):
+            response_text = response_text.split("```")[1]
+            if response_text.startswith("json"):
+                response_text = response_text[4:]
+            response_text = response_text.strip()
+
+        data = json.loads(response_text)
+
+        # Convert to dataclass
+        return ExtractedAuctionData(
+            adresse=data.get("adresse"),
+            code_postal=data.get("code_postal"),
+            ville=data.get("ville"),
+            department=data.get("department"),
+            type_bien=data.get("type_bien"),
+            surface=data.get("surface"),
+            nb_pieces=data.get("nb_pieces"),
+            nb_chambres=data.get("nb_chambres"),
+            etage=data.get("etage"),
+            description=data.get("description"),
+            occupation=data.get("occupation"),
+            mise_a_prix=data.get("mise_a_prix"),
+            date_vente=data.get("date_vente"),
+            heure_vente=data.get("heure_vente"),
+            dates_visite=data.get("dates_visite", []),
+            tribunal=data.get("tribunal"),
+            avocat_nom=data.get("avocat_nom"),
+            avocat_cabinet=data.get("avocat_cabinet"),
+            avocat_telephone=data.get("avocat_telephone"),
+            avocat_email=data.get("avocat_email"),
+            avocat_adresse=data.get("avocat_adresse"),
+            photos=data.get("photos", []),
+            documents=data.get("documents", []),
+            pv_url=data.get("pv_url"),
+            confidence=data.get("confidence", 0.5),
+            extraction_notes=data.get("extraction_notes", [])
+        )
 
     def extract(self, html: str, url: str, use_cache: bool = True) -> Optional[ExtractedAuctionData]:
         """
@@ -263,71 +370,23 @@ Retourne UNIQUEMENT le JSON, pas d'explication."""
             logger.error("[LLMExtractor] No API key configured")
             return None
 
-        # Check cache
-        cache_key = self._get_cache_key(html, url)
+        # Check cache before cleaning: most pages of a re-run are unchanged
+        cache_key = self._get_cache_key(url, html)
         if use_cache:
             cached = self._load_from_cache(cache_key)
             if cached:
                 return cached
 
         # Clean HTML to reduce tokens
-        cleaned_html = self._clean_html(html)
+        content = self._build_content(url, self._clean_html(html))
 
+        response_text = ""
         try:
             logger.info(f"[LLMExtractor] Extracting data from {url}")
 
-            response = self.client.messages.create(
-                model=self.model,
-                max_tokens=2000,
-                messages=[
-                    {
-                        "role": "user",
-                        "content": f"{self.EXTRACTION_PROMPT}\n\nURL: {url}\n\nCONTENU DE LA PAGE:\n{cleaned_html}"
-                    }
-                ]
-            )
-
-            # Parse JSON response
-            response_text = response.content[0].text.strip()
-
-            # Handle potential markdown code blocks
-            if response_text.startswith("```"):
-                response_text = response_text.split("```")[1]
-                if response_text.startswith("json"):
-                    response_text = response_text[4:]
-                response_text = response_text.strip()
-
-            data = json.loads(response_text)
-
-            # Convert to dataclass
-            result = ExtractedAuctionData(
-                adresse=data.get("adresse"),
-                code_postal=data.get("code_postal"),
-                ville=data.get("ville"),
-                department=data.get("department"),
-                type_bien=data.get("type_bien"),
-                surface=data.get("surface"),
-                nb_pieces=data.get("nb_pieces"),
-                nb_chambres=data.get("nb_chambres"),
-                etage=data.get("etage"),
-                description=data.get("description"),
-                occupation=data.get("occupation"),
-                mise_a_prix=data.get("mise_a_prix"),
-                date_vente=data.get("date_vente"),
-                heure_vente=data.get("heure_vente"),
-                dates_visite=data.get("dates_visite", []),
-                tribunal=data.get("tribunal"),
-                avocat_nom=data.get("avocat_nom"),
-                avocat_cabinet=data.get("avocat_cabinet"),
-                avocat_telephone=data.get("avocat_telephone"),
-                avocat_email=data.get("avocat_email"),
-                avocat_adresse=data.get("avocat_adresse"),
-                photos=data.get("photos", []),
-                documents=data.get("documents", []),
-                pv_url=data.get("pv_url"),
-                confidence=data.get("confidence", 0.5),
-                extraction_notes=data.get("extraction_notes", [])
-            )
+            response = self.client.messages.create(**self._request_params(content))
+            response_text = response.content[0].text
+            result = self._parse_response(response_text)
 
             # Cache the result
             if use_cache:
@@ -347,26 +406,130 @@ Retourne UNIQUEMENT le JSON, pas d'explication."""
             logger.error(f"[LLMExtractor] Extraction error: {e}")
             return None
 
-    def extract_from_url(self, url: str, use_cache: bool = True) -> Optional[ExtractedAuctionData]:
+    def extract_batch(
+        self,
+        pages: List[Tuple[str, str]],
+        use_cache: bool = True,
+        poll_interval: float = 60.0
+    ) -> List[Optional[ExtractedAuctionData]]:
         """
-        Fetch URL and extract data
+        Extract several pages through the Message Batches API
+
+        Batched requests cost half as much as individual calls but may take up to
+        24h to complete, so this is meant for bulk/nightly scrapes where latency
+        does not matter. Blocks until the batch has ended.
 
         Args:
-            url: URL to fetch and extract from
+            pages: (url, raw HTML) of each auction page
             use_cache: Whether to use cached extractions
+            poll_interval: Seconds between batch status checks
+
+        Returns:
+            ExtractedAuctionData (or None if extraction failed) for each page, in pages order
         """
-        import requests
+        if not pages:
+            return []
+        if not self.api_key:
+            logger.error("[LLMExtractor] No API key configured")
+            return [None] * len(pages)
+
+        results: List[Optional[ExtractedAuctionData]] = [None] * len(pages)
+        # Pages to send, by cache key (a 64-char hex digest, valid as a batch custom_id);
+        # identical pages share one request
+        misses: Dict[str, Tuple[str, str]] = {}
+        positions: Dict[str, List[int]] = {}
+
+        for i, (url, html) in enumerate(pages):
+            cache_key = self._get_cache_key(url, html)
+            if use_cache:
+                cached = self._load_from_cache(cache_key)
+                if cached:
+                    results[i] = cached
+                    continue
+            misses.setdefault(cache_key, (url, html))
+            positions.setdefault(cache_key, []).append(i)
+
+        # Only the pages actually sent are cleaned
+        cleaned_pages = self._clean_pages([html for _, html in misses.values()])
+        contents = {
+            cache_key: self._build_content(url, cleaned_html)
+            for (cache_key, (url, _)), cleaned_html in zip(misses.items(), cleaned_pages)
+        }
+
+        if not contents:
+            return results
 
         try:
-            response = requests.get(url, timeout=30, headers={
+            logger.info(f"[LLMExtractor] Submitting batch of {len(contents)} pages")
+            batch = self.client.messages.batches.create(requests=[
+                {"custom_id": cache_key, "params": self._request_params(content)}
+                for cache_key, content in contents.items()
+            ])
+
+            while batch.processing_status != "ended":
+                time.sleep(poll_interval)
+                batch = self.client.messages.batches.retrieve(batch.id)
+
+            for entry in self.client.messages.batches.results(batch.id):
+                if entry.result.type != "succeeded":
+                    logger.warning(f"[LLMExtractor] Batch request {entry.custom_id} {entry.result.type}")
+                    continue
+                try:
+                    result = self._parse_response(entry.result.message.content[0].text)
+                except json.JSONDecodeError as e:
+                    logger.error(f"[LLMExtractor] JSON parse error: {e}")
+                    continue
+                if use_cache:
+                    self._save_to_cache(entry.custom_id, result)
+                for i in positions.get(entry.custom_id, ()):
+                    results[i] = result
+
+        except anthropic.APIError as e:
+            logger.error(f"[LLMExtractor] Batch API error: {e}")
+        except Exception as e:
+            logger.error(f"[LLMExtractor] Batch extraction error: {e}")
+
+        logger.info(f"[LLMExtractor] Batch extracted {sum(r is not None for r in results)}/{len(pages)} pages")
+        return results
+
+    def fetch_html(self, url: str) -> Optional[str]:
+        """Fetch an auction page, None on HTTP errors"""
+        try:
+            response = self.session.get(url, timeout=30, headers={
                 'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
             })
             response.raise_for_status()
-            return self.extract(response.text, url, use_cache)
+            return response.text
         except requests.RequestException as e:
             logger.error(f"[LLMExtractor] Fetch error for {url}: {e}")
             return None
 
+    def extract_from_url(self, url: str, use_cache: bool = True) -> Optional[ExtractedAuctionData]:
+        """
+        Fetch URL and extract data
+
+        Args:
+            url: URL to fetch and extract from
+            use_cache: Whether to use cached extractions
+        """
+        html = self.fetch_html(url)
+        if html is None:
+            return None
+        return self.extract(html, url, use_cache)
+
+
+# Shared instances, one per API key
+_extractors: Dict[Optional[str], "LLMExtractor"] = {}
+
+
+def get_llm_extractor(api_key: Optional[str] = None) -> LLMExtractor:
+    """Get shared LLMExtractor instance for an API key (it owns its HTTP session)"""
+    key = api_key or os.environ.get("ANTHROPIC_API_KEY")
+    extractor = _extractors.get(key)
+    if extractor is None:
+        extractor = _extractors[key] = LLMExtractor(api_key=key)
+    return extractor
+
 
 # Convenience function for quick extraction
 def extract_auction_data(url: str, api_key: Optional[str] = None) -> Optional[ExtractedAuctionData]:
@@ -380,5 +543,5 @@ def extract_auction_data(url: str, api_key: Optional[str] = None) -> Optional[Ex
     Returns:
         ExtractedAuctionData or None
     """
-    extractor = LLMExtractor(api_key=api_key)
+    extractor = get_llm_extractor(api_key)
     return extractor.extract_from_url(url)
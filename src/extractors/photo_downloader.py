@@ -25,21 +25,25 @@ class PhotoDownloader:
     """
 
     SUPPORTED_EXTENSIONS = {'.jpg', '.jpeg', '.png', '.gif', '.webp', '.bmp'}
+    # Sent with every photo request, also on a shared session with other headers
+    HEADERS = {
+        'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
+    }
+    MAX_WORKERS = 8  # concurrent downloads per auction (photos usually share one host)
 
-    def __init__(self, photos_dir: Optional[Path] = None):
+    def __init__(self, photos_dir: Optional[Path] = None, session: Optional[requests.Session] = None):
         """
         Initialize photo downloader
 
         Args:
             photos_dir: Directory to store photos (defaults to data/photos)
+            session: HTTP session to download with (shared to reuse its keep-alive
+                connections); a new one is created if not provided
         """
         self.photos_dir = photos_dir or Path(__file__).parent.parent.parent / "data" / "photos"
         self.photos_dir.mkdir(parents=True, exist_ok=True)
 
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
-        })
+        self.session = session or requests.Session()
 
     def _get_extension(self, url: str, content_type: Optional[str] = None) -> str:
         """Determine file extension from URL or content type"""
@@ -106,7 +110,7 @@ class PhotoDownloader:
             return None
 
         try:
-            response = self.session.get(url, timeout=30, stream=True)
+            response = self.session.get(url, timeout=30, stream=True, headers=self.HEADERS)
             response.raise_for_status()
 
             content = response.content
@@ -123,17 +127,14 @@ class PhotoDownloader:
             auction_dir = self.photos_dir / str(auction_id)
             auction_dir.mkdir(exist_ok=True)
 
-            # Check for duplicates
-            for existing in auction_dir.glob(f"*{ext}"):
-                with open(existing, 'rb') as f:
-                    if self._get_content_hash(f.read()) == content_hash:
-                        logger.debug(f"[PhotoDownloader] Duplicate skipped: {url}")
-                        return str(existing)
-
-            # Save new photo
+            # Files are named by content hash, so a duplicate is already at this path
             filename = f"{content_hash[:12]}{ext}"
             filepath = auction_dir / filename
+            if filepath.exists():
+                logger.debug(f"[PhotoDownloader] Duplicate skipped: {url}")
+                return str(filepath)
 
+            # Save new photo
             with open(filepath, 'wb') as f:
                 f.write(content)
 
@@ -153,7 +154,7 @@ class PhotoDownloader:
         auction_id: int,
         base_url: Optional[str] = None,
         max_photos: int = 20,
-        max_workers: int = 4
+        max_workers: int = MAX_WORKERS
     ) -> List[str]:
         """
         Download multiple photos concurrently
@@ -177,7 +178,7 @@ class PhotoDownloader:
 
         logger.info(f"[PhotoDownloader] Downloading {len(unique_urls)} photos for auction {auction_id}")
 
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(unique_urls)))) as executor:
             future_to_url = {
                 executor.submit(self.download_photo, url, auction_id, base_url): url
                 for url in unique_urls
@@ -260,8 +261,20 @@ class PhotoDownloader:
         }
 
 
+# Singleton instance
+_downloader = None
+
+
+def get_photo_downloader() -> PhotoDownloader:
+    """Get singleton instance of PhotoDownloader (it owns its HTTP session)"""
+    global _downloader
+    if _downloader is None:
+        _downloader = PhotoDownloader()
+    return _downloader
+
+
 # Convenience function
 def download_auction_photos(urls: List[str], auction_id: int, base_url: Optional[str] = None) -> List[str]:
     """Quick download of auction photos"""
-    downloader = PhotoDownloader()
+    downloader = get_photo_downloader()
     return downloader.download_photos(urls, auction_id, base_url)
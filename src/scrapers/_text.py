@@ -0,0 +1,26 @@
+"""
+Text and HTML parsing helpers shared by the scrapers
+"""
+from typing import Optional
+
+# Lexbor backend: selectolax 1.x removed the Modest one (selectolax.parser)
+try:
+    from selectolax.lexbor import LexborHTMLParser as HTMLParser
+    HAS_SELECTOLAX = True
+except ImportError:
+    HTMLParser = None
+    HAS_SELECTOLAX = False
+
+
+class _PriceChars(dict):
+    """str.translate table keeping only digits (as regex \\d), ',' and '.', filled per character"""
+
+    def __missing__(self, code: int) -> Optional[str]:
+        char = chr(code)
+        kept = char if char in ",." or char.isdecimal() else None
+        self[code] = kept
+        return kept
+
+
+# Price strings: text.translate(PRICE_CHARS) leaves only digits and separators
+PRICE_CHARS = _PriceChars()
@@ -3,9 +3,14 @@ Base scraper class for auction websites
 """
 from abc import ABC, abstractmethod
 from typing import List, Optional, Dict, Any
+import threading
 import time
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup, SoupStrainer
+import lxml.html
+from lxml import etree
 from loguru import logger
 import sys
 
@@ -29,6 +34,15 @@ class BaseScraper(ABC):
         self.name = name
         self.base_url = base_url
         self.session = requests.Session()
+        # Sized keep-alive pool; connection failures (e.g. a pooled socket closed by the
+        # server) are retried here, HTTP errors by fetch_content's own retry loop
+        adapter = HTTPAdapter(
+            pool_connections=SCRAPING["pool_connections"],
+            pool_maxsize=SCRAPING["pool_maxsize"],
+            max_retries=Retry(total=3, connect=3, read=0, status=0, backoff_factor=0.3),
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
         self.session.headers.update({
             "User-Agent": SCRAPING["user_agent"],
             "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
@@ -38,16 +52,41 @@ class BaseScraper(ABC):
         self.timeout = SCRAPING["timeout"]
         self.max_retries = SCRAPING["max_retries"]
         self._last_request_time = 0
+        self._request_lock = threading.Lock()
 
     def _wait_between_requests(self):
-        """Ensure minimum delay between requests"""
-        elapsed = time.time() - self._last_request_time
-        if elapsed < self.delay:
-            time.sleep(self.delay - elapsed)
-        self._last_request_time = time.time()
-
-    def fetch_page(self, url: str, params: Optional[Dict] = None) -> Optional[BeautifulSoup]:
-        """Fetch a page and return BeautifulSoup object"""
+        """Ensure minimum delay between requests (also across fetcher threads)"""
+        with self._request_lock:
+            elapsed = time.time() - self._last_request_time
+            if elapsed < self.delay:
+                time.sleep(self.delay - elapsed)
+            self._last_request_time = time.time()
+
+    def fetch_page(
+        self,
+        url: str,
+        params: Optional[Dict] = None,
+        parse_only: Optional[SoupStrainer] = None
+    ) -> Optional[BeautifulSoup]:
+        """Fetch a page and return BeautifulSoup object (optionally built only from parse_only nodes)"""
+        content = self.fetch_content(url, params=params)
+        if content is None:
+            return None
+        return BeautifulSoup(content, "lxml", parse_only=parse_only)
+
+    def fetch_links(self, url: str, xpath: str) -> List[str]:
+        """Fetch a page and return the strings selected by xpath (e.g. hrefs), without building a soup"""
+        content = self.fetch_content(url)
+        if not content:
+            return []
+        try:
+            return [str(value) for value in lxml.html.fromstring(content).xpath(xpath)]
+        except (etree.ParserError, etree.XPathError) as e:
+            logger.warning(f"[{self.name}] Could not extract links from {url}: {e}")
+            return []
+
+    def fetch_content(self, url: str, params: Optional[Dict] = None) -> Optional[bytes]:
+        """Fetch a page and return its raw body"""
         self._wait_between_requests()
 
         for attempt in range(self.max_retries):
@@ -55,7 +94,7 @@ class BaseScraper(ABC):
                 logger.debug(f"[{self.name}] Fetching: {url}")
                 response = self.session.get(url, params=params, timeout=self.timeout)
                 response.raise_for_status()
-                return BeautifulSoup(response.content, "lxml")
+                return response.content
             except requests.RequestException as e:
                 logger.warning(f"[{self.name}] Attempt {attempt + 1}/{self.max_retries} failed: {e}")
                 if attempt < self.max_retries - 1:
@@ -132,7 +171,7 @@ class BaseScraper(ABC):
             response.raise_for_status()
 
             with open(save_path, "wb") as f:
-                for chunk in response.iter_content(chunk_size=8192):
+                for chunk in response.iter_content(chunk_size=65536):
                     f.write(chunk)
 
             logger.info(f"[{self.name}] Downloaded PDF to {save_path}")
@@ -2,15 +2,71 @@
 Cross-source validation for auction data
 Merges data from multiple sources to improve reliability
 """
+import operator
 import re
+from collections import defaultdict
 from datetime import date, datetime
 from typing import List, Optional, Dict, Any, Tuple
 from dataclasses import dataclass, field
+from functools import lru_cache
+from itertools import chain
 from difflib import SequenceMatcher
+import numpy as np
+import pandas as pd
 from loguru import logger
 
+try:
+    from scipy.optimize import linear_sum_assignment
+    HAS_SCIPY = True
+except ImportError:
+    HAS_SCIPY = False
+
 from src.storage.models import Auction, PropertyType
 
+# Weights of the string/enum match components
+TEXT_MATCH_WEIGHTS = {'tribunal': 0.15, 'ville': 0.15, 'type_bien': 0.1}
+TEXT_MATCH_WEIGHT = sum(TEXT_MATCH_WEIGHTS.values())
+
+# Similarities below this are reported as 0.0 without running SequenceMatcher
+SIMILARITY_FLOOR = 0.5
+
+
+def _encode_values(values1: List[Any], values2: List[Any]) -> Tuple[List[Any], np.ndarray, np.ndarray]:
+    """
+    Encode two value lists as integer codes into a shared list of distinct values
+
+    Empty values get code -1.
+
+    Returns: (distinct values, codes1, codes2)
+    """
+    codes = {}
+    codes1 = np.array([codes.setdefault(v, len(codes)) if v else -1 for v in values1], dtype=np.int64)
+    codes2 = np.array([codes.setdefault(v, len(codes)) if v else -1 for v in values2], dtype=np.int64)
+    return list(codes), codes1, codes2
+
+
+@lru_cache(maxsize=4096)
+def _normalize_text(text: Optional[str]) -> str:
+    """Normalize text for comparison (cached: the same villes/tribunaux recur across pairs)"""
+    if not text:
+        return ""
+    # Lowercase, remove accents approximation, normalize spaces
+    text = text.lower().strip()
+    text = re.sub(r'\s+', ' ', text)
+    # Common replacements
+    replacements = {
+        'é': 'e', 'è': 'e', 'ê': 'e', 'ë': 'e',
+        'à': 'a', 'â': 'a', 'ä': 'a',
+        'ù': 'u', 'û': 'u', 'ü': 'u',
+        'ô': 'o', 'ö': 'o',
+        'î': 'i', 'ï': 'i',
+        'ç': 'c',
+        '-': ' ', "'": ' ',
+    }
+    for old, new in replacements.items():
+        text = text.replace(old, new)
+    return text
+
 
 @dataclass
 class ValidationResult:
@@ -81,6 +137,29 @@ class CrossValidator:
     # Reverse lookup
     CITIES_BY_POSTAL = {v: k for k, v in POSTAL_CODES.items()}
 
+    # Same tables precomputed in the forms used at lookup time
+    NORMALIZED_POSTAL_CODES = {_normalize_text(k): v for k, v in POSTAL_CODES.items()}
+    NORMALIZED_CITIES_BY_POSTAL = {k: _normalize_text(v) for k, v in CITIES_BY_POSTAL.items()}
+    TITLED_CITIES_BY_POSTAL = {k: v.title() for k, v in CITIES_BY_POSTAL.items()}
+
+    # Fields merged one by one in merge_auctions
+    FIELDS_TO_MERGE = (
+        'adresse', 'code_postal', 'ville', 'department',
+        'type_bien', 'surface', 'nb_pieces', 'nb_chambres', 'etage',
+        'description', 'occupation',
+        'mise_a_prix', 'date_vente', 'heure_vente', 'tribunal',
+        'avocat_nom', 'avocat_cabinet', 'avocat_telephone', 'avocat_email', 'avocat_adresse',
+        'pv_url', 'photos', 'documents',
+    )
+
+    # Field groups driving _pick_best_value
+    LONGER_IS_BETTER_FIELDS = frozenset({'adresse', 'description', 'avocat_adresse'})
+    NUMERIC_FIELDS = frozenset({'surface', 'nb_pieces', 'nb_chambres', 'mise_a_prix'})
+    LIST_FIELDS = frozenset({'photos', 'documents'})
+
+    # Fields _enrich_from_postal may fill in
+    POSTAL_ENRICHED_FIELDS = ('code_postal', 'ville', 'department')
+
     def __init__(self):
         self.stats = {
             'total_processed': 0,
@@ -88,85 +167,149 @@ class CrossValidator:
             'fields_improved': 0,
         }
 
-    def _normalize_text(self, text: Optional[str]) -> str:
-        """Normalize text for comparison"""
-        if not text:
-            return ""
-        # Lowercase, remove accents approximation, normalize spaces
-        text = text.lower().strip()
-        text = re.sub(r'\s+', ' ', text)
-        # Common replacements
-        replacements = {
-            'é': 'e', 'è': 'e', 'ê': 'e', 'ë': 'e',
-            'à': 'a', 'â': 'a', 'ä': 'a',
-            'ù': 'u', 'û': 'u', 'ü': 'u',
-            'ô': 'o', 'ö': 'o',
-            'î': 'i', 'ï': 'i',
-            'ç': 'c',
-            '-': ' ', "'": ' ',
-        }
-        for old, new in replacements.items():
-            text = text.replace(old, new)
-        return text
-
     def _similarity(self, a: Optional[str], b: Optional[str]) -> float:
         """Calculate similarity between two strings"""
         if not a or not b:
             return 0.0
-        a_norm = self._normalize_text(a)
-        b_norm = self._normalize_text(b)
+        a_norm = _normalize_text(a)
+        b_norm = _normalize_text(b)
+        if a_norm == b_norm:
+            return 1.0
+        # ratio() is at most 2*min/(len_a+len_b): far too different lengths can't
+        # reach any threshold we use (all >= 0.6), skip the O(L²) matcher
+        if 2 * min(len(a_norm), len(b_norm)) < SIMILARITY_FLOOR * (len(a_norm) + len(b_norm)):
+            return 0.0
         return SequenceMatcher(None, a_norm, b_norm).ratio()
 
-    def _match_auctions(self, auction1: Auction, auction2: Auction) -> float:
+    def _same_tribunal(self, a: str, b: str) -> bool:
+        """Tribunal component rule"""
+        return self._similarity(a, b) > 0.7
+
+    def _same_ville(self, a: str, b: str) -> bool:
+        """Ville component rule"""
+        return self._similarity(a, b) > 0.8
+
+    def _text_match_scores(
+        self,
+        auctions1: List[Auction],
+        auctions2: List[Auction],
+        rows: np.ndarray,
+        cols: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
         """
-        Calculate match score between two auctions (0-1)
+        Score the string/enum match components for many pairs at once
 
-        High score = likely same property
+        Values are encoded as integer codes, so each rule runs once per
+        distinct (value1, value2) combination among the pairs and is then
+        broadcast back with array indexing.
+
+        Returns: (score, weights) arrays aligned with rows/cols
+        """
+        score = np.zeros(len(rows))
+        weights = np.zeros(len(rows))
+
+        # (attribute, rule on a distinct value pair)
+        text_rules = (
+            ('tribunal', self._same_tribunal),
+            ('ville', self._same_ville),
+            ('type_bien', operator.eq),
+        )
+        for attr, rule in text_rules:
+            weight = TEXT_MATCH_WEIGHTS[attr]
+            uniques, codes1, codes2 = _encode_values(
+                [getattr(a, attr) for a in auctions1],
+                [getattr(a, attr) for a in auctions2],
+            )
+            c1, c2 = codes1[rows], codes2[cols]
+            both = (c1 >= 0) & (c2 >= 0)
+            keys, inverse = np.unique(np.where(both, c1 * len(uniques) + c2, -1), return_inverse=True)
+            agrees = np.array([
+                k >= 0 and bool(rule(uniques[k // len(uniques)], uniques[k % len(uniques)]))
+                for k in keys
+            ], dtype=bool)
+            score += weight * (both & agrees[inverse])
+            weights += weight * both
+
+        return score, weights
+
+    def _candidate_pairs(
+        self,
+        auctions1: List[Auction],
+        auctions2: List[Auction]
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Candidate (i, j) index pairs, blocked on date de vente
+
+        Two different known dates never match (different sales), so each
+        auction is only paired with same-date or undated auctions of the
+        other source instead of all of them.
+
+        Returns: (rows, cols) index arrays into auctions1 / auctions2
+        """
+        by_date = defaultdict(list)
+        undated = []
+        for j, auction in enumerate(auctions2):
+            if auction.date_vente:
+                by_date[auction.date_vente].append(j)
+            else:
+                undated.append(j)
+
+        all_indices = list(range(len(auctions2)))
+        rows = []
+        cols = []
+        for i, auction in enumerate(auctions1):
+            if auction.date_vente:
+                block = by_date.get(auction.date_vente, []) + undated
+            else:
+                block = all_indices
+            rows.extend([i] * len(block))
+            cols.extend(block)
+
+        return np.array(rows, dtype=np.intp), np.array(cols, dtype=np.intp)
+
+    def _numeric_match_scores(
+        self,
+        auctions1: List[Auction],
+        auctions2: List[Auction],
+        rows: np.ndarray,
+        cols: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
         """
-        score = 0.0
-        weights = 0.0
-
-        # Same date de vente (strong indicator)
-        if auction1.date_vente and auction2.date_vente:
-            if auction1.date_vente == auction2.date_vente:
-                score += 0.3
-            weights += 0.3
-
-        # Same tribunal
-        if auction1.tribunal and auction2.tribunal:
-            if self._similarity(auction1.tribunal, auction2.tribunal) > 0.7:
-                score += 0.15
-            weights += 0.15
-
-        # Similar price (within 10%)
-        if auction1.mise_a_prix and auction2.mise_a_prix:
-            price_diff = abs(auction1.mise_a_prix - auction2.mise_a_prix)
-            avg_price = (auction1.mise_a_prix + auction2.mise_a_prix) / 2
-            if price_diff / avg_price < 0.1:
-                score += 0.2
-            weights += 0.2
-
-        # Same city
-        if auction1.ville and auction2.ville:
-            if self._similarity(auction1.ville, auction2.ville) > 0.8:
-                score += 0.15
-            weights += 0.15
-
-        # Same property type
-        if auction1.type_bien and auction2.type_bien:
-            if auction1.type_bien == auction2.type_bien:
-                score += 0.1
-            weights += 0.1
-
-        # Similar surface (within 5%)
-        if auction1.surface and auction2.surface:
-            surface_diff = abs(auction1.surface - auction2.surface)
-            avg_surface = (auction1.surface + auction2.surface) / 2
-            if surface_diff / avg_surface < 0.05:
-                score += 0.1
-            weights += 0.1
-
-        return score / weights if weights > 0 else 0.0
+        Score the numeric match components (date, price, surface) for many pairs at once
+
+        Same date de vente, price within 10% and surface within 5%, vectorized over
+        the (rows[k], cols[k]) pairs.
+        Missing values are NaN and never count towards weights.
+
+        Returns: (score, weights) arrays aligned with rows/cols
+        """
+        def as_array(values) -> np.ndarray:
+            return np.array([v if v else np.nan for v in values], dtype=np.float64)
+
+        score = np.zeros(len(rows))
+        weights = np.zeros(len(rows))
+
+        # Candidate pairs never have conflicting dates: a known date on both sides is a match
+        d1 = np.array([bool(a.date_vente) for a in auctions1], dtype=bool)
+        d2 = np.array([bool(a.date_vente) for a in auctions2], dtype=bool)
+        both = d1[rows] & d2[cols]
+        score += 0.3 * both
+        weights += 0.3 * both
+
+        # (values1, values2, relative tolerance, weight)
+        numeric_components = (
+            (as_array([a.mise_a_prix for a in auctions1]), as_array([a.mise_a_prix for a in auctions2]), 0.1, 0.2),
+            (as_array([a.surface for a in auctions1]), as_array([a.surface for a in auctions2]), 0.05, 0.1),
+        )
+        with np.errstate(invalid='ignore'):
+            for v1, v2, tolerance, weight in numeric_components:
+                v1, v2 = v1[rows], v2[cols]
+                diff = np.abs(v1 - v2)
+                avg = (v1 + v2) / 2
+                score += weight * (diff / avg < tolerance)
+                weights += weight * (~np.isnan(v1) & ~np.isnan(v2))
+
+        return score, weights
 
     def _pick_best_value(
         self,
@@ -192,13 +335,13 @@ class CrossValidator:
             return val2, source2
 
         # Both have values - pick based on field type
-        if field_name in ['adresse', 'description', 'avocat_adresse']:
-            # Prefer longer (more complete)
-            if len(str(val1)) > len(str(val2)):
+        if field_name in self.LONGER_IS_BETTER_FIELDS:
+            # Prefer longer (more complete); these fields are strings
+            if len(val1) > len(val2):
                 return val1, source1
             return val2, source2
 
-        elif field_name in ['code_postal']:
+        elif field_name == 'code_postal':
             # Validate format (5 digits)
             v1_valid = bool(re.match(r'^\d{5}$', str(val1)))
             v2_valid = bool(re.match(r'^\d{5}$', str(val2)))
@@ -209,23 +352,23 @@ class CrossValidator:
             # Both valid or both invalid - prefer first
             return val1, source1
 
-        elif field_name in ['ville']:
+        elif field_name == 'ville':
             # Check against known cities
-            v1_known = self._normalize_text(val1) in self.POSTAL_CODES
-            v2_known = self._normalize_text(val2) in self.POSTAL_CODES
+            v1_known = _normalize_text(val1) in self.NORMALIZED_POSTAL_CODES
+            v2_known = _normalize_text(val2) in self.NORMALIZED_POSTAL_CODES
             if v1_known and not v2_known:
                 return val1, source1
             if v2_known and not v1_known:
                 return val2, source2
             # Both known - prefer longer/more specific (La Seyne-sur-Mer > Toulon)
-            if len(str(val1)) > len(str(val2)):
+            if len(val1) > len(val2):
                 return val1, source1
-            if len(str(val2)) > len(str(val1)):
+            if len(val2) > len(val1):
                 return val2, source2
             # Same length - prefer source2 as it often has more detailed data
             return val2, source2
 
-        elif field_name in ['surface', 'nb_pieces', 'nb_chambres', 'mise_a_prix']:
+        elif field_name in self.NUMERIC_FIELDS:
             # Numeric - prefer non-zero
             if val1 and (not val2 or val2 == 0):
                 return val1, source1
@@ -234,18 +377,16 @@ class CrossValidator:
             # Both have values - average might be more accurate but stick with first
             return val1, source1
 
-        elif field_name in ['photos', 'documents']:
-            # Lists - merge
-            merged = list(val1 or []) + list(val2 or [])
-            # Deduplicate
-            seen = set()
-            unique = []
-            for item in merged:
-                key = str(item)
-                if key not in seen:
-                    seen.add(key)
-                    unique.append(item)
-            return unique, f"{source1}+{source2}"
+        elif field_name in self.LIST_FIELDS:
+            # Lists - merge and deduplicate, keeping first-seen order
+            items = chain(val1 or (), val2 or ())
+            if field_name == 'photos':
+                return list(dict.fromkeys(items)), f"{source1}+{source2}"
+            # Documents are dicts (unhashable): deduplicate on their string form
+            unique = {}
+            for item in items:
+                unique.setdefault(str(item), item)
+            return list(unique.values()), f"{source1}+{source2}"
 
         # Default: prefer first source
         return val1, source1
@@ -260,34 +401,33 @@ class CrossValidator:
 
         # If we have postal code but no city
         if auction.code_postal and not auction.ville:
-            city = self.CITIES_BY_POSTAL.get(auction.code_postal)
+            city = self.TITLED_CITIES_BY_POSTAL.get(auction.code_postal)
             if city:
-                auction.ville = city.title()
+                auction.ville = city
                 changes.append(f"ville inferred from postal code: {auction.ville}")
 
         # If we have city but no postal code
         if auction.ville and not auction.code_postal:
-            city_norm = self._normalize_text(auction.ville)
+            city_norm = _normalize_text(auction.ville)
             # Handle city with district (Marseille 14ème)
             match = re.match(r'marseille\s*(\d+)', city_norm)
             if match:
                 district = int(match.group(1))
                 auction.code_postal = f"130{district:02d}"
                 changes.append(f"postal code inferred from Marseille district: {auction.code_postal}")
-            elif city_norm in self.POSTAL_CODES:
-                auction.code_postal = self.POSTAL_CODES[city_norm]
+            elif city_norm in self.NORMALIZED_POSTAL_CODES:
+                auction.code_postal = self.NORMALIZED_POSTAL_CODES[city_norm]
                 changes.append(f"postal code inferred from city: {auction.code_postal}")
 
         # Validate city matches postal code - CORRECT if mismatch
         if auction.code_postal and auction.ville:
-            expected_city = self.CITIES_BY_POSTAL.get(auction.code_postal)
-            if expected_city:
-                ville_norm = self._normalize_text(auction.ville)
-                expected_norm = self._normalize_text(expected_city)
+            expected_norm = self.NORMALIZED_CITIES_BY_POSTAL.get(auction.code_postal)
+            if expected_norm:
+                ville_norm = _normalize_text(auction.ville)
                 # If city doesn't match postal code, trust postal code
                 if ville_norm != expected_norm and self._similarity(ville_norm, expected_norm) < 0.6:
                     old_ville = auction.ville
-                    auction.ville = expected_city.title()
+                    auction.ville = self.TITLED_CITIES_BY_POSTAL[auction.code_postal]
                     changes.append(f"ville corrected from '{old_ville}' to '{auction.ville}' (based on postal code {auction.code_postal})")
 
         # Infer department from postal code
@@ -297,6 +437,54 @@ class CrossValidator:
 
         return changes
 
+    def _enrich_from_postal_bulk(self, auctions: List[Auction]) -> None:
+        """
+        Apply _enrich_from_postal to many auctions at once
+
+        Lookups run as vectorized pandas map/fillna over the whole batch;
+        only the similarity check of mismatching villes stays per auction.
+        """
+        if not auctions:
+            return
+
+        df = pd.DataFrame({
+            'cp': [a.code_postal or None for a in auctions],
+            'ville': [a.ville or None for a in auctions],
+            'department': [a.department or None for a in auctions],
+        }, dtype=object)
+
+        # If we have postal code but no city. Columns are kept as object dtype: an
+        # all-missing column would otherwise come back as float and break .str
+        df['ville'] = df['ville'].fillna(df['cp'].map(self.TITLED_CITIES_BY_POSTAL)).astype(object)
+        ville_norm = df['ville'].map(_normalize_text, na_action='ignore').astype(object)
+
+        # If we have city but no postal code (Marseille districts first)
+        district = ville_norm.str.extract(r'^marseille\s*(\d+)', expand=False)
+        df['cp'] = (
+            df['cp']
+            .fillna(district.map(lambda d: f"130{int(d):02d}", na_action='ignore'))
+            .fillna(ville_norm.map(self.NORMALIZED_POSTAL_CODES))
+            .astype(object)
+        )
+
+        # Validate city matches postal code - CORRECT if mismatch
+        expected_norm = df['cp'].map(self.NORMALIZED_CITIES_BY_POSTAL)
+        mismatch = expected_norm.notna() & ville_norm.notna() & (ville_norm != expected_norm)
+        for i in np.flatnonzero(mismatch.to_numpy()):
+            if self._similarity(ville_norm.iat[i], expected_norm.iat[i]) < 0.6:
+                df.iat[i, df.columns.get_loc('ville')] = self.TITLED_CITIES_BY_POSTAL[df['cp'].iat[i]]
+
+        # Infer department from postal code
+        df['department'] = df['department'].fillna(df['cp'].str[:2])
+
+        for auction, cp, ville, department in zip(auctions, df['cp'], df['ville'], df['department']):
+            if pd.notna(cp):
+                auction.code_postal = cp
+            if pd.notna(ville):
+                auction.ville = ville
+            if pd.notna(department):
+                auction.department = department
+
     def merge_auctions(self, auction1: Auction, auction2: Auction) -> ValidationResult:
         """
         Merge two auctions into one with best data from each
@@ -315,28 +503,29 @@ class CrossValidator:
         fields_from = {}
         notes = []
 
+        # Plain attribute dicts: Auction is a non-slotted dataclass
+        values1 = vars(auction1)
+        values2 = vars(auction2)
+        merged_values = vars(merged)
+
         # Preserve source info
         merged.source = f"{source1}+{source2}"
         merged.url = auction1.url or auction2.url
 
-        # Merge each field
-        fields_to_merge = [
-            'adresse', 'code_postal', 'ville', 'department',
-            'type_bien', 'surface', 'nb_pieces', 'nb_chambres', 'etage',
-            'description', 'occupation',
-            'mise_a_prix', 'date_vente', 'heure_vente', 'tribunal',
-            'avocat_nom', 'avocat_cabinet', 'avocat_telephone', 'avocat_email', 'avocat_adresse',
-            'pv_url', 'photos', 'documents'
-        ]
-
-        for field in fields_to_merge:
-            val1 = getattr(auction1, field, None)
-            val2 = getattr(auction2, field, None)
+        # Merge each field, counting agreements and filled fields for the confidence
+        agreement_count = 0
+        total_fields = 0
+        for field in self.FIELDS_TO_MERGE:
+            val1 = values1.get(field)
+            val2 = values2.get(field)
+            if val1 and val1 == val2:
+                agreement_count += 1
 
             best_val, best_source = self._pick_best_value(val1, val2, source1, source2, field)
 
             if best_val is not None:
-                setattr(merged, field, best_val)
+                total_fields += 1
+                merged_values[field] = best_val
                 if best_source:
                     fields_from[field] = best_source
                     if val1 != val2 and val1 and val2:
@@ -352,13 +541,11 @@ class CrossValidator:
         enrichment_notes = self._enrich_from_postal(merged)
         notes.extend(enrichment_notes)
 
-        # Calculate confidence
-        agreement_count = sum(
-            1 for f in fields_to_merge
-            if getattr(auction1, f, None) and getattr(auction2, f, None)
-            and getattr(auction1, f, None) == getattr(auction2, f, None)
+        # Calculate confidence (counting fields the enrichment filled in)
+        total_fields += sum(
+            1 for f in self.POSTAL_ENRICHED_FIELDS
+            if f not in fields_from and merged_values.get(f)
         )
-        total_fields = sum(1 for f in fields_to_merge if getattr(merged, f, None))
         confidence = (agreement_count / total_fields) if total_fields > 0 else 0.5
 
         self.stats['fields_improved'] += len([n for n in notes if 'picked' in n or 'inferred' in n])
@@ -371,39 +558,65 @@ class CrossValidator:
             validation_notes=notes
         )
 
+    def _greedy_assignment(self, scores: np.ndarray, eligible: np.ndarray) -> List[Tuple[int, int]]:
+        """
+        Best-first assignment used when scipy is unavailable
+
+        Each row takes its best still-unused eligible column, in row order.
+        """
+        pairs = []
+        available = eligible.copy()
+        for i in range(scores.shape[0]):
+            if not available[i].any():
+                continue
+            idx = int(np.argmax(np.where(available[i], scores[i], -1.0)))
+            pairs.append((i, idx))
+            available[:, idx] = False
+        return pairs
+
     def find_matches(
         self,
         auctions_source1: List[Auction],
         auctions_source2: List[Auction],
         threshold: float = 0.5
-    ) -> List[Tuple[Auction, Auction, float]]:
+    ) -> List[Tuple[int, int, float]]:
         """
         Find matching auctions between two sources
 
-        Returns: List of (auction1, auction2, match_score) tuples
-        """
-        matches = []
-        used_indices = set()
-
-        for a1 in auctions_source1:
-            best_match = None
-            best_score = 0.0
-            best_idx = -1
+        match_score (0-1, high = likely same property) is the weighted share of the
+        components present on both sides that agree (_numeric_match_scores and
+        _text_match_scores).
 
-            for idx, a2 in enumerate(auctions_source2):
-                if idx in used_indices:
-                    continue
+        Returns: List of (index in source1, index in source2, match_score) tuples
+        """
+        rows, cols = self._candidate_pairs(auctions_source1, auctions_source2)
+        num_score, num_weights = self._numeric_match_scores(auctions_source1, auctions_source2, rows, cols)
+        # Best reachable score if every text component were present and agreeing:
+        # pairs below threshold even then never need the string comparisons
+        best_case = (num_score + TEXT_MATCH_WEIGHT) / (num_weights + TEXT_MATCH_WEIGHT)
+        keep = best_case >= threshold - 1e-9
+
+        rows, cols = rows[keep], cols[keep]
+        text_score, text_weights = self._text_match_scores(auctions_source1, auctions_source2, rows, cols)
+        weights = num_weights[keep] + text_weights
+        scores = np.zeros((len(auctions_source1), len(auctions_source2)))
+        scores[rows, cols] = np.divide(
+            num_score[keep] + text_score, weights,
+            out=np.zeros(len(rows)), where=weights > 0
+        )
 
-                score = self._match_auctions(a1, a2)
-                if score > best_score and score >= threshold:
-                    best_match = a2
-                    best_score = score
-                    best_idx = idx
+        eligible = (scores >= threshold) & (scores > 0)
+        if not eligible.any():
+            pairs = []
+        elif HAS_SCIPY:
+            # Globally optimal 1-to-1 assignment; ineligible pairs weigh 0 and are dropped
+            rows, cols = linear_sum_assignment(np.where(eligible, scores, 0.0), maximize=True)
+            pairs = [(i, idx) for i, idx in zip(rows, cols) if eligible[i, idx]]
+        else:
+            pairs = self._greedy_assignment(scores, eligible)
 
-            if best_match:
-                matches.append((a1, best_match, best_score))
-                used_indices.add(best_idx)
-                self.stats['matches_found'] += 1
+        matches = [(int(i), int(idx), float(scores[i, idx])) for i, idx in pairs]
+        self.stats['matches_found'] += len(matches)
 
         logger.info(f"[CrossValidator] Found {len(matches)} matches between sources")
         return matches
@@ -431,29 +644,23 @@ class CrossValidator:
         matches = self.find_matches(auctions_source1, auctions_source2, threshold)
 
         results = []
-        matched_from_s1 = set()
-        matched_from_s2 = set()
 
         # Process matches - merge them
-        for a1, a2, score in matches:
+        for i, j, score in matches:
+            a1, a2 = auctions_source1[i], auctions_source2[j]
             result = self.merge_auctions(a1, a2)
             results.append(result.merged_auction)
-            matched_from_s1.add(id(a1))
-            matched_from_s2.add(id(a2))
 
             if result.validation_notes:
                 logger.debug(f"[CrossValidator] Merged {a1.ville}/{a2.ville}: {result.validation_notes}")
 
         # Add unmatched auctions (but enrich them)
-        for a in auctions_source1:
-            if id(a) not in matched_from_s1:
-                self._enrich_from_postal(a)
-                results.append(a)
-
-        for a in auctions_source2:
-            if id(a) not in matched_from_s2:
-                self._enrich_from_postal(a)
-                results.append(a)
+        matched_from_s1 = {i for i, _, _ in matches}
+        matched_from_s2 = {j for _, j, _ in matches}
+        unmatched = [a for i, a in enumerate(auctions_source1) if i not in matched_from_s1]
+        unmatched += [a for j, a in enumerate(auctions_source2) if j not in matched_from_s2]
+        self._enrich_from_postal_bulk(unmatched)
+        results.extend(unmatched)
 
         logger.info(f"[CrossValidator] Results: {len(matches)} merged, "
                     f"{len(auctions_source1) - len(matches)} from source1 only, "
@@ -1,15 +1,206 @@
 """
 Scraper for encheres-publiques.com
 """
+import copy
+import hashlib
+import json
 import re
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, date
 from typing import List, Optional, Dict, Any
-from bs4 import BeautifulSoup
+from urllib.parse import unquote
+import soupsieve
+from bs4 import BeautifulSoup, SoupStrainer
 from loguru import logger
 
 from .base_scraper import BaseScraper
+from ._text import HAS_SELECTOLAX, HTMLParser, PRICE_CHARS
+from config.settings import SCRAPING
 from src.storage.models import Auction, Lawyer, PropertyType, AuctionStatus, PVStatus
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# JSON decoding (page data, data-photos attributes): orjson when installed
+_json_loads = orjson.loads if HAS_ORJSON else json.loads
+
+# Indicators of NOTARIAL/VOLUNTARY sales (to EXCLUDE)
+_NOTARIAL_INDICATORS = (
+    "vente volontaire",
+    "notaire",
+    "notaires",
+    "étude notariale",
+    "office notarial",
+    "vente aux enchères notariale",
+    "organisée par me ",  # "organisée par Me Dupont" (notaire)
+    "organisé par me ",
+)
+
+# Indicators of JUDICIAL sales (to INCLUDE)
+_JUDICIAL_INDICATORS = (
+    "tribunal judiciaire",
+    "tribunal de grande instance",
+    "vente judiciaire",
+    "vente sur saisie",
+    "adjudication judiciaire",
+    "avocat poursuivant",
+    "saisie immobilière",
+    "liquidation judiciaire",
+)
+
+# Patterns compiled once at import, used on every auction page
+_SOURCE_ID_RE = re.compile(r"_(\d+)$|/(\d+)(?:\?|$)")
+# Property page links: appartements, maisons, immeubles, terrains, parkings, locaux-commerciaux, ...
+_PROPERTY_HREF_RE = re.compile(
+    r"/encheres/immobilier/(?:appartements|maisons|immeubles|terrains|parkings|locaux-commerciaux|biens-exception)/"
+)
+_WS_RE = re.compile(r"\s+")
+_POSTAL_CODE_RE = re.compile(r"\b(13\d{3}|83\d{3})\b")
+_URL_CITY_RE = re.compile(r'/([a-z\-]+)-(\d{2})/')
+_PARIS_DEPT_RE = re.compile(r"-(?:75|92|93|94)/")
+# City patterns fused into one alternation; _CITY_GROUPS gives their priority
+_CITY_RE = re.compile(
+    # "à Marseille 14ème" or "à Marseille"
+    r"à\s+(?P<marseille>Marseille(?:\s+\d+[eè]me)?)"
+    r"|à\s+(?P<toulon>Toulon(?:\s+\d+[eè]me)?)"
+    r"|à\s+(?P<aix>Aix-en-Provence)"
+    # Generic city after "à"
+    r"|à\s+(?P<generic>[A-ZÀ-Ü][a-zà-ü\-]+(?:\s+\d+[eè]me)?)"
+    # After postal code
+    r"|(?:13\d{3}|83\d{3})\s+(?P<after_postal>[A-ZÀ-Ü][a-zà-ü\-]+(?:\s+[A-ZÀ-Ü][a-zà-ü\-]+)*)"
+)
+_CITY_GROUPS = ("marseille", "toulon", "aix", "generic", "after_postal")
+_MARSEILLE_ARR_RE = re.compile(r"Marseille\s*(\d+)[eè]?(?:me)?", re.IGNORECASE)
+
+# Property type keywords (plain substrings, e.g. "appartement" also hits "appartements"),
+# one alternation per type, in priority order
+_PROPERTY_TYPE_PATTERNS = (
+    (PropertyType.APPARTEMENT, re.compile(r"appartement|studio|duplex|loft")),
+    (PropertyType.MAISON, re.compile(r"maison|villa|pavillon|propriété")),
+    (PropertyType.LOCAL_COMMERCIAL, re.compile(r"local|commerce|bureau|boutique")),
+    (PropertyType.TERRAIN, re.compile(r"terrain|parcelle|foncier")),
+    (PropertyType.PARKING, re.compile(r"parking|garage|box|stationnement")),
+)
+
+_SURFACE_PATTERNS = (
+    re.compile(r"surface\s*(?:de\s*)?(\d+(?:[.,]\d+)?)\s*m[²2]"),
+    re.compile(r"(\d+(?:[.,]\d+)?)\s*m[²2]"),
+)
+_PIECES_RE = re.compile(r"(\d+)\s*(?:pièces?|p\.)")
+_CHAMBRES_RE = re.compile(r"(\d+)\s*(?:chambres?|ch\.)")
+_ETAGE_RE = re.compile(r"(\d+)(?:e|ème|er)?\s*étage")
+
+_SALE_DATE_PATTERNS = (
+    re.compile(r"(?:vente|adjudication)\s+(?:le\s+)?(\d{1,2}/\d{1,2}/\d{4})", re.IGNORECASE),
+    re.compile(r"(\d{1,2}/\d{1,2}/\d{4})\s+à\s+\d{1,2}h", re.IGNORECASE),
+    re.compile(r"(\d{1,2}\s+\w+\s+\d{4})", re.IGNORECASE),
+)
+_TIME_RE = re.compile(r"à\s+(\d{1,2})[hH:](\d{0,2})")
+_VISIT_DATE_RE = re.compile(r"(\d{1,2}/\d{1,2}/\d{4}|\d{1,2}\s+\w+\s+\d{4})")
+_DATE_SLASH_RE = re.compile(r"(\d{1,2})/(\d{1,2})/(\d{4})")
+_DATE_TEXT_RE = re.compile(r"(\d{1,2})\s+(\w+)\s+(\d{4})")
+
+_MISE_A_PRIX_RE = re.compile(r"mise\s+[àa]\s+prix\s*:?\s*([\d\s,\.]+)\s*€?", re.IGNORECASE)
+_SCRIPT_PRICE_PATTERNS = (
+    re.compile(r'"prix_plancher"\s*:\s*(\d+)', re.IGNORECASE),
+    re.compile(r'"mise_a_prix"\s*:\s*(\d+)', re.IGNORECASE),
+    re.compile(r'prix_plancher[":]+\s*(\d+)', re.IGNORECASE),
+    re.compile(r'mise[_]?a[_]?prix[":]+\s*(\d+)', re.IGNORECASE),
+)
+
+
+_JSON_DESCRIPTION_RE = re.compile(r'"description"\s*:\s*"([^"]+)"')
+_NEXT_IMAGE_URL_RE = re.compile(r'url=([^&]+)')
+_LOT_PHOTO_RE = re.compile(r'/static/lot/photo/[^"\']+\.jpg')
+_STREETVIEW_RE = re.compile(r'streetview\?adresse_id=\d+[^"\']*')
+_LOT_DOCUMENT_RE = re.compile(r'"file"\s*:\s*"([^"]+\.pdf)"\s*,\s*"nom"\s*:\s*"([^"]+)"')
+
+# Document type keywords; lookahead so overlapping keywords are all seen.
+# _DOC_TYPE_NAMES lists the groups in priority order.
+_DOC_TYPE_RE = re.compile(
+    r"(?=(?P<cahier>cahier)|(?P<pv>pv|procès)|(?P<diagnostic>diagnostic)|(?P<avis>avis)"
+    r"|(?P<jugement>jugement)|(?P<expertise>expertise)|(?P<urbanisme>urbanisme)|(?P<spanc>spanc))"
+)
+_DOC_TYPE_NAMES = (
+    ("cahier", "Cahier des conditions de vente"),
+    ("pv", "Procès-verbal de description"),
+    ("diagnostic", "Diagnostics immobiliers"),
+    ("avis", "Avis de vente"),
+    ("jugement", "Jugement"),
+    ("expertise", "Rapport d'expertise"),
+    ("urbanisme", "Certificat d'urbanisme"),
+    ("spanc", "Rapport SPANC"),
+)
+
+_OCCUPATION_PATTERNS = (
+    (re.compile(r"occupation[^\n]*?:\s*([^\n,]+)", re.IGNORECASE), None),
+    (re.compile(r"(libre\s+de\s+toute\s+occupation)", re.IGNORECASE), "Libre"),
+    (re.compile(r"(occupé|occupée)", re.IGNORECASE), "Occupé"),
+    (re.compile(r"bien\s+(libre|vacant)", re.IGNORECASE), "Libre"),
+    (re.compile(r"(locataire|bail|location)", re.IGNORECASE), "Occupé"),
+)
+_JSON_OCCUPATION_RE = re.compile(r'"critere_occupation[^"]*"\s*:\s*"([^"]+)"')
+
+_CADASTRE_PATTERNS = (
+    re.compile(r"[Ss]ection\s+([A-Z]{1,2})\s*n[°º]?\s*(\d+)"),
+    re.compile(r"[Cc]adastr[ée]\s*:?\s*([A-Z]{1,2}\s*\d+)"),
+    re.compile(r"[Pp]arcelle\s+([A-Z]{1,2}\s*\d+)"),
+    re.compile(r"[Rr]éférence\s+cadastrale\s*:?\s*([A-Z0-9\s]+)"),
+)
+
+# Detail pages: only build the tree for <title>, <body> and scripts, skipping the other
+# <head> meta/link/style nodes (large on these Next.js pages). The title is kept because
+# the page text scans (postal code, city, property type, judicial keywords) see it.
+# Straining on individual content tags would drop the whitespace between blocks that
+# the text patterns rely on.
+_DETAIL_STRAINER = SoupStrainer(["title", "body", "script"])
+
+# CSS selectors compiled once (select_one() would re-parse the selector string per call)
+_SEL_CARDS = soupsieve.compile(".card-vente, .vente-card, article.vente, .annonce-item")
+_SEL_CARD_TITLE = soupsieve.compile(".titre, .title, h3, h4")
+_SEL_CARD_LOCATION = soupsieve.compile(".lieu, .location, .adresse")
+_SEL_CARD_PRICE = soupsieve.compile(".prix, .price, .mise-a-prix")
+_SEL_CARD_DATE = soupsieve.compile(".date, .date-vente")
+_SEL_CARD_STATUS = soupsieve.compile(".statut, .status, .badge")
+_SEL_TITLE = soupsieve.compile("h1, .titre-vente, .page-title")
+_SEL_ADDRESS = soupsieve.compile(".adresse, .localisation, [itemprop='address']")
+_SEL_VISITS = soupsieve.compile(".visites, .dates-visite")
+_SEL_PRICE = soupsieve.compile(".mise-a-prix, .prix, .price")
+_SEL_DESCRIPTIONS = tuple(soupsieve.compile(selector) for selector in (
+    ".description-bien", ".detail-bien", ".composition",
+    "[data-description]", ".content-description", ".bloc-description"
+))
+_SEL_MAIN_CONTENT = soupsieve.compile("main, .main-content, article, .fiche-lot")
+_SEL_LAWYER_SECTIONS = tuple(soupsieve.compile(selector) for selector in (
+    ".avocat", ".vendeur", ".professionnel", ".contact-avocat",
+    ".poursuivant", "[data-avocat]", ".bloc-avocat"
+))
+_SEL_LAWYER_NAME = soupsieve.compile(".nom, .name, h3, h4, strong, .titre")
+_SEL_LAWYER_CABINET = soupsieve.compile(".cabinet, .societe")
+_SEL_LAWYER_PHONE = soupsieve.compile("a[href^='tel:'], .tel, .telephone, .phone")
+_SEL_MAILTO = soupsieve.compile("a[href^='mailto:']")
+_SEL_LAWYER_WEBSITE = soupsieve.compile("a.site, a.website, a[href*='avocat']")
+_SEL_LAWYER_ADDRESS = soupsieve.compile(".adresse, .address")
+_SEL_GALLERIES = tuple(soupsieve.compile(selector) for selector in (
+    ".gallery img", ".photos img", ".carousel img",
+    ".slider img", "[data-gallery] img", ".photo-lot img",
+    ".swiper-slide img", ".fotorama img"
+))
+_SEL_PHOTO_IMAGES = soupsieve.compile("img.photo, .photos img, [class*='photo'] img")
+_SEL_PHOTO_DATA = soupsieve.compile("[data-photos], [data-images]")
+_SEL_CONTACT_SECTION = soupsieve.compile(".avocat, .vendeur, .professionnel, .contact")
+_SEL_CONTACT_NAME = soupsieve.compile(".nom, .name, h3, h4, strong")
+_SEL_CONTACT_PHONE = soupsieve.compile("a[href^='tel:'], .tel, .telephone")
+_SEL_CONTACT_WEBSITE = soupsieve.compile("a.site, a.website")
+
+_JSON_PHONE_RE = re.compile(r'"(?:phone|telephone|tel)"\s*:\s*"([^"]+)"')
+_JSON_NAME_RE = re.compile(r'"(?:nom|name|cabinet)"\s*:\s*"([^"]+)"')
+
 
 class EncherePubliquesScraper(BaseScraper):
     """Scraper for encheres-publiques.com"""
@@ -27,49 +218,53 @@ class EncherePubliquesScraper(BaseScraper):
         "champigny-sur-marne-94": "Champigny-sur-Marne",
     }
 
+    # Parsed detail pages kept per URL and per body digest (auctions reappear across listings)
+    DETAIL_CACHE_SIZE = 4096
+    # Detail pages fetched concurrently (requests still start self.delay apart)
+    DETAIL_WORKERS = 8
+
     def __init__(self):
         super().__init__(
             name="EnchèresPubliques",
             base_url="https://www.encheres-publiques.com"
         )
+        self._detail_by_url: "OrderedDict[str, Optional[Auction]]" = OrderedDict()
+        self._detail_by_digest: "OrderedDict[bytes, Optional[Auction]]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+
+        # Listing URL prefixes built once; only the page number is appended per call
+        search_url = f"{self.base_url}/encheres/immobilier?"
+        self._list_url_prefix = f"{search_url}page="
+        self._city_url_prefixes = {slug: f"{search_url}localisation={slug}&page=" for slug in self.CITIES}
+        self._department_url_prefix = f"{search_url}departement="
 
     def get_auction_list_url(self, page: int = 1) -> str:
         """Build URL for auction listing"""
-        return f"{self.base_url}/encheres/immobilier?page={page}"
+        return f"{self._list_url_prefix}{page}"
 
     def get_city_url(self, city_slug: str, page: int = 1) -> str:
         """Get URL for specific city"""
         # Try regional search for departments 13 and 83
-        return f"{self.base_url}/encheres/immobilier?localisation={city_slug}&page={page}"
+        prefix = self._city_url_prefixes.get(city_slug)
+        if prefix is None:
+            return f"{self.base_url}/encheres/immobilier?localisation={city_slug}&page={page}"
+        return f"{prefix}{page}"
 
     def get_department_url(self, department: str, page: int = 1) -> str:
         """Get URL for department search"""
-        return f"{self.base_url}/encheres/immobilier?departement={department}&page={page}"
+        return f"{self._department_url_prefix}{department}&page={page}"
 
     def parse_auction_list(self, soup: BeautifulSoup) -> List[Dict[str, Any]]:
         """Parse auction listing page"""
-        auctions = []
-        seen_urls = set()
-
         # Find property links with pattern: /encheres/immobilier/[type]/[city]/[description]_[id]
-        # Property types: appartements, maisons, immeubles, terrains, parkings, locaux-commerciaux
-        property_types = ["appartements", "maisons", "immeubles", "terrains", "parkings", "locaux-commerciaux", "biens-exception"]
-
-        for link in soup.find_all("a", href=True):
-            href = link.get("href", "")
-
-            # Check if it's a property page (contains type and ends with _[id])
-            if "/encheres/immobilier/" in href and "_" in href:
-                # Verify it's a property type, not an event
-                if any(f"/encheres/immobilier/{ptype}/" in href for ptype in property_types):
-                    full_url = href if href.startswith("http") else f"{self.base_url}{href}"
-                    if full_url not in seen_urls:
-                        seen_urls.add(full_url)
-                        auctions.append({"url": full_url})
+        # (property type, not an event; the href regex is applied inside find_all)
+        auctions = self._property_links(
+            link["href"] for link in soup.find_all("a", href=_PROPERTY_HREF_RE)
+        )
 
         # Fallback: try old selectors
         if not auctions:
-            cards = soup.select(".card-vente, .vente-card, article.vente, .annonce-item")
+            cards = _SEL_CARDS.select(soup)
             for card in cards:
                 try:
                     auction_data = self._parse_card(card)
@@ -80,6 +275,32 @@ class EncherePubliquesScraper(BaseScraper):
 
         return auctions
 
+    def _property_links(self, hrefs) -> List[Dict[str, Any]]:
+        """Auction entries for property-type hrefs ending with _[id], deduplicated in order"""
+        auctions = []
+        seen_urls = set()
+        for href in hrefs:
+            if "_" in href:
+                full_url = href if href.startswith("http") else f"{self.base_url}{href}"
+                if full_url not in seen_urls:
+                    seen_urls.add(full_url)
+                    auctions.append({"url": full_url})
+        return auctions
+
+    def _parse_auction_list_content(self, content: bytes) -> List[Dict[str, Any]]:
+        """Parse a listing page body, scanning links with selectolax when available"""
+        if HAS_SELECTOLAX and SCRAPING.get("use_selectolax", True):
+            try:
+                hrefs = (node.attributes.get("href") or "" for node in HTMLParser(content.decode("utf-8")).css("a[href]"))
+                auctions = self._property_links(href for href in hrefs if _PROPERTY_HREF_RE.search(href))
+                if auctions:
+                    return auctions
+            except Exception as e:
+                logger.debug(f"[EnchèresPubliques] selectolax failed, using BeautifulSoup: {e}")
+
+        # No property links (card fallback) or no selectolax: full BeautifulSoup parse
+        return self.parse_auction_list(BeautifulSoup(content, "lxml"))
+
     def _parse_card(self, card) -> Optional[Dict[str, Any]]:
         """Parse individual auction card"""
         data = {}
@@ -93,31 +314,31 @@ class EncherePubliquesScraper(BaseScraper):
             data["url"] = href
 
         # Extract title/description
-        title = card.select_one(".titre, .title, h3, h4")
+        title = _SEL_CARD_TITLE.select_one(card)
         if title:
             data["title"] = title.get_text(strip=True)
 
         # Location
-        location = card.select_one(".lieu, .location, .adresse")
+        location = _SEL_CARD_LOCATION.select_one(card)
         if location:
             data["location"] = location.get_text(strip=True)
             # Extract postal code
-            cp_match = re.search(r"\b(13\d{3}|83\d{3})\b", data["location"])
+            cp_match = _POSTAL_CODE_RE.search(data["location"])
             if cp_match:
                 data["code_postal"] = cp_match.group(1)
 
         # Price
-        price_elem = card.select_one(".prix, .price, .mise-a-prix")
+        price_elem = _SEL_CARD_PRICE.select_one(card)
         if price_elem:
             data["price_text"] = price_elem.get_text(strip=True)
 
         # Date
-        date_elem = card.select_one(".date, .date-vente")
+        date_elem = _SEL_CARD_DATE.select_one(card)
         if date_elem:
             data["date_text"] = date_elem.get_text(strip=True)
 
         # Status (upcoming, ongoing, etc.)
-        status_elem = card.select_one(".statut, .status, .badge")
+        status_elem = _SEL_CARD_STATUS.select_one(card)
         if status_elem:
             data["status"] = status_elem.get_text(strip=True).lower()
 
@@ -129,72 +350,133 @@ class EncherePubliquesScraper(BaseScraper):
         return data if data.get("url") else None
 
     def parse_auction_detail(self, url: str) -> Optional[Auction]:
-        """Parse individual auction page with full details"""
-        soup = self.fetch_page(url)
-        if not soup:
+        """Parse individual auction page with full details (memoized by URL and page digest)"""
+        with self._cache_lock:
+            if url in self._detail_by_url:
+                self._detail_by_url.move_to_end(url)
+                return copy.deepcopy(self._detail_by_url[url])
+
+        content = self.fetch_content(url)
+        if content is None:
             return None
 
+        # Same page body already parsed under another URL: reuse it, only the URL fields differ.
+        # The city/department slug of the URL also feeds the location fields, so it is part of the key
+        url_city_match = _URL_CITY_RE.search(url)
+        body_key = (
+            hashlib.blake2b(content, digest_size=16).digest(),
+            url_city_match.groups() if url_city_match else None
+        )
+        with self._cache_lock:
+            cached = body_key in self._detail_by_digest
+            if cached:
+                self._detail_by_digest.move_to_end(body_key)
+                auction = copy.deepcopy(self._detail_by_digest[body_key])
+        if cached:
+            if auction:
+                self._set_url_fields(auction, url)
+        else:
+            auction = self._parse_detail_content(url, content)
+
+        with self._cache_lock:
+            if not cached:
+                self._cache_put(self._detail_by_digest, body_key, auction)
+            self._cache_put(self._detail_by_url, url, auction)
+        return copy.deepcopy(auction)
+
+    def parse_auction_details(self, urls: List[str]) -> List[Optional[Auction]]:
+        """Parse several auction pages concurrently, results in the order of urls"""
+        if len(urls) <= 1:
+            return [self.parse_auction_detail(url) for url in urls]
+
+        with ThreadPoolExecutor(max_workers=min(self.DETAIL_WORKERS, len(urls))) as executor:
+            return list(executor.map(self._parse_auction_detail_safe, urls))
+
+    def _parse_auction_detail_safe(self, url: str) -> Optional[Auction]:
+        """parse_auction_detail for worker threads: log a failure instead of losing the batch"""
+        try:
+            return self.parse_auction_detail(url)
+        except Exception as e:
+            logger.warning(f"[EnchèresPubliques] Error parsing {url}: {e}")
+            return None
+
+    def _cache_put(self, cache: OrderedDict, key, auction: Optional[Auction]):
+        """Store a parsed result, evicting the least recently used entry when full"""
+        cache[key] = auction
+        if len(cache) > self.DETAIL_CACHE_SIZE:
+            cache.popitem(last=False)
+
+    def _set_url_fields(self, auction: Auction, url: str):
+        """Set the fields derived from the auction URL"""
+        auction.url = url
+        match = _SOURCE_ID_RE.search(url)
+        if match:
+            auction.source_id = match.group(1) or match.group(2)
+
+    def _parse_detail_content(self, url: str, content: bytes) -> Optional[Auction]:
+        """Parse a fetched auction page body"""
+        soup = BeautifulSoup(content, "lxml", parse_only=_DETAIL_STRAINER)
+
+        # Whole-page text, extracted once and shared by the parsing helpers
+        full_text = soup.get_text()
+        full_text_lower = full_text.lower()
+        # Lowercased with whitespace runs (newlines, nbsp) collapsed to one space, for keyword
+        # and number scans; line-based patterns (occupation) keep full_text_lower
+        text_normalized = _WS_RE.sub(" ", full_text_lower)
+
         # Check if this is a judicial auction (not notarial)
-        if not self._is_judicial_auction(soup):
+        if not self._is_judicial_auction(text_normalized):
             logger.info(f"[EnchèresPubliques] Skipping notarial auction: {url}")
             return None
 
         auction = Auction()
         auction.source = "encheres_publiques"
-        auction.url = url
 
-        # Extract source ID from URL
-        match = re.search(r"_(\d+)$|/(\d+)(?:\?|$)", url)
-        if match:
-            auction.source_id = match.group(1) or match.group(2)
+        # URL and source ID from URL
+        self._set_url_fields(auction, url)
 
         # Parse all content
-        self._parse_header(soup, auction)
-        self._parse_details(soup, auction)
-        self._parse_detailed_description(soup, auction)
-        self._parse_dates_times(soup, auction)
-        self._parse_pricing(soup, auction)
-        self._parse_photos(soup, auction)
-        self._parse_all_documents(soup, auction)
-        self._parse_occupation(soup, auction)
-        self._parse_cadastre(soup, auction)
-        self._parse_lawyer_details(soup, auction)
+        # Inline <script> bodies (Next.js data), collected in one pass for all helpers
+        scripts = self._script_texts(soup)
+        # Lot record from the __NEXT_DATA__ payload, decoded once; the script regexes are the fallback
+        lot = self._next_data_lot(soup)
+
+        self._parse_header(soup, full_text, auction)
+        self._parse_details(soup, text_normalized, auction)
+        self._parse_detailed_description(soup, scripts, lot, auction)
+        self._parse_dates_times(soup, full_text, auction)
+        self._parse_pricing(soup, full_text, text_normalized, scripts, lot, auction)
+        self._parse_photos(soup, scripts, lot, auction)
+        self._parse_all_documents(soup, scripts, lot, auction)
+        self._parse_occupation(soup, full_text_lower, scripts, lot, auction)
+        self._parse_cadastre(soup, full_text, auction)
+        self._parse_lawyer_details(soup, scripts, auction)
 
         return auction
 
-    def _is_judicial_auction(self, soup: BeautifulSoup) -> bool:
-        """Check if this is a judicial auction (not notarial/voluntary sale)"""
-        text = soup.get_text().lower()
-
-        # Indicators of NOTARIAL/VOLUNTARY sales (to EXCLUDE)
-        notarial_indicators = [
-            "vente volontaire",
-            "notaire",
-            "notaires",
-            "étude notariale",
-            "office notarial",
-            "vente aux enchères notariale",
-            "organisée par me ",  # "organisée par Me Dupont" (notaire)
-            "organisé par me ",
-        ]
-
-        # Indicators of JUDICIAL sales (to INCLUDE)
-        judicial_indicators = [
-            "tribunal judiciaire",
-            "tribunal de grande instance",
-            "vente judiciaire",
-            "vente sur saisie",
-            "adjudication judiciaire",
-            "avocat poursuivant",
-            "saisie immobilière",
-            "liquidation judiciaire",
-        ]
-
-        # Check for notarial indicators
-        has_notarial = any(indicator in text for indicator in notarial_indicators)
-
-        # Check for judicial indicators
-        has_judicial = any(indicator in text for indicator in judicial_indicators)
+    def _script_texts(self, soup: BeautifulSoup) -> List[str]:
+        """Text of every non-empty <script> tag, in document order"""
+        # .string is built once per tag (it was read twice: filter, then value)
+        return [text for text in (script.string for script in soup.find_all("script")) if text]
+
+    def _next_data_lot(self, soup: BeautifulSoup) -> Optional[Dict[str, Any]]:
+        """Lot record (props.pageProps.lot) of the Next.js __NEXT_DATA__ script, if any"""
+        script = soup.find("script", id="__NEXT_DATA__")
+        if not script or not script.string:
+            return None
+
+        try:
+            lot = _json_loads(script.string)["props"]["pageProps"]["lot"]
+        except (ValueError, KeyError, TypeError):
+            return None
+
+        return lot if isinstance(lot, dict) else None
+
+    def _is_judicial_auction(self, text: str) -> bool:
+        """Check if this is a judicial auction (not notarial/voluntary sale), from normalized page text"""
+        # Substring tests stop at the first hit of each family
+        has_notarial = any(indicator in text for indicator in _NOTARIAL_INDICATORS)
+        has_judicial = any(indicator in text for indicator in _JUDICIAL_INDICATORS)
 
         # If clearly notarial and NOT judicial, exclude
         if has_notarial and not has_judicial:
@@ -211,15 +493,15 @@ class EncherePubliquesScraper(BaseScraper):
 
         return True
 
-    def _parse_header(self, soup: BeautifulSoup, auction: Auction):
+    def _parse_header(self, soup: BeautifulSoup, full_text: str, auction: Auction):
         """Parse header section with title and location"""
         # Title
-        title = soup.select_one("h1, .titre-vente, .page-title")
+        title = _SEL_TITLE.select_one(soup)
         if title:
             auction.description = title.get_text(strip=True)
 
         # Address
-        address_elem = soup.select_one(".adresse, .localisation, [itemprop='address']")
+        address_elem = _SEL_ADDRESS.select_one(soup)
         if address_elem:
             auction.adresse = address_elem.get_text(strip=True)
 
@@ -227,18 +509,15 @@ class EncherePubliquesScraper(BaseScraper):
         if not auction.adresse and auction.description:
             auction.adresse = auction.description
 
-        # Get full page text for extraction
-        full_text = soup.get_text()
-
         # Postal code - look in full page text
-        cp_match = re.search(r"\b(13\d{3}|83\d{3})\b", full_text)
+        cp_match = _POSTAL_CODE_RE.search(full_text)
         if cp_match:
             auction.code_postal = cp_match.group(1)
             auction.department = auction.code_postal[:2]
 
         # Try to extract from URL (e.g., marseille-13, toulon-83)
         url = auction.url or ""
-        url_city_match = re.search(r'/([a-z\-]+)-(\d{2})/', url)
+        url_city_match = _URL_CITY_RE.search(url)
         if url_city_match:
             city_from_url = url_city_match.group(1).replace("-", " ").title()
             dept_from_url = url_city_match.group(2)
@@ -251,26 +530,19 @@ class EncherePubliquesScraper(BaseScraper):
             if not auction.code_postal:
                 auction.code_postal = f"{dept_from_url}000"
 
-        # City extraction - improved patterns
-        city_patterns = [
-            # "à Marseille 14ème" or "à Marseille"
-            r"à\s+(Marseille(?:\s+\d+[eè]me)?)",
-            r"à\s+(Toulon(?:\s+\d+[eè]me)?)",
-            r"à\s+(Aix-en-Provence)",
-            # Generic city after "à"
-            r"à\s+([A-ZÀ-Ü][a-zà-ü\-]+(?:\s+\d+[eè]me)?)",
-            # After postal code
-            r"(?:13\d{3}|83\d{3})\s+([A-ZÀ-Ü][a-zà-ü\-]+(?:\s+[A-ZÀ-Ü][a-zà-ü\-]+)*)",
-        ]
-
-        for pattern in city_patterns:
-            match = re.search(pattern, full_text)
-            if match:
-                city = match.group(1).strip()
-                # Clean up common issues
-                if city and len(city) > 2:
-                    auction.ville = city
-                    break
+        # City extraction - one scan keeping the first hit of each alternative
+        first_hits = {}
+        for match in _CITY_RE.finditer(full_text):
+            first_hits.setdefault(match.lastgroup, match.group(match.lastgroup))
+            if match.lastgroup == _CITY_GROUPS[0]:
+                break
+
+        for group in _CITY_GROUPS:
+            city = first_hits.get(group, "").strip()
+            # Clean up common issues
+            if city and len(city) > 2:
+                auction.ville = city
+                break
 
         # Fallback: extract from URL
         if not auction.ville and url_city_match:
@@ -279,7 +551,7 @@ class EncherePubliquesScraper(BaseScraper):
         # Handle Marseille arrondissements
         if auction.ville and "marseille" in auction.ville.lower():
             # Extract arrondissement from description
-            arr_match = re.search(r"Marseille\s*(\d+)[eè]?(?:me)?", full_text, re.IGNORECASE)
+            arr_match = _MARSEILLE_ARR_RE.search(full_text)
             if arr_match:
                 arr = arr_match.group(1)
                 auction.ville = f"Marseille {arr}ème"
@@ -287,62 +559,42 @@ class EncherePubliquesScraper(BaseScraper):
                 if not auction.code_postal or auction.code_postal == "13000":
                     auction.code_postal = f"130{arr.zfill(2)}"
 
-    def _parse_details(self, soup: BeautifulSoup, auction: Auction):
-        """Parse property details"""
-        text = soup.get_text().lower()
-
-        # Property type
-        type_map = {
-            PropertyType.APPARTEMENT: ["appartement", "studio", "duplex", "loft"],
-            PropertyType.MAISON: ["maison", "villa", "pavillon", "propriété"],
-            PropertyType.LOCAL_COMMERCIAL: ["local", "commerce", "bureau", "boutique"],
-            PropertyType.TERRAIN: ["terrain", "parcelle", "foncier"],
-            PropertyType.PARKING: ["parking", "garage", "box", "stationnement"],
-        }
+    def _parse_details(self, soup: BeautifulSoup, text: str, auction: Auction):
+        """Parse property details (text: normalized page text)"""
 
-        for prop_type, keywords in type_map.items():
-            if any(kw in text for kw in keywords):
+        # Property type (first type in priority order with any keyword in the text)
+        for prop_type, keywords_re in _PROPERTY_TYPE_PATTERNS:
+            if keywords_re.search(text):
                 auction.type_bien = prop_type
                 break
 
         # Surface area
-        surface_patterns = [
-            r"surface\s*(?:de\s*)?(\d+(?:[.,]\d+)?)\s*m[²2]",
-            r"(\d+(?:[.,]\d+)?)\s*m[²2]",
-        ]
-        for pattern in surface_patterns:
-            match = re.search(pattern, text)
+        for pattern in _SURFACE_PATTERNS:
+            match = pattern.search(text)
             if match:
                 auction.surface = float(match.group(1).replace(",", "."))
                 break
 
         # Rooms
-        pieces_match = re.search(r"(\d+)\s*(?:pièces?|p\.)", text)
+        pieces_match = _PIECES_RE.search(text)
         if pieces_match:
             auction.nb_pieces = int(pieces_match.group(1))
 
-        chambres_match = re.search(r"(\d+)\s*(?:chambres?|ch\.)", text)
+        chambres_match = _CHAMBRES_RE.search(text)
         if chambres_match:
             auction.nb_chambres = int(chambres_match.group(1))
 
         # Floor
-        etage_match = re.search(r"(\d+)(?:e|ème|er)?\s*étage", text)
+        etage_match = _ETAGE_RE.search(text)
         if etage_match:
             auction.etage = int(etage_match.group(1))
 
-    def _parse_dates_times(self, soup: BeautifulSoup, auction: Auction):
+    def _parse_dates_times(self, soup: BeautifulSoup, text: str, auction: Auction):
         """Parse dates and times"""
-        text = soup.get_text()
 
         # Sale date
-        date_patterns = [
-            r"(?:vente|adjudication)\s+(?:le\s+)?(\d{1,2}/\d{1,2}/\d{4})",
-            r"(\d{1,2}/\d{1,2}/\d{4})\s+à\s+\d{1,2}h",
-            r"(\d{1,2}\s+\w+\s+\d{4})"
-        ]
-
-        for pattern in date_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in _SALE_DATE_PATTERNS:
+            match = pattern.search(text)
             if match:
                 date_str = match.group(1)
                 parsed = self._parse_date(date_str)
@@ -351,17 +603,17 @@ class EncherePubliquesScraper(BaseScraper):
                     break
 
         # Time
-        time_match = re.search(r"à\s+(\d{1,2})[hH:](\d{0,2})", text)
+        time_match = _TIME_RE.search(text)
         if time_match:
             h = time_match.group(1)
             m = time_match.group(2) or "00"
             auction.heure_vente = f"{h}h{m}"
 
         # Visit dates
-        visit_section = soup.select_one(".visites, .dates-visite")
+        visit_section = _SEL_VISITS.select_one(soup)
         if visit_section:
             visit_text = visit_section.get_text()
-            date_matches = re.findall(r"(\d{1,2}/\d{1,2}/\d{4}|\d{1,2}\s+\w+\s+\d{4})", visit_text)
+            date_matches = _VISIT_DATE_RE.findall(visit_text)
             for date_str in date_matches:
                 parsed = self._parse_date(date_str)
                 if parsed:
@@ -376,7 +628,7 @@ class EncherePubliquesScraper(BaseScraper):
         }
 
         # DD/MM/YYYY
-        match = re.match(r"(\d{1,2})/(\d{1,2})/(\d{4})", date_str)
+        match = _DATE_SLASH_RE.match(date_str)
         if match:
             try:
                 return date(int(match.group(3)), int(match.group(2)), int(match.group(1)))
@@ -384,7 +636,7 @@ class EncherePubliquesScraper(BaseScraper):
                 pass
 
         # "15 janvier 2024"
-        match = re.match(r"(\d{1,2})\s+(\w+)\s+(\d{4})", date_str)
+        match = _DATE_TEXT_RE.match(date_str)
         if match:
             day = int(match.group(1))
             month = months.get(match.group(2).lower())
@@ -397,34 +649,43 @@ class EncherePubliquesScraper(BaseScraper):
 
         return None
 
-    def _parse_pricing(self, soup: BeautifulSoup, auction: Auction):
+    def _parse_pricing(
+        self,
+        soup: BeautifulSoup,
+        full_text: str,
+        text_normalized: str,
+        scripts: List[str],
+        lot: Optional[Dict[str, Any]],
+        auction: Auction
+    ):
         """Parse pricing information"""
         # Mise à prix from HTML elements
-        price_elem = soup.select_one(".mise-a-prix, .prix, .price")
+        price_elem = _SEL_PRICE.select_one(soup)
         if price_elem:
             price_text = price_elem.get_text()
             auction.mise_a_prix = self._extract_price(price_text)
 
         if not auction.mise_a_prix:
-            text = soup.get_text()
-            match = re.search(r"mise\s+[àa]\s+prix\s*:?\s*([\d\s,\.]+)\s*€?", text, re.IGNORECASE)
+            match = _MISE_A_PRIX_RE.search(full_text)
             if match:
                 auction.mise_a_prix = self._extract_price(match.group(1))
 
-        # Try to extract from Next.js script data
+        # Floor price from the decoded page data
+        if not auction.mise_a_prix and lot:
+            for key in ("prix_plancher", "mise_a_prix"):
+                value = lot.get(key)
+                if isinstance(value, (int, float)) and not isinstance(value, bool) and value:
+                    auction.mise_a_prix = float(value)
+                    break
+
+        # Try to extract from Next.js script data (also when the lot had no usable price,
+        # e.g. a quoted "prix_plancher":"150000")
         if not auction.mise_a_prix:
-            for script in soup.find_all("script"):
-                script_text = script.string or ""
+            for script_text in scripts:
                 if len(script_text) > 1000:
                     # Look for prix_plancher or mise_a_prix in script
-                    patterns = [
-                        r'"prix_plancher"\s*:\s*(\d+)',
-                        r'"mise_a_prix"\s*:\s*(\d+)',
-                        r'prix_plancher[":]+\s*(\d+)',
-                        r'mise[_]?a[_]?prix[":]+\s*(\d+)',
-                    ]
-                    for pattern in patterns:
-                        match = re.search(pattern, script_text, re.IGNORECASE)
+                    for pattern in _SCRIPT_PRICE_PATTERNS:
+                        match = pattern.search(script_text)
                         if match:
                             try:
                                 auction.mise_a_prix = float(match.group(1))
@@ -442,14 +703,13 @@ class EncherePubliquesScraper(BaseScraper):
         }
 
         for city, tribunal in tribunal_map.items():
-            if city in soup.get_text().lower():
+            if city in text_normalized:
                 auction.tribunal = tribunal
                 break
 
     def _extract_price(self, text: str) -> Optional[float]:
         """Extract price from text"""
-        cleaned = re.sub(r"[^\d,.]", "", text.replace(" ", ""))
-        cleaned = cleaned.replace(",", ".")
+        cleaned = text.translate(PRICE_CHARS).replace(",", ".")
 
         if cleaned.count(".") > 1:
             parts = cleaned.rsplit(".", 1)
@@ -460,26 +720,31 @@ class EncherePubliquesScraper(BaseScraper):
         except ValueError:
             return None
 
-    def _parse_detailed_description(self, soup: BeautifulSoup, auction: Auction):
+    def _parse_detailed_description(
+        self,
+        soup: BeautifulSoup,
+        scripts: List[str],
+        lot: Optional[Dict[str, Any]],
+        auction: Auction
+    ):
         """Parse detailed property description/composition"""
         # Look for description in various sections
-        desc_selectors = [
-            ".description-bien", ".detail-bien", ".composition",
-            "[data-description]", ".content-description", ".bloc-description"
-        ]
-
-        for selector in desc_selectors:
-            desc_elem = soup.select_one(selector)
+        for selector in _SEL_DESCRIPTIONS:
+            desc_elem = selector.select_one(soup)
             if desc_elem:
                 auction.description_detaillee = desc_elem.get_text(separator="\n", strip=True)
                 return
 
+        # Lot description from the decoded page data
+        if lot and isinstance(lot.get("description"), str) and lot["description"]:
+            auction.description_detaillee = lot["description"]
+            return
+
         # Try to extract from JSON data in script tags
-        for script in soup.find_all("script"):
-            script_text = script.string or ""
+        for script_text in scripts:
             if "description" in script_text.lower():
                 # Look for JSON patterns
-                desc_match = re.search(r'"description"\s*:\s*"([^"]+)"', script_text)
+                desc_match = _JSON_DESCRIPTION_RE.search(script_text)
                 if desc_match:
                     desc = desc_match.group(1)
                     # Unescape JSON string
@@ -488,7 +753,7 @@ class EncherePubliquesScraper(BaseScraper):
                     return
 
         # Fallback: look for detailed text in main content
-        main_content = soup.select_one("main, .main-content, article, .fiche-lot")
+        main_content = _SEL_MAIN_CONTENT.select_one(soup)
         if main_content:
             # Find paragraphs with composition details
             for p in main_content.find_all(["p", "div"]):
@@ -497,28 +762,30 @@ class EncherePubliquesScraper(BaseScraper):
                     auction.description_detaillee = text
                     break
 
-    def _parse_photos(self, soup: BeautifulSoup, auction: Auction):
+    def _parse_photos(
+        self,
+        soup: BeautifulSoup,
+        scripts: List[str],
+        lot: Optional[Dict[str, Any]],
+        auction: Auction
+    ):
         """Parse photo gallery URLs including Street View"""
         photos = []
+        seen_photos = set()  # same contents as photos, for O(1) membership tests
 
         # Look for gallery images
-        gallery_selectors = [
-            ".gallery img", ".photos img", ".carousel img",
-            ".slider img", "[data-gallery] img", ".photo-lot img",
-            ".swiper-slide img", ".fotorama img"
-        ]
-
-        for selector in gallery_selectors:
-            for img in soup.select(selector):
+        for selector in _SEL_GALLERIES:
+            for img in selector.select(soup):
                 src = img.get("src") or img.get("data-src") or img.get("data-lazy")
                 if src:
                     if not src.startswith("http"):
                         src = f"{self.base_url}{src}"
-                    if src not in photos and "placeholder" not in src.lower():
+                    if src not in seen_photos and "placeholder" not in src.lower():
                         photos.append(src)
+                        seen_photos.add(src)
 
         # Look for images with class "photo" (Next.js format)
-        for img in soup.select("img.photo, .photos img, [class*='photo'] img"):
+        for img in _SEL_PHOTO_IMAGES.select(soup):
             # Check srcset for best quality image
             srcset = img.get("srcset", "")
             if srcset:
@@ -531,126 +798,154 @@ class EncherePubliquesScraper(BaseScraper):
                         # Decode Next.js image URL
                         if "/_next/image" in url:
                             # Extract original URL from Next.js wrapper
-                            url_match = re.search(r'url=([^&]+)', url)
+                            url_match = _NEXT_IMAGE_URL_RE.search(url)
                             if url_match:
-                                from urllib.parse import unquote
                                 original_url = unquote(url_match.group(1))
-                                if original_url not in photos:
+                                if original_url not in seen_photos:
                                     photos.append(original_url)
+                                    seen_photos.add(original_url)
                                 break
-                        elif url.startswith("http") and url not in photos:
+                        elif url.startswith("http") and url not in seen_photos:
                             photos.append(url)
+                            seen_photos.add(url)
                             break
 
             # Also check src
             src = img.get("src", "")
             if src and "/_next/image" in src:
-                url_match = re.search(r'url=([^&]+)', src)
+                url_match = _NEXT_IMAGE_URL_RE.search(src)
                 if url_match:
-                    from urllib.parse import unquote
                     original_url = unquote(url_match.group(1))
-                    if original_url not in photos:
+                    if original_url not in seen_photos:
                         photos.append(original_url)
-            elif src and src.startswith("http") and src not in photos and "placeholder" not in src.lower():
+                        seen_photos.add(original_url)
+            elif src and src.startswith("http") and src not in seen_photos and "placeholder" not in src.lower():
                 photos.append(src)
+                seen_photos.add(src)
+
+        # Lot photos from the decoded page data
+        has_lot_photos = False
+        lot_photos = lot.get("photos") if lot else None
+        if isinstance(lot_photos, list):
+            for p in lot_photos:
+                url = p.get("url") or p.get("src") if isinstance(p, dict) else p
+                if url and isinstance(url, str):
+                    has_lot_photos = True
+                    full_url = url if url.startswith("http") else f"{self.base_url}{url}"
+                    if full_url not in seen_photos:
+                        photos.append(full_url)
+                        seen_photos.add(full_url)
 
         # Try JSON data for photos
-        for script in soup.find_all("script"):
-            script_text = script.string or ""
-            # Look for photo arrays
-            photo_matches = re.findall(r'/static/lot/photo/[^"\']+\.jpg', script_text)
-            for photo in photo_matches:
-                full_url = f"{self.base_url}{photo}"
-                if full_url not in photos:
-                    photos.append(full_url)
+        for script_text in scripts:
+            # Look for photo arrays (when the lot gave none in a known shape)
+            if not has_lot_photos:
+                photo_matches = _LOT_PHOTO_RE.findall(script_text)
+                for photo in photo_matches:
+                    full_url = f"{self.base_url}{photo}"
+                    if full_url not in seen_photos:
+                        photos.append(full_url)
+                        seen_photos.add(full_url)
 
             # Look for Street View URLs
-            streetview_matches = re.findall(r'streetview\?adresse_id=\d+[^"\']*', script_text)
+            streetview_matches = _STREETVIEW_RE.findall(script_text)
             for sv in streetview_matches:
                 full_url = f"{self.base_url}/back/services/{sv}"
-                if full_url not in photos:
+                if full_url not in seen_photos:
                     photos.append(full_url)
+                    seen_photos.add(full_url)
 
         # Also check data attributes
-        for elem in soup.select("[data-photos], [data-images]"):
+        for elem in _SEL_PHOTO_DATA.select(soup):
             data = elem.get("data-photos") or elem.get("data-images")
             if data:
                 try:
-                    import json
-                    photo_list = json.loads(data)
+                    photo_list = _json_loads(data)
                     for p in photo_list:
                         url = p if isinstance(p, str) else p.get("url", p.get("src", ""))
-                        if url and url not in photos:
+                        if url and url not in seen_photos:
                             if not url.startswith("http"):
                                 url = f"{self.base_url}{url}"
                             photos.append(url)
+                            seen_photos.add(url)
                 except:
                     pass
 
         auction.photos = photos[:20]  # Limit to 20 photos
 
-    def _parse_all_documents(self, soup: BeautifulSoup, auction: Auction):
+    def _parse_all_documents(
+        self,
+        soup: BeautifulSoup,
+        scripts: List[str],
+        lot: Optional[Dict[str, Any]],
+        auction: Auction
+    ):
         """Parse all document links (cahier des charges, PV, diagnostics, etc.)"""
         documents = []
-        doc_type_map = {
-            "cahier": "Cahier des conditions de vente",
-            "pv": "Procès-verbal de description",
-            "procès": "Procès-verbal de description",
-            "diagnostic": "Diagnostics immobiliers",
-            "avis": "Avis de vente",
-            "jugement": "Jugement",
-            "expertise": "Rapport d'expertise",
-            "urbanisme": "Certificat d'urbanisme",
-            "spanc": "Rapport SPANC",
-        }
+        seen_documents = set()  # (nom, url, type) of each entry in documents
 
         # Extract from JSON data in script tags (encheres-publiques format)
         # Pattern: "file":"filename.pdf","nom":"Document Name"
-        for script in soup.find_all("script"):
-            script_text = script.string or ""
-            if "LotDocument" in script_text:
-                # Find all LotDocument entries
-                doc_matches = re.findall(
-                    r'"file"\s*:\s*"([^"]+\.pdf)"\s*,\s*"nom"\s*:\s*"([^"]+)"',
-                    script_text
-                )
-                for filename, nom in doc_matches:
-                    # Build full URL
-                    full_url = f"{self.base_url}/static/lot/document/{filename}"
-
-                    # Determine document type
-                    doc_type = nom  # Use the actual name from the site
-                    nom_lower = nom.lower()
+        lot_documents = lot.get("documents") if lot else None
+        doc_matches = []
+        if isinstance(lot_documents, list):
+            # Decoded page data: LotDocument records
+            doc_matches = [
+                (doc["file"], doc["nom"]) for doc in lot_documents
+                if isinstance(doc, dict)
+                and isinstance(doc.get("file"), str) and doc["file"].endswith(".pdf")
+                and isinstance(doc.get("nom"), str) and doc["nom"]
+            ]
+        if not doc_matches:
+            # Find all LotDocument entries
+            doc_matches = [
+                match for script_text in scripts if "LotDocument" in script_text
+                for match in _LOT_DOCUMENT_RE.findall(script_text)
+            ]
 
-                    doc_entry = {
-                        "nom": nom,
-                        "url": full_url,
-                        "type": doc_type
-                    }
+        for filename, nom in doc_matches:
+            # Build full URL
+            full_url = f"{self.base_url}/static/lot/document/{filename}"
 
-                    if doc_entry not in documents:
-                        documents.append(doc_entry)
+            # Determine document type
+            doc_type = nom  # Use the actual name from the site
+            nom_lower = nom.lower()
+
+            doc_entry = {
+                "nom": nom,
+                "url": full_url,
+                "type": doc_type
+            }
 
-                        # Set PV status if we found the PV
-                        if "procès" in nom_lower or "pv" in nom_lower:
-                            auction.pv_url = full_url
-                            auction.pv_status = PVStatus.A_TELECHARGER
+            doc_key = (nom, full_url, doc_type)
+            if doc_key not in seen_documents:
+                seen_documents.add(doc_key)
+                documents.append(doc_entry)
+
+                # Set PV status if we found the PV
+                if "procès" in nom_lower or "pv" in nom_lower:
+                    auction.pv_url = full_url
+                    auction.pv_status = PVStatus.A_TELECHARGER
 
         # Fallback: Find PDF links in HTML
         if not documents:
             for link in soup.find_all("a", href=True):
                 href = link.get("href", "")
-                text = link.get_text(strip=True)
+                href_lower = href.lower()
 
-                if ".pdf" in href.lower():
+                if ".pdf" in href_lower:
+                    text = link.get_text(strip=True)
                     full_url = href if href.startswith("http") else f"{self.base_url}{href}"
 
-                    # Determine document type
-                    doc_type = "Autre document"
-                    for pattern, name in doc_type_map.items():
-                        if pattern in text.lower() or pattern in href.lower():
-                            doc_type = name
-                            break
+                    # Determine document type: highest-priority keyword in link text or href
+                    found = {
+                        match.lastgroup
+                        for match in _DOC_TYPE_RE.finditer(f"{text.lower()} {href_lower}")
+                    }
+                    doc_type = next(
+                        (name for group, name in _DOC_TYPE_NAMES if group in found),
+                        "Autre document"
+                    )
 
                     doc_entry = {
                         "nom": text or doc_type,
@@ -658,7 +953,9 @@ class EncherePubliquesScraper(BaseScraper):
                         "type": doc_type
                     }
 
-                    if doc_entry not in documents:
+                    doc_key = (doc_entry["nom"], full_url, doc_type)
+                    if doc_key not in seen_documents:
+                        seen_documents.add(doc_key)
                         documents.append(doc_entry)
 
         auction.documents = documents
@@ -668,47 +965,43 @@ class EncherePubliquesScraper(BaseScraper):
         elif auction.pv_url:
             auction.pv_status = PVStatus.A_TELECHARGER
 
-    def _parse_occupation(self, soup: BeautifulSoup, auction: Auction):
-        """Parse occupation status (libre/occupé)"""
-        text = soup.get_text().lower()
+    def _parse_occupation(
+        self,
+        soup: BeautifulSoup,
+        text: str,
+        scripts: List[str],
+        lot: Optional[Dict[str, Any]],
+        auction: Auction
+    ):
+        """Parse occupation status (libre/occupé) (text: lowercased page text)"""
 
         # Check for explicit occupation fields
-        occupation_patterns = [
-            (r"occupation[^\n]*?:\s*([^\n,]+)", None),
-            (r"(libre\s+de\s+toute\s+occupation)", "Libre"),
-            (r"(occupé|occupée)", "Occupé"),
-            (r"bien\s+(libre|vacant)", "Libre"),
-            (r"(locataire|bail|location)", "Occupé"),
-        ]
-
-        for pattern, default_value in occupation_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern, default_value in _OCCUPATION_PATTERNS:
+            match = pattern.search(text)
             if match:
                 auction.occupation = default_value or match.group(1).strip().capitalize()
                 return
 
+        # Occupation criterion from the decoded page data
+        if lot:
+            for key, value in lot.items():
+                if key.startswith("critere_occupation") and isinstance(value, str) and value:
+                    auction.occupation = value
+                    return
+
         # Check JSON data
-        for script in soup.find_all("script"):
-            script_text = script.string or ""
-            occ_match = re.search(r'"critere_occupation[^"]*"\s*:\s*"([^"]+)"', script_text)
+        for script_text in scripts:
+            occ_match = _JSON_OCCUPATION_RE.search(script_text)
             if occ_match:
                 auction.occupation = occ_match.group(1)
                 return
 
-    def _parse_cadastre(self, soup: BeautifulSoup, auction: Auction):
+    def _parse_cadastre(self, soup: BeautifulSoup, text: str, auction: Auction):
         """Parse cadastral reference"""
-        text = soup.get_text()
 
         # Various cadastral patterns
-        cadastre_patterns = [
-            r"[Ss]ection\s+([A-Z]{1,2})\s*n[°º]?\s*(\d+)",
-            r"[Cc]adastr[ée]\s*:?\s*([A-Z]{1,2}\s*\d+)",
-            r"[Pp]arcelle\s+([A-Z]{1,2}\s*\d+)",
-            r"[Rr]éférence\s+cadastrale\s*:?\s*([A-Z0-9\s]+)",
-        ]
-
-        for pattern in cadastre_patterns:
-            match = re.search(pattern, text)
+        for pattern in _CADASTRE_PATTERNS:
+            match = pattern.search(text)
             if match:
                 if len(match.groups()) >= 2:
                     auction.cadastre = f"Section {match.group(1)} n°{match.group(2)}"
@@ -716,90 +1009,93 @@ class EncherePubliquesScraper(BaseScraper):
                     auction.cadastre = match.group(1).strip()
                 return
 
-    def _parse_lawyer_details(self, soup: BeautifulSoup, auction: Auction):
+    def _parse_lawyer_details(self, soup: BeautifulSoup, scripts: List[str], auction: Auction):
         """Parse lawyer/avocat information"""
         # Look for lawyer section
-        lawyer_selectors = [
-            ".avocat", ".vendeur", ".professionnel", ".contact-avocat",
-            ".poursuivant", "[data-avocat]", ".bloc-avocat"
-        ]
-
-        for selector in lawyer_selectors:
-            section = soup.select_one(selector)
+        for selector in _SEL_LAWYER_SECTIONS:
+            section = selector.select_one(soup)
             if section:
                 # Name
-                name_elem = section.select_one(".nom, .name, h3, h4, strong, .titre")
+                name_elem = _SEL_LAWYER_NAME.select_one(section)
                 if name_elem:
                     auction.avocat_nom = name_elem.get_text(strip=True)
 
                 # Cabinet
-                cabinet_elem = section.select_one(".cabinet, .societe")
+                cabinet_elem = _SEL_LAWYER_CABINET.select_one(section)
                 if cabinet_elem:
                     auction.avocat_cabinet = cabinet_elem.get_text(strip=True)
 
                 # Phone
-                phone_elem = section.select_one("a[href^='tel:'], .tel, .telephone, .phone")
+                phone_elem = _SEL_LAWYER_PHONE.select_one(section)
                 if phone_elem:
                     phone = phone_elem.get("href", "").replace("tel:", "") or phone_elem.get_text(strip=True)
                     auction.avocat_telephone = phone
 
                 # Email
-                email_elem = section.select_one("a[href^='mailto:']")
+                email_elem = _SEL_MAILTO.select_one(section)
                 if email_elem:
                     auction.avocat_email = email_elem.get("href", "").replace("mailto:", "")
 
                 # Website
-                web_elem = section.select_one("a.site, a.website, a[href*='avocat']")
+                web_elem = _SEL_LAWYER_WEBSITE.select_one(section)
                 if web_elem:
                     auction.avocat_site_web = web_elem.get("href", "")
 
                 # Address
-                addr_elem = section.select_one(".adresse, .address")
+                addr_elem = _SEL_LAWYER_ADDRESS.select_one(section)
                 if addr_elem:
                     auction.avocat_adresse = addr_elem.get_text(strip=True)
 
                 return
 
-        # Try extracting from JSON data
-        for script in soup.find_all("script"):
-            script_text = script.string or ""
-            if "avocat" in script_text.lower() or "poursuivant" in script_text.lower():
+        # Try extracting from JSON data. The last lawyer script carrying a value wins,
+        # so scan from the end and stop once both values are found
+        phone_match = name_match = None
+        for script_text in reversed(scripts):
+            script_lower = script_text.lower()
+            if "avocat" in script_lower or "poursuivant" in script_lower:
                 # Look for phone numbers
-                phone_match = re.search(r'"(?:phone|telephone|tel)"\s*:\s*"([^"]+)"', script_text)
-                if phone_match:
-                    auction.avocat_telephone = phone_match.group(1)
+                if not phone_match:
+                    phone_match = _JSON_PHONE_RE.search(script_text)
 
                 # Look for names
-                name_match = re.search(r'"(?:nom|name|cabinet)"\s*:\s*"([^"]+)"', script_text)
-                if name_match:
-                    auction.avocat_nom = name_match.group(1)
+                if not name_match:
+                    name_match = _JSON_NAME_RE.search(script_text)
+
+                if phone_match and name_match:
+                    break
+
+        if phone_match:
+            auction.avocat_telephone = phone_match.group(1)
+        if name_match:
+            auction.avocat_nom = name_match.group(1)
 
     def _parse_documents(self, soup: BeautifulSoup, auction: Auction):
         """Parse document links (PV, cahier des charges) - legacy method"""
         # Now handled by _parse_all_documents
-        self._parse_all_documents(soup, auction)
+        self._parse_all_documents(soup, self._script_texts(soup), self._next_data_lot(soup), auction)
 
     def extract_lawyer_info(self, soup: BeautifulSoup) -> Optional[Lawyer]:
         """Extract lawyer information"""
         lawyer = Lawyer()
 
         # Find lawyer section
-        lawyer_section = soup.select_one(".avocat, .vendeur, .professionnel, .contact")
+        lawyer_section = _SEL_CONTACT_SECTION.select_one(soup)
 
         if lawyer_section:
-            name = lawyer_section.select_one(".nom, .name, h3, h4, strong")
+            name = _SEL_CONTACT_NAME.select_one(lawyer_section)
             if name:
                 lawyer.nom = name.get_text(strip=True)
 
-            phone = lawyer_section.select_one("a[href^='tel:'], .tel, .telephone")
+            phone = _SEL_CONTACT_PHONE.select_one(lawyer_section)
             if phone:
                 lawyer.telephone = phone.get_text(strip=True)
 
-            email = lawyer_section.select_one("a[href^='mailto:']")
+            email = _SEL_MAILTO.select_one(lawyer_section)
             if email:
                 lawyer.email = email.get("href", "").replace("mailto:", "")
 
-            website = lawyer_section.select_one("a.site, a.website")
+            website = _SEL_CONTACT_WEBSITE.select_one(lawyer_section)
             if website:
                 lawyer.site_web = website.get("href", "")
 
@@ -814,31 +1110,30 @@ class EncherePubliquesScraper(BaseScraper):
         logger.info(f"[EnchèresPubliques] Scanning all listings for departments 75/92/93/94...")
 
         for page in range(1, max_pages + 1):
-            url = f"{self.base_url}/encheres/immobilier?page={page}"
-            soup = self.fetch_page(url)
+            url = self.get_auction_list_url(page)
+            content = self.fetch_content(url)
 
-            if not soup:
+            if content is None:
                 break
 
-            auctions = self.parse_auction_list(soup)
+            auctions = self._parse_auction_list_content(content)
             if not auctions:
                 break
 
             # Filter for Paris region departments (75, 92, 93, 94)
-            local_auctions = [
-                a for a in auctions
-                if "-75/" in a.get("url", "") or "-92/" in a.get("url", "")
-                or "-93/" in a.get("url", "") or "-94/" in a.get("url", "")
-            ]
+            local_auctions = [a for a in auctions if _PARIS_DEPT_RE.search(a.get("url", ""))]
 
+            new_urls = []
             for data in local_auctions:
                 auction_url = data.get("url", "")
                 if auction_url and auction_url not in seen_urls:
                     seen_urls.add(auction_url)
-                    auction = self.parse_auction_detail(auction_url)
-                    if auction:
-                        all_auctions.append(auction)
-                        logger.info(f"[EnchèresPubliques] Found: {auction.ville} - {auction.type_bien.value if auction.type_bien else 'bien'}")
+                    new_urls.append(auction_url)
+
+            for auction in self.parse_auction_details(new_urls):
+                if auction:
+                    all_auctions.append(auction)
+                    logger.info(f"[EnchèresPubliques] Found: {auction.ville} - {auction.type_bien.value if auction.type_bien else 'bien'}")
 
             logger.debug(f"[EnchèresPubliques] Page {page}: {len(auctions)} total, {len(local_auctions)} in Paris region")
 
@@ -1,7 +1,11 @@
 """
 Scraper pour les sites d'avocats - Récupère les ventes et PV descriptifs
 """
+import heapq
 import re
+import sys
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, date
 from typing import List, Dict, Optional, Tuple
 from dataclasses import dataclass
@@ -9,12 +13,75 @@ from urllib.parse import urljoin
 from loguru import logger
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from bs4 import BeautifulSoup
 
+from config.settings import SCRAPING
 from src.storage.models import Auction
+from ._text import HAS_SELECTOLAX, HTMLParser
+
+# slots=True n'existe qu'à partir de Python 3.10
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# Patterns compilés une fois au chargement, utilisés sur chaque page de vente
+_DATE_TITLE_RE = re.compile(r"(\d{1,2})[./](\d{1,2})[./](\d{4})")
+_DATE_URL_RE = re.compile(r"vente-du-(\d{1,2})-(\d{1,2})-(\d{4})")
+_CP_VILLE_RE = re.compile(r"(\d{5})\s*([A-ZÀ-Ü][a-zà-ü-]+(?:\s+[A-ZÀ-Ü]?[a-zà-ü-]+)*)")
+# Alternatives fusionnées, un groupe nommé par pattern d'origine (ordre de priorité dans
+# les tuples *_GROUPS). Une alternative ne peut pas masquer le début d'une autre :
+# les voies (sans chiffres) ne recouvrent pas un numéro, le libellé "superficie" est
+# consommé sans sa valeur (lookahead) pour laisser visible un "NN m²" qui la suit.
+_ADDRESS_RE = re.compile(
+    r"(?P<numero>\d+(?:bis|ter)?[\s,]+(?:rue|boulevard|bd|avenue|av|chemin|allée|square|impasse|place)[^,\d]{5,50})"
+    r"|(?P<voie>(?:rue|boulevard|bd|avenue|av|chemin|allée|square|impasse|place)[^,\d]{5,50})",
+    re.IGNORECASE
+)
+_ADDRESS_GROUPS = ("numero", "voie")
+_PRICE_RE = re.compile(
+    r"mise\s*[àa]\s*prix[:\s]*(?P<mise_a_prix>\d[\d\s]*(?:[,.]\d+)?)\s*(?:€|euros?)?"
+    r"|(?P<montant>\d[\d\s]*(?:[,.]\d+)?)\s*(?:€|euros?)",
+    re.IGNORECASE
+)
+_PRICE_GROUPS = ("mise_a_prix", "montant")
+_AMOUNT_RE = re.compile(r"(\d[\d\s]*(?:[,.]\d+)?)\s*(?:€|euros?)", re.IGNORECASE)
+_SURFACE_RE = re.compile(
+    r"(?P<m2>\d+(?:[,.]\d+)?)\s*m[²2]|superficie[:\s]*(?=(?P<superficie>\d+(?:[,.]\d+)?))",
+    re.IGNORECASE
+)
+_SURFACE_GROUPS = ("m2", "superficie")
+
+
+def _first_named_matches(pattern: re.Pattern, text: str, groups: Tuple[str, ...]) -> Dict[str, str]:
+    """
+    Première valeur de chaque groupe nommé de pattern dans text, en un seul parcours
 
+    Le parcours s'arrête dès que le groupe prioritaire (groups[0]) est trouvé : chaque
+    valeur renvoyée est celle qu'un re.search du pattern d'origine aurait trouvée.
+    """
+    found = {}
+    for match in pattern.finditer(text):
+        for name in groups:
+            value = match.group(name)
+            if value is not None:
+                found.setdefault(name, value)
+                break
+        if groups[0] in found:
+            break
+    return found
 
-@dataclass
+
+def _parse_price(price_text: Optional[str]) -> Optional[float]:
+    """Montant texte ("150 000,00") -> float, None si absent ou illisible"""
+    if price_text is None:
+        return None
+    try:
+        return float(price_text.replace(" ", "").replace(",", "."))
+    except ValueError:
+        return None
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class LawyerAuction:
     """Vente trouvée sur un site d'avocat"""
     cabinet: str
@@ -42,33 +109,61 @@ class MascaronScraper:
 
     BASE_URL = "https://www.mascaron-avocats.com"
     ENCHERES_URL = "https://www.mascaron-avocats.com/domaines-dintervention/encheres-immobilieres/"
+    # Pages de détail récupérées en parallèle
+    MAX_WORKERS = 8
 
     def __init__(self):
         self.session = requests.Session()
+        # Connexions keep-alive réutilisées (pool dimensionné pour les MAX_WORKERS threads);
+        # fetch_html ne fait qu'une tentative, les erreurs de connexion/lecture sont rejouées ici
+        adapter = HTTPAdapter(
+            pool_connections=SCRAPING["pool_connections"],
+            pool_maxsize=max(SCRAPING["pool_maxsize"], self.MAX_WORKERS),
+            max_retries=Retry(total=3, backoff_factor=0.3),
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
         self.session.headers.update({
             "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36"
         })
 
     def fetch_page(self, url: str) -> Optional[BeautifulSoup]:
         """Récupère une page"""
+        html = self.fetch_html(url)
+        if html is None:
+            return None
+        return BeautifulSoup(html, "lxml")
+
+    def fetch_html(self, url: str) -> Optional[str]:
+        """Récupère le HTML brut d'une page"""
         try:
             response = self.session.get(url, timeout=30)
             response.raise_for_status()
-            return BeautifulSoup(response.text, "html.parser")
+            return response.text
         except Exception as e:
             logger.error(f"[MascaronScraper] Erreur fetch {url}: {e}")
             return None
 
+    def _page_hrefs(self, html: str) -> List[str]:
+        """href de chaque lien <a href> de la page (selectolax si disponible)"""
+        if HAS_SELECTOLAX and SCRAPING.get("use_selectolax", True):
+            try:
+                return [node.attributes.get("href") or "" for node in HTMLParser(html).css("a[href]")]
+            except Exception as e:
+                logger.debug(f"[MascaronScraper] selectolax en échec, BeautifulSoup utilisé: {e}")
+
+        soup = BeautifulSoup(html, "lxml")
+        return [link["href"] for link in soup.find_all("a", href=True)]
+
     def get_auction_urls(self) -> List[str]:
         """Récupère la liste des URLs des ventes"""
-        soup = self.fetch_page(self.ENCHERES_URL)
-        if not soup:
+        html = self.fetch_html(self.ENCHERES_URL)
+        if html is None:
             return []
 
         urls = []
         # Chercher les liens vers les pages de détail
-        for link in soup.find_all("a", href=True):
-            href = link["href"]
+        for href in self._page_hrefs(html):
             if "/enchere/" in href or "vente-du-" in href:
                 full_url = urljoin(self.BASE_URL, href)
                 if full_url not in urls:
@@ -88,10 +183,12 @@ class MascaronScraper:
             title = soup.find("h1") or soup.find("title")
             title_text = title.get_text(strip=True) if title else ""
 
+            # Texte de la page, extrait une seule fois pour tous les helpers
+            full_text = soup.get_text()
+            titled_text = title_text + " " + full_text
+
             # Extraire date de vente du titre ou URL
-            date_match = re.search(r"(\d{1,2})[./](\d{1,2})[./](\d{4})", title_text)
-            if not date_match:
-                date_match = re.search(r"vente-du-(\d{1,2})-(\d{1,2})-(\d{4})", url)
+            date_match = _DATE_TITLE_RE.search(title_text) or _DATE_URL_RE.search(url)
 
             date_vente = None
             if date_match:
@@ -99,13 +196,13 @@ class MascaronScraper:
                 date_vente = date(year, month, day)
 
             # Extraire l'adresse et la ville
-            adresse, ville, code_postal = self._extract_location(title_text, soup)
+            adresse, ville, code_postal = self._extract_location(titled_text)
 
             # Extraire la mise à prix
-            mise_a_prix = self._extract_price(soup)
+            mise_a_prix = self._extract_price(full_text)
 
             # Extraire la surface
-            surface = self._extract_surface(title_text + " " + soup.get_text())
+            surface = self._extract_surface(titled_text)
 
             # Extraire les documents PDF
             documents = self._extract_documents(soup, url)
@@ -139,58 +236,42 @@ class MascaronScraper:
             logger.error(f"[MascaronScraper] Erreur parsing {url}: {e}")
             return None
 
-    def _extract_location(self, title: str, soup: BeautifulSoup) -> Tuple[str, str, str]:
-        """Extrait adresse, ville et code postal"""
-        text = title + " " + soup.get_text()
-
+    def _extract_location(self, text: str) -> Tuple[str, str, str]:
+        """Extrait adresse, ville et code postal (text: titre + texte de la page)"""
         # Pattern pour code postal et ville
-        cp_match = re.search(r"(\d{5})\s*([A-ZÀ-Ü][a-zà-ü-]+(?:\s+[A-ZÀ-Ü]?[a-zà-ü-]+)*)", text)
+        cp_match = _CP_VILLE_RE.search(text)
         code_postal = cp_match.group(1) if cp_match else ""
         ville = cp_match.group(2).strip() if cp_match else ""
 
-        # Pattern pour adresse
-        addr_patterns = [
-            r"(\d+(?:bis|ter)?[\s,]+(?:rue|boulevard|bd|avenue|av|chemin|allée|square|impasse|place)[^,\d]{5,50})",
-            r"((?:rue|boulevard|bd|avenue|av|chemin|allée|square|impasse|place)[^,\d]{5,50})",
-        ]
-        adresse = ""
-        for pattern in addr_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                adresse = match.group(1).strip()
-                break
+        # Pattern pour adresse (avec numéro de préférence)
+        found = _first_named_matches(_ADDRESS_RE, text, _ADDRESS_GROUPS)
+        adresse = (found.get("numero") or found.get("voie") or "").strip()
 
         return adresse, ville, code_postal
 
-    def _extract_price(self, soup: BeautifulSoup) -> float:
-        """Extrait la mise à prix"""
-        text = soup.get_text()
-        # Chercher "mise à prix" suivie d'un montant
-        patterns = [
-            r"mise\s*[àa]\s*prix[:\s]*(\d[\d\s]*(?:[,.]\d+)?)\s*(?:€|euros?)?",
-            r"(\d[\d\s]*(?:[,.]\d+)?)\s*(?:€|euros?)",
-        ]
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                price_str = match.group(1).replace(" ", "").replace(",", ".")
-                try:
-                    return float(price_str)
-                except:
-                    pass
-        return 0
+    def _extract_price(self, text: str) -> float:
+        """Extrait la mise à prix (text: texte de la page)"""
+        # Chercher "mise à prix" suivie d'un montant, sinon le premier montant de la page
+        found = _first_named_matches(_PRICE_RE, text, _PRICE_GROUPS)
+        if "mise_a_prix" not in found:
+            price = _parse_price(found.get("montant"))
+            return price if price is not None else 0
+
+        price = _parse_price(found["mise_a_prix"])
+        if price is None:
+            # Mise à prix illisible : montant de secours cherché à part, il peut suivre
+            # ou chevaucher la mise à prix
+            match = _AMOUNT_RE.search(text)
+            price = _parse_price(match.group(1) if match else None)
+        return price if price is not None else 0
 
     def _extract_surface(self, text: str) -> Optional[float]:
         """Extrait la surface"""
-        patterns = [
-            r"(\d+(?:[,.]\d+)?)\s*m[²2]",
-            r"superficie[:\s]*(\d+(?:[,.]\d+)?)",
-        ]
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
+        found = _first_named_matches(_SURFACE_RE, text, _SURFACE_GROUPS)
+        for name in _SURFACE_GROUPS:
+            if name in found:
                 try:
-                    return float(match.group(1).replace(",", "."))
+                    return float(found[name].replace(",", "."))
                 except:
                     pass
         return None
@@ -219,8 +300,11 @@ class MascaronScraper:
         auctions = []
         urls = self.get_auction_urls()
 
-        for url in urls:
-            auction = self.parse_auction_detail(url)
+        # Les pages sont récupérées en parallèle, les résultats restent dans l'ordre des URLs
+        with ThreadPoolExecutor(max_workers=self.MAX_WORKERS) as executor:
+            results = list(executor.map(self.parse_auction_detail, urls))
+
+        for auction in results:
             if auction:
                 auctions.append(auction)
                 logger.info(f"[MascaronScraper] Scraped: {auction.adresse} ({auction.ville})")
@@ -229,7 +313,30 @@ class MascaronScraper:
         return auctions
 
 
-def match_lawyer_auction_to_db(lawyer_auction: LawyerAuction, db_auctions: List[Auction]) -> Optional[Auction]:
+def _ville_lower(auction) -> str:
+    """Ville en minuscules ("" si absente)"""
+    return auction.ville.lower() if auction.ville else ""
+
+
+def index_db_auctions(db_auctions: List[Auction]) -> Dict[Optional[date], List[Tuple[int, str, Auction]]]:
+    """
+    Indexe les ventes en base par date de vente (clé None: ventes sans date)
+
+    Chaque entrée garde le rang de la vente dans db_auctions, pour que
+    match_lawyer_auction_to_db renvoie la même vente qu'un parcours complet,
+    et sa ville en minuscules, calculée une seule fois.
+    """
+    by_date = defaultdict(list)
+    for position, db_auction in enumerate(db_auctions):
+        by_date[db_auction.date_vente or None].append((position, _ville_lower(db_auction), db_auction))
+    return by_date
+
+
+def match_lawyer_auction_to_db(
+    lawyer_auction: LawyerAuction,
+    db_auctions: List[Auction],
+    by_date: Optional[Dict[Optional[date], List[Tuple[int, str, Auction]]]] = None
+) -> Optional[Auction]:
     """
     Trouve la correspondance entre une vente avocat et une vente en base
 
@@ -237,8 +344,23 @@ def match_lawyer_auction_to_db(lawyer_auction: LawyerAuction, db_auctions: List[
     - Même date de vente
     - Même ville ou code postal
     - Prix similaire (±20%)
+
+    by_date (index_db_auctions) limite le parcours aux ventes de la même date
+    ou sans date, les seules qui peuvent correspondre quand la date est connue.
     """
-    for db_auction in db_auctions:
+    if by_date is not None and lawyer_auction.date_vente:
+        # Ventes du jour et ventes sans date, dans l'ordre de db_auctions
+        candidates = (
+            (db_auction, db_ville) for _, db_ville, db_auction in heapq.merge(
+                by_date.get(lawyer_auction.date_vente, ()), by_date.get(None, ())
+            )
+        )
+    else:
+        candidates = ((db_auction, _ville_lower(db_auction)) for db_auction in db_auctions)
+
+    ville = _ville_lower(lawyer_auction)
+
+    for db_auction, db_ville in candidates:
         # Date de vente
         if lawyer_auction.date_vente and db_auction.date_vente:
             if lawyer_auction.date_vente != db_auction.date_vente:
@@ -246,9 +368,8 @@ def match_lawyer_auction_to_db(lawyer_auction: LawyerAuction, db_auctions: List[
 
         # Ville ou code postal
         ville_match = False
-        if lawyer_auction.ville and db_auction.ville:
-            if lawyer_auction.ville.lower() in db_auction.ville.lower() or \
-               db_auction.ville.lower() in lawyer_auction.ville.lower():
+        if ville and db_ville:
+            if ville in db_ville or db_ville in ville:
                 ville_match = True
         if lawyer_auction.code_postal and db_auction.code_postal:
             if lawyer_auction.code_postal == db_auction.code_postal:
@@ -285,9 +406,12 @@ def update_auctions_with_lawyer_data(db) -> Dict[str, int]:
 
     # Récupérer les annonces en base
     db_auctions = db.get_all_auctions(limit=1000)
+    by_date = index_db_auctions(db_auctions)
+    # Annonces modifiées (une entrée par annonce même si plusieurs ventes la matchent)
+    updated = {}
 
     for la in lawyer_auctions:
-        match = match_lawyer_auction_to_db(la, db_auctions)
+        match = match_lawyer_auction_to_db(la, db_auctions, by_date)
 
         if match:
             stats["matched"] += 1
@@ -302,15 +426,20 @@ def update_auctions_with_lawyer_data(db) -> Dict[str, int]:
             if la.documents:
                 if not match.documents:
                     match.documents = []
+                existing_urls = {doc.get("url") for doc in match.documents}
                 for doc in la.documents:
-                    if doc not in match.documents:
+                    if doc["url"] not in existing_urls:
+                        existing_urls.add(doc["url"])
                         match.documents.append(doc)
 
-            # Sauvegarder
-            db.save_auction(match)
+            updated[id(match)] = match
         else:
             stats["new"] += 1
             logger.debug(f"[LawyerScraper] Pas de match pour: {la.adresse} ({la.ville})")
 
+    # Sauvegarder en une seule transaction
+    if updated:
+        db.save_auctions(list(updated.values()))
+
     logger.info(f"[LawyerScraper] Résultats: {stats}")
     return stats
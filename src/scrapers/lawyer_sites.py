@@ -2,15 +2,32 @@
 Scraper for lawyer/cabinet websites to download PV and cahier des charges
 """
 import re
-from typing import Optional, List, Dict, Any
+import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, List, Dict, Any, Tuple
 from pathlib import Path
 from urllib.parse import urljoin, urlparse
+import soupsieve
 from bs4 import BeautifulSoup
 from loguru import logger
 
 from .base_scraper import BaseScraper
+from ._text import HAS_SELECTOLAX, HTMLParser
+from config.settings import SCRAPING
 from src.storage.models import Lawyer, PVStatus
 
+# Contact patterns compiled once at import
+_LAWYER_NAME_RE = re.compile(r"(?:Maître|Me|Cabinet)\s+([A-ZÀ-Ü][a-zà-ü]+(?:\s+[A-ZÀ-Ü][a-zà-ü]+)*)")
+_PHONE_RE = re.compile(r"(?:Tél|Tel|Téléphone)\s*:?\s*((?:\+33|0)[\d\s.]+)")
+_EMAIL_RE = re.compile(r"([a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,})")
+
+# Link text keywords for pages that may lead to a PDF
+_DOC_LINK_KEYWORDS = frozenset(("cahier", "charges", "télécharger", "document", "pv"))
+
+# CSS selectors compiled once at import
+_SEL_LISTING_CARDS = soupsieve.compile(".vente, .enchere, .annonce, article, .listing-item")
+_SEL_CONTACT = soupsieve.compile(".contact, #contact, footer, .coordonnees")
+
 # Configuration for known lawyer websites
 KNOWN_LAWYERS = {
     "jurisbelair": {
@@ -50,13 +67,12 @@ class LawyerSiteScraper(BaseScraper):
         auctions = []
 
         # Look for auction listings
-        cards = soup.select(".vente, .enchere, .annonce, article, .listing-item")
+        cards = _SEL_LISTING_CARDS.select(soup)
 
         if not cards:
-            # Try generic links to PDFs
-            links = soup.find_all("a", href=True)
-            for link in links:
-                href = link.get("href", "").lower()
+            # Try generic links to PDFs (single walk over the page's links)
+            for link in soup.find_all("a", href=True):
+                href = link["href"].lower()
                 if ".pdf" in href or "cahier" in href or "vente" in href:
                     auctions.append({
                         "url": href,
@@ -82,21 +98,21 @@ class LawyerSiteScraper(BaseScraper):
         lawyer = Lawyer()
 
         # Look for contact info
-        contact = soup.select_one(".contact, #contact, footer, .coordonnees")
+        contact = _SEL_CONTACT.select_one(soup)
         text = contact.get_text() if contact else soup.get_text()
 
         # Name
-        name_match = re.search(r"(?:Maître|Me|Cabinet)\s+([A-ZÀ-Ü][a-zà-ü]+(?:\s+[A-ZÀ-Ü][a-zà-ü]+)*)", text)
+        name_match = _LAWYER_NAME_RE.search(text)
         if name_match:
             lawyer.nom = name_match.group(1)
 
         # Phone
-        phone_match = re.search(r"(?:Tél|Tel|Téléphone)\s*:?\s*((?:\+33|0)[\d\s.]+)", text)
+        phone_match = _PHONE_RE.search(text)
         if phone_match:
             lawyer.telephone = phone_match.group(1).strip()
 
         # Email
-        email_match = re.search(r"([a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,})", text)
+        email_match = _EMAIL_RE.search(text)
         if email_match:
             lawyer.email = email_match.group(1)
 
@@ -104,41 +120,52 @@ class LawyerSiteScraper(BaseScraper):
 
     def find_pdf_links(self, url: str) -> List[Dict[str, str]]:
         """Find all PDF links on a lawyer's page"""
-        soup = self.fetch_page(url)
-        if not soup:
+        content = self.fetch_content(url)
+        if content is None:
             return []
 
         pdfs = []
         base_url = f"{urlparse(url).scheme}://{urlparse(url).netloc}"
 
-        for link in soup.find_all("a", href=True):
-            href = link.get("href", "")
-            text = link.get_text(strip=True).lower()
+        for href, title in self._page_links(content):
+            text = title.lower()
+            href_l = href.lower()
 
             # Check if it's a PDF link
-            if ".pdf" in href.lower():
+            if ".pdf" in href_l:
                 full_url = urljoin(base_url, href)
                 pdfs.append({
                     "url": full_url,
-                    "title": link.get_text(strip=True),
-                    "type": self._classify_document(text, href)
+                    "title": title,
+                    "type": self._classify_document(text, href_l)
                 })
 
             # Check for links that might lead to PDFs
-            elif any(kw in text for kw in ["cahier", "charges", "télécharger", "document", "pv"]):
+            elif any(kw in text for kw in _DOC_LINK_KEYWORDS):
                 pdfs.append({
                     "url": urljoin(base_url, href),
-                    "title": link.get_text(strip=True),
+                    "title": title,
                     "type": "potential_pdf"
                 })
 
         return pdfs
 
-    def _classify_document(self, text: str, href: str) -> str:
-        """Classify document type"""
-        text = text.lower()
-        href = href.lower()
+    def _page_links(self, content: bytes) -> List[Tuple[str, str]]:
+        """(href, stripped link text) of every <a href> in a page, with selectolax when available"""
+        if HAS_SELECTOLAX and SCRAPING.get("use_selectolax", True):
+            try:
+                return [
+                    (node.attributes.get("href") or "", node.text(strip=True))
+                    for node in HTMLParser(content.decode("utf-8")).css("a[href]")
+                ]
+            except Exception as e:
+                logger.debug(f"[LawyerSites] selectolax failed, using BeautifulSoup: {e}")
 
+        soup = BeautifulSoup(content, "lxml")
+        return [(link.get("href", ""), link.get_text(strip=True)) for link in soup.find_all("a", href=True)]
+
+    def _classify_document(self, text: str, href: str) -> str:
+        """Classify document type (text and href already lowercased)"""
         if "cahier" in text or "cahier" in href or "charges" in text:
             return "cahier_charges"
         elif "pv" in text or "proces" in text or "verbal" in text:
@@ -153,7 +180,8 @@ class LawyerSiteScraper(BaseScraper):
         if not lawyer.site_web:
             return []
 
-        all_pdfs = []
+        unique_pdfs = []
+        seen_urls = set()
         visited = set()
 
         # Start from the main site
@@ -179,16 +207,11 @@ class LawyerSiteScraper(BaseScraper):
             visited.add(page_url)
 
             logger.debug(f"[LawyerSites] Checking {page_url}")
-            pdfs = self.find_pdf_links(page_url)
-            all_pdfs.extend(pdfs)
-
-        # Remove duplicates
-        seen_urls = set()
-        unique_pdfs = []
-        for pdf in all_pdfs:
-            if pdf["url"] not in seen_urls:
-                seen_urls.add(pdf["url"])
-                unique_pdfs.append(pdf)
+            # Keep the first occurrence of each document URL
+            for pdf in self.find_pdf_links(page_url):
+                if pdf["url"] not in seen_urls:
+                    seen_urls.add(pdf["url"])
+                    unique_pdfs.append(pdf)
 
         logger.info(f"[LawyerSites] Found {len(unique_pdfs)} documents on {lawyer.site_web}")
         return unique_pdfs
@@ -209,6 +232,14 @@ class LawyerSiteScraper(BaseScraper):
             return str(save_path)
         return None
 
+    def download_documents(self, urls: List[str], save_dir: Path, max_concurrency: int = 5) -> List[Optional[str]]:
+        """Download several documents in parallel, returning the saved paths in urls order"""
+        if not urls:
+            return []
+
+        with ThreadPoolExecutor(max_workers=max(1, min(max_concurrency, len(urls)))) as executor:
+            return list(executor.map(lambda url: self.download_document(url, save_dir), urls))
+
     def match_document_to_auction(
         self,
         documents: List[Dict[str, str]],
@@ -295,8 +326,6 @@ Cordialement,
         mise_a_prix: float
     ) -> str:
         """Generate mailto: link for easy email sending"""
-        import urllib.parse
-
         email_data = self.generate_request_email(
             lawyer, adresse, date_vente, tribunal, mise_a_prix
         )
@@ -2,14 +2,263 @@
 Scraper for Licitor.com - Judicial real estate auctions
 """
 import re
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from datetime import datetime, date
 from typing import List, Optional, Dict, Any
+import soupsieve
 from bs4 import BeautifulSoup
 from loguru import logger
 
 from .base_scraper import BaseScraper
+from ._text import PRICE_CHARS
+from config.settings import SCRAPING
 from src.storage.models import Auction, Lawyer, PropertyType, AuctionStatus, PVStatus
 
+try:
+    import re2
+    HAS_RE2 = True
+except ImportError:
+    HAS_RE2 = False
+
+# Linear-time (RE2) engine for plain keyword alternations, when installed. The
+# lookahead-based multi-pattern scans (_ADDRESS_RE, _CITY_RE, ...) need the re module
+_compile_keywords = re2.compile if HAS_RE2 else re.compile
+
+# Patterns compiled once at import (parse_auction_detail runs them on every auction page)
+_SOURCE_ID_RE = re.compile(r"/annonce/(\d+)/")
+_WS_RE = re.compile(r"\s+")
+# Start of the lawyer section ("Maître", "Avocat", "Cabinet", ...)
+_LAWYER_MARKER_RE = _compile_keywords(r"Maîtres? |Maitres? |Avocat|Cabinet |AARPI |SCP |SELARL ")
+
+_ADDRESS_PATTERNS = (
+    # Specific patterns for property addresses (with "à" or "situé")
+    re.compile(r"(\d+[,\s]+(?:chemin|ch\.|rue|avenue|av\.|boulevard|bd\.|allée|all\.|impasse|imp\.|cours|route|rte\.)\s+[^,\n]{5,80})\s*(?:à|,)", re.IGNORECASE),
+    # Address with street name (exclude "place" which causes false positives with "Visite sur place")
+    re.compile(r"(\d+[,\s]+(?:chemin|ch\.|rue|avenue|av\.|boulevard|bd\.|allée|all\.|impasse|imp\.|cours|route|rte\.)[^,\n\d]{5,60})", re.IGNORECASE),
+    # Place with proper name (e.g., "place Ronde", "place de la Liberté")
+    re.compile(r"(\d+[,\s]+place\s+(?:de\s+(?:la\s+)?)?[A-ZÀ-Ü][a-zà-ü]+[^,\n]{0,40})", re.IGNORECASE),
+    # Street name without number
+    re.compile(r"((?:chemin|ch\.|rue|avenue|av\.|boulevard|bd\.|allée|all\.|impasse|imp\.|cours|route|rte\.)\s+(?:de\s+|du\s+|des\s+)?[A-ZÀ-Ü][^,\n]{5,60})", re.IGNORECASE),
+)
+# The four address patterns in one scan: a zero-width match at each position records the
+# first pattern matching there (group i + 1 = _ADDRESS_PATTERNS[i]). Only patterns 1 and 2
+# can match at the same position (3 needs "place", 4 starts with a letter)
+_ADDRESS_RE = re.compile(
+    "(?=" + "|".join(f"(?:{pattern.pattern})" for pattern in _ADDRESS_PATTERNS) + ")",
+    re.IGNORECASE
+)
+# Candidate addresses that are really a lawyer address or a visit date, one alternation
+_INVALID_ADDRESS_RE = re.compile(
+    r"Tél|Tel|Fax"  # Phone/fax
+    r"|\d{2}[\s\.]\d{2}[\s\.]\d{2}[\s\.]\d{2}"  # Phone number
+    r"|lundi|mardi|mercredi|jeudi|vendredi|samedi|dimanche"  # Day names
+    r"|janvier|février|mars|avril|mai|juin|juillet|août|septembre|octobre|novembre|décembre"  # Month names
+    r"|\d{1,2}h\d{0,2}\s*à",  # Time patterns
+    re.IGNORECASE
+)
+_DESCRIPTION_LOCATION_RE = re.compile(
+    r"(?:Un|Une|Le|La)\s+(?:appartement|maison|local|terrain|parking)[^.]*?(?:à|situé|sis)\s+([^,\n.]{10,80})",
+    re.IGNORECASE
+)
+_INVALID_LOCATION_RE = re.compile(r"Licitor|n°\d+|mise à prix|Bouches-du-Rhône|Var", re.IGNORECASE)
+_URL_CITY_PATTERNS = (
+    re.compile(r"/([a-z\-]+)(?:-(\d+)(?:eme|er)?)?/var/", re.IGNORECASE),
+    re.compile(r"/([a-z\-]+)(?:-(\d+)(?:eme|er)?)?/bouches-du-rhone/", re.IGNORECASE),
+    re.compile(r"/(marseille|aix|toulon)[^/]*-(\d+)(?:eme|er)?/", re.IGNORECASE),
+)
+_POSTAL_CODE_RE = re.compile(r"\b(13\d{3}|83\d{3})\b")
+
+# Known cities in our regions with their postal codes
+CITIES_POSTAL = {
+    # Bouches-du-Rhône (13)
+    "marseille": "13000", "aix-en-provence": "13100", "aix en provence": "13100",
+    "aubagne": "13400", "martigues": "13500", "arles": "13200", "istres": "13800",
+    "salon-de-provence": "13300", "salon de provence": "13300", "vitrolles": "13127",
+    "la ciotat": "13600", "gardanne": "13120", "miramas": "13140", "tarascon": "13150",
+    "marignane": "13700", "cassis": "13260", "port-de-bouc": "13110",
+    # Var (83)
+    "toulon": "83000", "la seyne-sur-mer": "83500", "la seyne sur mer": "83500",
+    "hyères": "83400", "hyeres": "83400", "fréjus": "83600", "frejus": "83600",
+    "draguignan": "83300", "six-fours-les-plages": "83140", "six fours les plages": "83140",
+    "la garde": "83130", "sanary-sur-mer": "83110", "sanary sur mer": "83110",
+    "bandol": "83150", "ollioules": "83190", "la valette-du-var": "83160",
+    "saint-raphaël": "83700", "saint raphael": "83700", "brignoles": "83170",
+    "le pradet": "83220", "carqueiranne": "83320", "la crau": "83260",
+    "solliès-pont": "83210", "sollies pont": "83210", "cogolin": "83310",
+    "sainte-maxime": "83120", "le lavandou": "83980", "bormes-les-mimosas": "83230",
+    "carcès": "83570", "carces": "83570",
+}
+_CITY_NAMES = tuple(CITIES_POSTAL)
+
+
+def _normalize_city(name: str) -> str:
+    """Lowercase city name with hyphens as spaces and whitespace collapsed"""
+    return " ".join(name.lower().replace("-", " ").split())
+
+
+# CITIES_POSTAL keyed by normalized name, so hyphenated and spaced spellings
+# (including mixed ones like "la valette-du-var") resolve with one lookup
+_CITY_LOOKUP = {_normalize_city(name): postal for name, postal in CITIES_POSTAL.items()}
+# Every known city name in one pass: a zero-width match at each word start records the
+# city found there, with one group per name (group i + 1 = _CITY_NAMES[i]). Alternatives
+# follow CITIES_POSTAL order, so a position matching two names reports the earlier one.
+_CITY_RE = re.compile(
+    r"\b(?=(?:" + "|".join(f"({re.escape(name)})" for name in _CITY_NAMES) + r")\b)",
+    re.IGNORECASE
+)
+
+# Property details
+# Property type keywords (plain substrings of the lowercased text, e.g. "t2" also
+# hits "t2bis"), in priority order
+_PROPERTY_TYPE_KEYWORDS = (
+    (PropertyType.APPARTEMENT, ("appartement", "appart", "studio", "f1", "f2", "f3", "f4", "f5", "t1", "t2", "t3", "t4", "t5")),
+    (PropertyType.MAISON, ("maison", "villa", "pavillon")),
+    (PropertyType.LOCAL_COMMERCIAL, ("local commercial", "commerce", "boutique", "bureau")),
+    (PropertyType.TERRAIN, ("terrain", "parcelle")),
+    (PropertyType.PARKING, ("parking", "garage", "box")),
+)
+_SURFACE_RE = re.compile(r"(\d+(?:[.,]\d+)?)\s*m[²2]", re.IGNORECASE)
+_PIECES_RE = re.compile(r"(\d+)\s*(?:pièces?|p\.)", re.IGNORECASE)
+_CHAMBRES_RE = re.compile(r"(\d+)\s*(?:chambres?|ch\.)", re.IGNORECASE)
+
+_SALE_DATE_PATTERNS = (
+    re.compile(r"(?:vente|adjudication|audience)\s+(?:le\s+)?(\d{1,2}(?:er)?\s+\w+\s+\d{4})", re.IGNORECASE),
+    re.compile(r"(\d{1,2}(?:er)?\s+\w+\s+\d{4})\s+à\s+\d{1,2}h", re.IGNORECASE),
+    re.compile(r"le\s+(\d{1,2}/\d{1,2}/\d{4})", re.IGNORECASE),
+)
+_DATE_SLASH_RE = re.compile(r"(\d{1,2})/(\d{1,2})/(\d{4})")
+_DATE_FR_RE = re.compile(r"(\d{1,2})(?:er)?\s+(\w+)\s+(\d{4})")
+_MONTHS_FR = {
+    "janvier": 1, "février": 2, "mars": 3, "avril": 4,
+    "mai": 5, "juin": 6, "juillet": 7, "août": 8,
+    "septembre": 9, "octobre": 10, "novembre": 11, "décembre": 12
+}
+_SALE_TIME_RE = re.compile(r"à\s+(\d{1,2})\s*[hH]\s*(\d{0,2})?")
+# Visit dates - Licitor format: "Visite sur place lundi 29 décembre 2025 de 14h à 15h"
+_VISIT_PATTERNS = (
+    # Main Licitor format: "Visite sur place [jour] [date] [mois] [année] de [heure] à [heure]"
+    re.compile(r"[Vv]isite\s+(?:sur\s+place\s+)?(?:\w+\s+)?(\d{1,2}(?:er)?\s+\w+\s+\d{4})\s+de\s+(\d{1,2})[hH](?:\d{0,2})?\s*(?:à|-)?\s*(\d{1,2})?[hH]?", re.IGNORECASE),
+    # Alternative: "Visite le [date]"
+    re.compile(r"[Vv]isite[s]?\s+(?:le[s]?\s+)?(\d{1,2}(?:er)?\s+\w+\s+\d{4})", re.IGNORECASE),
+    # With time: "Visite le [date] à [heure]"
+    re.compile(r"[Vv]isite[s]?\s+(?:le[s]?\s+)?(\d{1,2}(?:er)?\s+\w+\s+\d{4})\s+à\s+(\d{1,2})[hH]", re.IGNORECASE),
+    # Date format DD/MM/YYYY
+    re.compile(r"[Vv]isite[s]?\s*:?\s*(\d{1,2}/\d{1,2}/\d{4})", re.IGNORECASE),
+)
+
+_PRICE_TEXT_RE = re.compile(r"mise\s+[àa]\s+prix\s*:?\s*([\d\s]+)\s*(?:€|euros?)", re.IGNORECASE)
+
+
+# Lawyer details
+_LAWYER_NAME_PATTERNS = (
+    re.compile(r"(?:Maître|Me|Mtre)\s+([A-ZÀ-Ü][a-zà-ü]+(?:[- ][A-ZÀ-Ü][a-zà-ü]+)*)"),
+    re.compile(r"(?:Cabinet|SCP|SELARL)\s+([A-ZÀ-Ü][^,\n]{3,50})"),
+    re.compile(r"Avocat\s*:\s*([A-ZÀ-Ü][^,\n]{3,50})"),
+)
+_PHONE_LABEL_RE = re.compile(r"(?:Tél\.?|Tel\.?|Téléphone)\s*:?\s*([\d\s\.]+)")
+_PHONE_NUMBER_RE = re.compile(r"(0[1-9][\s\.]?\d{2}[\s\.]?\d{2}[\s\.]?\d{2}[\s\.]?\d{2})")
+_MAILTO_RE = re.compile(r"mailto:")
+_CABINET_RE = re.compile(r"(?:AARPI|SCP|SELARL|Cabinet)\s+([^,\n]+)")
+_LAWYER_ADDRESS_RE = re.compile(r"(\d+[,\s]+(?:rue|avenue|boulevard|cours|place)[^-\n]{5,80}[-\s]+\d{5}\s+\w+)", re.IGNORECASE)
+# CSS selectors of the detail and date pages, compiled once
+_SEL_DESCRIPTION = soupsieve.compile(".description, .detail-bien, .annonce-description")
+_PRICE_FIELD_SELECTORS = (".mise-a-prix", ".prix", ".price", "[data-price]", ".montant")
+# All price fields in one tree walk; _SEL_PRICE_FIELDS then ranks them by selector priority
+_SEL_PRICE = soupsieve.compile(", ".join(_PRICE_FIELD_SELECTORS))
+_SEL_PRICE_FIELDS = tuple(soupsieve.compile(selector) for selector in _PRICE_FIELD_SELECTORS)
+_SEL_LAWYER = soupsieve.compile(".avocat, .cabinet, .vendeur, [class*='avocat'], [class*='lawyer']")
+_AUCTION_LINKS_XPATH = "//a[contains(@href, '/annonce/')]/@href"
+_SEL_PDF_LINK = soupsieve.compile("a[href*='pdf' i]")
+_ME_NAME_RE = re.compile(r"(?:Maître|Me)\s+([A-ZÀ-Ü][a-zà-ü]+(?:\s+[A-ZÀ-Ü][a-zà-ü]+)*)")
+
+
+@lru_cache(maxsize=2048)
+def _parse_french_date(date_str: str) -> Optional[date]:
+    """Parse French date string to date object (memoized: the same dates recur across a tribunal's pages)"""
+    # The two formats are exclusive: DD/MM/YYYY has its "/" right after the day
+    # digits, where "15 janvier 2024" needs a space, so only one pattern is tried
+    if "/" in date_str[:3]:
+        # Try DD/MM/YYYY format
+        match = _DATE_SLASH_RE.match(date_str)
+        if match:
+            day, month, year = map(int, match.groups())
+            try:
+                return date(year, month, day)
+            except ValueError:
+                pass
+        return None
+
+    # Try "15 janvier 2024" format
+    match = _DATE_FR_RE.match(date_str)
+    if match:
+        day = int(match.group(1))
+        month_str = match.group(2).lower()
+        year = int(match.group(3))
+        month = _MONTHS_FR.get(month_str)
+        if month:
+            try:
+                return date(year, month, day)
+            except ValueError:
+                pass
+
+    return None
+
+
+def _clean_address(candidate: str) -> Optional[str]:
+    """Normalized address candidate, or None if it looks like a lawyer address, a visit date or is too short"""
+    addr = candidate.strip()
+    # Verify this is NOT a lawyer address or a visit date
+    if _INVALID_ADDRESS_RE.search(addr):
+        return None
+    # Clean up the address
+    addr = _WS_RE.sub(" ", addr).strip()
+    # Don't take very short addresses
+    return addr if len(addr) > 10 else None
+
+
+def _find_address(text: str) -> Optional[str]:
+    """First valid address: leftmost match of the first _ADDRESS_PATTERNS pattern that gives one"""
+    first_hits = {}
+    for match in _ADDRESS_RE.finditer(text):
+        index = match.lastindex - 1
+        first_hits.setdefault(index, match.group(index + 1))
+        if index == 0:
+            break
+
+    if 0 in first_hits:
+        addr = _clean_address(first_hits[0])
+        if addr:
+            return addr
+        # Rare path: pattern 2 may start where pattern 1 matched (and be hidden by it)
+        for pattern in _ADDRESS_PATTERNS[1:]:
+            match = pattern.search(text)
+            if match:
+                addr = _clean_address(match.group(1))
+                if addr:
+                    return addr
+        return None
+
+    # No pattern 1 anywhere: the scan saw every pattern's leftmost match
+    for index in range(1, len(_ADDRESS_PATTERNS)):
+        if index in first_hits:
+            addr = _clean_address(first_hits[index])
+            if addr:
+                return addr
+    return None
+
+
+def _first_known_city(text: str) -> Optional[str]:
+    """Known city mentioned in text (as a whole word), earliest in CITIES_POSTAL order"""
+    best = None
+    for match in _CITY_RE.finditer(text):
+        index = match.lastindex - 1
+        if best is None or index < best:
+            best = index
+            if best == 0:
+                break
+    return _CITY_NAMES[best] if best is not None else None
+
 
 class LicitorScraper(BaseScraper):
     """Scraper for licitor.com"""
@@ -21,6 +270,23 @@ class LicitorScraper(BaseScraper):
         "tj-nanterre": "Tribunal Judiciaire de Nanterre",
         "tj-creteil": "Tribunal Judiciaire de Créteil",
     }
+    _TRIBUNAL_NAMES = tuple(TRIBUNAUX.values())
+    # Tribunal mentions (full name or spaced slug, any case) in the page text, one group
+    # per tribunal in TRIBUNAUX order, zero-width so every position reports its mention
+    _TRIBUNAL_RE = re.compile(
+        "(?=" + "|".join(
+            f"({re.escape(name.lower())}|{re.escape(slug.replace('-', ' '))})"
+            for slug, name in TRIBUNAUX.items()
+        ) + ")",
+        re.IGNORECASE
+    )
+
+    # Concurrent HEAD probes when looking for auction date pages, and concurrent
+    # fetch+parse of auction detail pages. Never more workers than the session keeps
+    # keep-alive connections per host, so every request reuses an open TLS connection
+    # instead of handshaking a connection the pool would then discard
+    PROBE_WORKERS = min(20, SCRAPING["pool_maxsize"])
+    DETAIL_WORKERS = min(16, SCRAPING["pool_maxsize"])
 
     def __init__(self):
         super().__init__(
@@ -48,11 +314,8 @@ class LicitorScraper(BaseScraper):
             9: "septembre", 10: "octobre", 11: "novembre", 12: "decembre"
         }
 
-        # Each tribunal has different auction days:
-        # - Marseille: mercredi (Wednesday)
-        # - Aix-en-Provence: lundi (Monday)
-        # - Toulon: jeudi (Thursday)
-        # We'll check all weekdays to be safe
+        # Each tribunal has its own auction days, and none are recorded for the
+        # TRIBUNAUX above: we check all weekdays to be safe
 
         today = date.today()
         urls_to_check = []
@@ -73,19 +336,26 @@ class LicitorScraper(BaseScraper):
             urls_to_check.append(url)
 
         # Verify which URLs actually exist (in parallel for speed)
+        with ThreadPoolExecutor(max_workers=self.PROBE_WORKERS) as executor:
+            exists = list(executor.map(self._url_exists, urls_to_check))
+
         valid_urls = []
-        for url in urls_to_check:
-            try:
-                response = self.session.head(url, timeout=3, allow_redirects=True)
-                if response.status_code == 200:
-                    valid_urls.append(url)
-                    logger.info(f"[Licitor] Found auction date: {url.split('/')[-1]}")
-            except:
-                pass
+        for url, found in zip(urls_to_check, exists):
+            if found:
+                valid_urls.append(url)
+                logger.info(f"[Licitor] Found auction date: {url.split('/')[-1]}")
 
         logger.info(f"[Licitor] Found {len(valid_urls)} valid auction dates for {tribunal_slug}")
         return valid_urls
 
+    def _url_exists(self, url: str) -> bool:
+        """HEAD-probe a URL (True on a 200 response)"""
+        try:
+            response = self.session.head(url, timeout=3, allow_redirects=True)
+            return response.status_code == 200
+        except:
+            return False
+
     def parse_auction_list(self, soup: BeautifulSoup) -> List[Dict[str, Any]]:
         """Parse auction listing page"""
         auctions = []
@@ -143,8 +413,8 @@ class LicitorScraper(BaseScraper):
 
         return data if data.get("url") else None
 
-    def parse_auction_detail(self, url: str) -> Optional[Auction]:
-        """Parse individual auction page"""
+    def parse_auction_detail(self, url: str, tribunal_hint: Optional[str] = None) -> Optional[Auction]:
+        """Parse individual auction page (tribunal_hint, when known from the listing, skips the tribunal scan)"""
         soup = self.fetch_page(url)
         if not soup:
             return None
@@ -154,227 +424,147 @@ class LicitorScraper(BaseScraper):
         auction.url = url
 
         # Extract source ID from URL
-        match = re.search(r"/annonce/(\d+)/", url)
+        match = _SOURCE_ID_RE.search(url)
         if match:
             auction.source_id = match.group(1)
 
+        # Page text, extracted once for all the parsers below
+        text = soup.get_text()
+
         # Parse main content
-        self._parse_location(soup, auction)
-        self._parse_property_details(soup, auction)
-        self._parse_dates(soup, auction)
-        self._parse_price(soup, auction)
-        self._parse_tribunal(soup, auction)
+        self._parse_location(soup, text, auction)
+        self._parse_property_details(soup, text, auction)
+        self._parse_dates(soup, text, auction)
+        self._parse_price(soup, text, auction)
+        if tribunal_hint:
+            auction.tribunal = tribunal_hint
+        else:
+            self._parse_tribunal(soup, text, auction)
         self._parse_pv_link(soup, auction)
-        self._parse_lawyer(soup, auction)
+        self._parse_lawyer(soup, text, auction)
 
         return auction
 
-    def _parse_location(self, soup: BeautifulSoup, auction: Auction):
+    def _parse_location(self, soup: BeautifulSoup, text: str, auction: Auction):
         """Extract location information - IMPORTANT: avoid confusing with lawyer's address"""
-        text = soup.get_text()
-
-        # Split text to get only the property section (BEFORE lawyer section)
-        # Lawyer section typically starts with "Maître", "Avocat", "Cabinet"
-        lawyer_markers = ["Maître ", "Maitre ", "Avocat", "Cabinet ", "AARPI ", "SCP ", "SELARL "]
-        property_text = text
-        for marker in lawyer_markers:
-            if marker in text:
-                idx = text.find(marker)
-                property_text = text[:idx]
-                break
+        # Split text to get only the property section (BEFORE lawyer section),
+        # which starts at the first lawyer marker in the page
+        marker = _LAWYER_MARKER_RE.search(text)
+        property_text = text[:marker.start()] if marker else text
 
         # Look for property address in property section only
         # Pattern 1: "X, chemin/rue de Y" format (common on Licitor)
         # Include abbreviations: av., bd., ch., all., imp.
-        address_patterns = [
-            # Specific patterns for property addresses (with "à" or "situé")
-            r"(\d+[,\s]+(?:chemin|ch\.|rue|avenue|av\.|boulevard|bd\.|allée|all\.|impasse|imp\.|cours|route|rte\.)\s+[^,\n]{5,80})\s*(?:à|,)",
-            # Address with street name (exclude "place" which causes false positives with "Visite sur place")
-            r"(\d+[,\s]+(?:chemin|ch\.|rue|avenue|av\.|boulevard|bd\.|allée|all\.|impasse|imp\.|cours|route|rte\.)[^,\n\d]{5,60})",
-            # Place with proper name (e.g., "place Ronde", "place de la Liberté")
-            r"(\d+[,\s]+place\s+(?:de\s+(?:la\s+)?)?[A-ZÀ-Ü][a-zà-ü]+[^,\n]{0,40})",
-            # Street name without number
-            r"((?:chemin|ch\.|rue|avenue|av\.|boulevard|bd\.|allée|all\.|impasse|imp\.|cours|route|rte\.)\s+(?:de\s+|du\s+|des\s+)?[A-ZÀ-Ü][^,\n]{5,60})",
-        ]
-
-        auction.adresse = None
-        for pattern in address_patterns:
-            match = re.search(pattern, property_text, re.IGNORECASE)
-            if match:
-                addr = match.group(1).strip()
-                # Verify this is NOT a lawyer address or a visit date
-                invalid_patterns = [
-                    r"Tél|Tel|Fax",  # Phone/fax
-                    r"\d{2}[\s\.]\d{2}[\s\.]\d{2}[\s\.]\d{2}",  # Phone number
-                    r"lundi|mardi|mercredi|jeudi|vendredi|samedi|dimanche",  # Day names
-                    r"janvier|février|mars|avril|mai|juin|juillet|août|septembre|octobre|novembre|décembre",  # Month names
-                    r"\d{1,2}h\d{0,2}\s*à",  # Time patterns
-                ]
-                if not any(re.search(p, addr, re.IGNORECASE) for p in invalid_patterns):
-                    # Clean up the address
-                    addr = re.sub(r"\s+", " ", addr).strip()
-                    # Don't take very short addresses
-                    if len(addr) > 10:
-                        auction.adresse = addr
-                        break
+        auction.adresse = _find_address(property_text)
 
         # If still no address, try to extract location from description
         if not auction.adresse:
             # Look for patterns like "Un appartement" followed by location info
-            loc_match = re.search(r"(?:Un|Une|Le|La)\s+(?:appartement|maison|local|terrain|parking)[^.]*?(?:à|situé|sis)\s+([^,\n.]{10,80})", property_text, re.IGNORECASE)
+            loc_match = _DESCRIPTION_LOCATION_RE.search(property_text)
             if loc_match:
                 loc_text = loc_match.group(1).strip()
                 # Don't use page titles or generic text
-                if not re.search(r"Licitor|n°\d+|mise à prix|Bouches-du-Rhône|Var", loc_text, re.IGNORECASE):
+                if not _INVALID_LOCATION_RE.search(loc_text):
                     auction.adresse = loc_text
 
         # If STILL no address and we have ville, just leave adresse as None
         # This is better than using wrong data - the map can use city-level geocoding
 
-        # Known cities in our regions with their postal codes
-        CITIES_POSTAL = {
-            # Bouches-du-Rhône (13)
-            "marseille": "13000", "aix-en-provence": "13100", "aix en provence": "13100",
-            "aubagne": "13400", "martigues": "13500", "arles": "13200", "istres": "13800",
-            "salon-de-provence": "13300", "salon de provence": "13300", "vitrolles": "13127",
-            "la ciotat": "13600", "gardanne": "13120", "miramas": "13140", "tarascon": "13150",
-            "marignane": "13700", "cassis": "13260", "port-de-bouc": "13110",
-            # Var (83)
-            "toulon": "83000", "la seyne-sur-mer": "83500", "la seyne sur mer": "83500",
-            "hyères": "83400", "hyeres": "83400", "fréjus": "83600", "frejus": "83600",
-            "draguignan": "83300", "six-fours-les-plages": "83140", "six fours les plages": "83140",
-            "la garde": "83130", "sanary-sur-mer": "83110", "sanary sur mer": "83110",
-            "bandol": "83150", "ollioules": "83190", "la valette-du-var": "83160",
-            "saint-raphaël": "83700", "saint raphael": "83700", "brignoles": "83170",
-            "le pradet": "83220", "carqueiranne": "83320", "la crau": "83260",
-            "solliès-pont": "83210", "sollies pont": "83210", "cogolin": "83310",
-            "sainte-maxime": "83120", "le lavandou": "83980", "bormes-les-mimosas": "83230",
-            "carcès": "83570", "carces": "83570",
-        }
 
         # Extract city from URL (more patterns)
-        url_city_match = re.search(r"/([a-z\-]+)(?:-(\d+)(?:eme|er)?)?/var/", auction.url, re.IGNORECASE)
-        if not url_city_match:
-            url_city_match = re.search(r"/([a-z\-]+)(?:-(\d+)(?:eme|er)?)?/bouches-du-rhone/", auction.url, re.IGNORECASE)
-        if not url_city_match:
-            url_city_match = re.search(r"/(marseille|aix|toulon)[^/]*-(\d+)(?:eme|er)?/", auction.url, re.IGNORECASE)
+        url_city_match = None
+        for pattern in _URL_CITY_PATTERNS:
+            url_city_match = pattern.search(auction.url)
+            if url_city_match:
+                break
 
         if url_city_match:
             city_slug = url_city_match.group(1).lower().replace("-", " ")
             district = url_city_match.group(2) if len(url_city_match.groups()) > 1 else None
 
             # Check if it's a known city
-            if city_slug in CITIES_POSTAL:
-                auction.ville = city_slug.replace("-", " ").title()
-                auction.code_postal = CITIES_POSTAL[city_slug]
-                auction.department = auction.code_postal[:2]
-            elif city_slug.replace(" ", "-") in CITIES_POSTAL:
-                auction.ville = city_slug.title()
-                auction.code_postal = CITIES_POSTAL[city_slug.replace(" ", "-")]
-                auction.department = auction.code_postal[:2]
+            city_name = _normalize_city(city_slug)
+            postal = _CITY_LOOKUP.get(city_name)
+            if postal:
+                auction.ville = city_name.title()
+                auction.code_postal = postal
+                auction.department = postal[:2]
             elif "marseille" in city_slug:
                 auction.ville = f"Marseille {district}ème" if district else "Marseille"
                 if district:
                     auction.code_postal = f"130{int(district):02d}"
                 auction.department = "13"
 
-        # If still no city, try to find in text
+        # If still no city, try to find in text (first known city in CITIES_POSTAL order)
         if not auction.ville:
-            for city_name, postal in CITIES_POSTAL.items():
-                # Search for city name in property text (case insensitive)
-                if re.search(rf"\b{re.escape(city_name)}\b", property_text, re.IGNORECASE):
-                    auction.ville = city_name.replace("-", " ").title()
-                    auction.code_postal = postal
-                    auction.department = postal[:2]
-                    break
+            city_name = _first_known_city(property_text)
+            if city_name:
+                postal = CITIES_POSTAL[city_name]
+                auction.ville = city_name.replace("-", " ").title()
+                auction.code_postal = postal
+                auction.department = postal[:2]
 
         # Extract postal code from PROPERTY section only (not lawyer's 13006)
         if not auction.code_postal:
-            postal_match = re.search(r"\b(13\d{3}|83\d{3})\b", property_text)
+            postal_match = _POSTAL_CODE_RE.search(property_text)
             if postal_match:
                 auction.code_postal = postal_match.group(1)
                 auction.department = auction.code_postal[:2]
 
-    def _parse_property_details(self, soup: BeautifulSoup, auction: Auction):
+    def _parse_property_details(self, soup: BeautifulSoup, text: str, auction: Auction):
         """Extract property details (type, surface, rooms)"""
-        # Property type
-        type_keywords = {
-            PropertyType.APPARTEMENT: ["appartement", "appart", "studio", "f1", "f2", "f3", "f4", "f5", "t1", "t2", "t3", "t4", "t5"],
-            PropertyType.MAISON: ["maison", "villa", "pavillon"],
-            PropertyType.LOCAL_COMMERCIAL: ["local commercial", "commerce", "boutique", "bureau"],
-            PropertyType.TERRAIN: ["terrain", "parcelle"],
-            PropertyType.PARKING: ["parking", "garage", "box"],
-        }
-
-        text = soup.get_text().lower()
-        for prop_type, keywords in type_keywords.items():
-            if any(kw in text for kw in keywords):
+        # Property type: substring tests on the lowercased text, which stop at the first
+        # type found (case-insensitive regex alternations are an order of magnitude slower)
+        text_lower = text.lower()
+        for prop_type, keywords in _PROPERTY_TYPE_KEYWORDS:
+            if any(kw in text_lower for kw in keywords):
                 auction.type_bien = prop_type
                 break
 
         # Surface
-        surface_match = re.search(r"(\d+(?:[.,]\d+)?)\s*m[²2]", text)
+        surface_match = _SURFACE_RE.search(text)
         if surface_match:
             auction.surface = float(surface_match.group(1).replace(",", "."))
 
         # Number of rooms
-        pieces_match = re.search(r"(\d+)\s*(?:pièces?|p\.)", text)
+        pieces_match = _PIECES_RE.search(text)
         if pieces_match:
             auction.nb_pieces = int(pieces_match.group(1))
 
         # Number of bedrooms
-        chambres_match = re.search(r"(\d+)\s*(?:chambres?|ch\.)", text)
+        chambres_match = _CHAMBRES_RE.search(text)
         if chambres_match:
             auction.nb_chambres = int(chambres_match.group(1))
 
         # Description
-        desc_elem = soup.select_one(".description, .detail-bien, .annonce-description")
+        desc_elem = _SEL_DESCRIPTION.select_one(soup)
         if desc_elem:
             auction.description = desc_elem.get_text(strip=True)[:2000]
 
-    def _parse_dates(self, soup: BeautifulSoup, auction: Auction):
+    def _parse_dates(self, soup: BeautifulSoup, text: str, auction: Auction):
         """Extract sale date, visit dates, judgment date"""
-        text = soup.get_text()
-
         # Sale date patterns
-        date_patterns = [
-            r"(?:vente|adjudication|audience)\s+(?:le\s+)?(\d{1,2}(?:er)?\s+\w+\s+\d{4})",
-            r"(\d{1,2}(?:er)?\s+\w+\s+\d{4})\s+à\s+\d{1,2}h",
-            r"le\s+(\d{1,2}/\d{1,2}/\d{4})"
-        ]
-
-        for pattern in date_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in _SALE_DATE_PATTERNS:
+            match = pattern.search(text)
             if match:
                 date_str = match.group(1)
-                auction.date_vente = self._parse_french_date(date_str)
+                auction.date_vente = _parse_french_date(date_str)
                 if auction.date_vente:
                     break
 
         # Sale time
-        time_match = re.search(r"à\s+(\d{1,2})\s*[hH]\s*(\d{0,2})?", text)
+        time_match = _SALE_TIME_RE.search(text)
         if time_match:
             hour = time_match.group(1)
             minute = time_match.group(2) or "00"
             auction.heure_vente = f"{hour}h{minute}"
 
-        # Visit dates - Licitor format: "Visite sur place lundi 29 décembre 2025 de 14h à 15h"
-        visit_patterns = [
-            # Main Licitor format: "Visite sur place [jour] [date] [mois] [année] de [heure] à [heure]"
-            r"[Vv]isite\s+(?:sur\s+place\s+)?(?:\w+\s+)?(\d{1,2}(?:er)?\s+\w+\s+\d{4})\s+de\s+(\d{1,2})[hH](?:\d{0,2})?\s*(?:à|-)?\s*(\d{1,2})?[hH]?",
-            # Alternative: "Visite le [date]"
-            r"[Vv]isite[s]?\s+(?:le[s]?\s+)?(\d{1,2}(?:er)?\s+\w+\s+\d{4})",
-            # With time: "Visite le [date] à [heure]"
-            r"[Vv]isite[s]?\s+(?:le[s]?\s+)?(\d{1,2}(?:er)?\s+\w+\s+\d{4})\s+à\s+(\d{1,2})[hH]",
-            # Date format DD/MM/YYYY
-            r"[Vv]isite[s]?\s*:?\s*(\d{1,2}/\d{1,2}/\d{4})",
-        ]
-
-        for pattern in visit_patterns:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
-            for match in matches:
+        # Visit dates
+        seen_visits = set(auction.dates_visite)
+        for pattern in _VISIT_PATTERNS:
+            for match in pattern.finditer(text):
                 date_str = match.group(1)
-                parsed_date = self._parse_french_date(date_str)
+                parsed_date = _parse_french_date(date_str)
                 if parsed_date:
                     # Extract time if available
                     hour = 14  # Default to 14h
@@ -386,53 +576,19 @@ class LicitorScraper(BaseScraper):
                             pass
 
                     visit_datetime = datetime(parsed_date.year, parsed_date.month, parsed_date.day, hour, minute)
-                    if visit_datetime not in auction.dates_visite:
+                    if visit_datetime not in seen_visits:
+                        seen_visits.add(visit_datetime)
                         auction.dates_visite.append(visit_datetime)
 
             if auction.dates_visite:
                 break
 
-    def _parse_french_date(self, date_str: str) -> Optional[date]:
-        """Parse French date string to date object"""
-        months = {
-            "janvier": 1, "février": 2, "mars": 3, "avril": 4,
-            "mai": 5, "juin": 6, "juillet": 7, "août": 8,
-            "septembre": 9, "octobre": 10, "novembre": 11, "décembre": 12
-        }
-
-        # Try DD/MM/YYYY format
-        match = re.match(r"(\d{1,2})/(\d{1,2})/(\d{4})", date_str)
-        if match:
-            day, month, year = map(int, match.groups())
-            try:
-                return date(year, month, day)
-            except ValueError:
-                pass
-
-        # Try "15 janvier 2024" format
-        match = re.match(r"(\d{1,2})(?:er)?\s+(\w+)\s+(\d{4})", date_str)
-        if match:
-            day = int(match.group(1))
-            month_str = match.group(2).lower()
-            year = int(match.group(3))
-            month = months.get(month_str)
-            if month:
-                try:
-                    return date(year, month, day)
-                except ValueError:
-                    pass
-
-        return None
-
-    def _parse_price(self, soup: BeautifulSoup, auction: Auction):
+    def _parse_price(self, soup: BeautifulSoup, text: str, auction: Auction):
         """Extract mise à prix"""
-        price_selectors = [
-            ".mise-a-prix", ".prix", ".price",
-            "[data-price]", ".montant"
-        ]
-
-        for selector in price_selectors:
-            elem = soup.select_one(selector)
+        candidates = _SEL_PRICE.select(soup)
+        for selector in _SEL_PRICE_FIELDS if candidates else ():
+            # First element (in page order) matching this selector
+            elem = next((candidate for candidate in candidates if selector.match(candidate)), None)
             if elem:
                 price = self._extract_price_value(elem.get_text())
                 if price:
@@ -441,17 +597,15 @@ class LicitorScraper(BaseScraper):
 
         # Try from text
         if not auction.mise_a_prix:
-            text = soup.get_text()
-            match = re.search(r"mise\s+[àa]\s+prix\s*:?\s*([\d\s]+)\s*(?:€|euros?)", text, re.IGNORECASE)
+            match = _PRICE_TEXT_RE.search(text)
             if match:
                 auction.mise_a_prix = self._extract_price_value(match.group(1))
 
     def _extract_price_value(self, text: str) -> Optional[float]:
         """Extract numeric price from text"""
-        # Remove spaces and non-numeric characters except comma/dot
-        cleaned = re.sub(r"[^\d,.]", "", text.replace(" ", ""))
+        # Remove spaces and non-numeric characters except comma/dot, in one translate pass
         # Handle French number format (1.000,00 or 1 000,00)
-        cleaned = cleaned.replace(",", ".")
+        cleaned = text.translate(PRICE_CHARS).replace(",", ".")
         if cleaned.count(".") > 1:
             # Multiple dots = thousand separator
             parts = cleaned.rsplit(".", 1)
@@ -462,77 +616,67 @@ class LicitorScraper(BaseScraper):
         except ValueError:
             return None
 
-    def _parse_tribunal(self, soup: BeautifulSoup, auction: Auction):
+    def _parse_tribunal(self, soup: BeautifulSoup, text: str, auction: Auction):
         """Extract tribunal information"""
-        text = soup.get_text()
-        for slug, name in self.TRIBUNAUX.items():
-            if name.lower() in text.lower() or slug.replace("-", " ") in text.lower():
-                auction.tribunal = name
-                break
+        # First tribunal in TRIBUNAUX order mentioned anywhere in the text
+        best = None
+        for match in self._TRIBUNAL_RE.finditer(text):
+            index = match.lastindex - 1
+            if best is None or index < best:
+                best = index
+                if best == 0:
+                    break
+        if best is not None:
+            auction.tribunal = self._TRIBUNAL_NAMES[best]
 
     def _parse_pv_link(self, soup: BeautifulSoup, auction: Auction):
         """Extract link to PV or cahier des charges"""
-        pdf_patterns = [
-            "cahier", "charge", "pv", "procès", "verbal",
-            "document", "telecharger", "pdf"
-        ]
-
-        for link in soup.find_all("a", href=True):
-            href = link.get("href", "").lower()
-            text = link.get_text().lower()
-
-            if any(p in href or p in text for p in pdf_patterns):
-                if ".pdf" in href or "pdf" in href:
-                    auction.pv_url = href if href.startswith("http") else f"{self.base_url}{href}"
-                    auction.pv_status = PVStatus.A_TELECHARGER
-                    break
+        # First link whose href mentions "pdf" (which is itself one of the cahier/pv/document
+        # keywords, so the keyword test always held for these links)
+        link = _SEL_PDF_LINK.select_one(soup)
+        if link:
+            href = link["href"].lower()
+            auction.pv_url = href if href.startswith("http") else f"{self.base_url}{href}"
+            auction.pv_status = PVStatus.A_TELECHARGER
 
         if not auction.pv_url:
             auction.pv_status = PVStatus.A_DEMANDER
 
-    def _parse_lawyer(self, soup: BeautifulSoup, auction: Auction):
+    def _parse_lawyer(self, soup: BeautifulSoup, text: str, auction: Auction):
         """Extract lawyer/cabinet name and contact info from the page"""
-        text = soup.get_text()
-
         # Look for "Maître" or "Me" patterns
-        lawyer_patterns = [
-            r"(?:Maître|Me|Mtre)\s+([A-ZÀ-Ü][a-zà-ü]+(?:[- ][A-ZÀ-Ü][a-zà-ü]+)*)",
-            r"(?:Cabinet|SCP|SELARL)\s+([A-ZÀ-Ü][^,\n]{3,50})",
-            r"Avocat\s*:\s*([A-ZÀ-Ü][^,\n]{3,50})",
-        ]
-
-        for pattern in lawyer_patterns:
-            match = re.search(pattern, text)
+        for pattern in _LAWYER_NAME_PATTERNS:
+            match = pattern.search(text)
             if match:
                 auction.avocat_nom = match.group(1).strip()
                 break
 
         # Also try from specific HTML elements
         if not auction.avocat_nom:
-            lawyer_elem = soup.select_one(".avocat, .cabinet, .vendeur, [class*='avocat'], [class*='lawyer']")
+            lawyer_elem = _SEL_LAWYER.select_one(soup)
             if lawyer_elem:
                 auction.avocat_nom = lawyer_elem.get_text(strip=True)[:100]
 
         # Extract phone number
-        phone_match = re.search(r"(?:Tél\.?|Tel\.?|Téléphone)\s*:?\s*([\d\s\.]+)", text)
+        phone_match = _PHONE_LABEL_RE.search(text)
         if not phone_match:
-            phone_match = re.search(r"(0[1-9][\s\.]?\d{2}[\s\.]?\d{2}[\s\.]?\d{2}[\s\.]?\d{2})", text)
+            phone_match = _PHONE_NUMBER_RE.search(text)
         if phone_match:
             auction.avocat_telephone = phone_match.group(1).strip()
 
         # Extract email
-        email_links = soup.find_all("a", href=re.compile(r"mailto:"))
+        email_links = soup.find_all("a", href=_MAILTO_RE)
         if email_links:
             email = email_links[0].get("href", "").replace("mailto:", "").split("?")[0]
             auction.avocat_email = email
 
         # Extract cabinet/firm name
-        cabinet_match = re.search(r"(?:AARPI|SCP|SELARL|Cabinet)\s+([^,\n]+)", text)
+        cabinet_match = _CABINET_RE.search(text)
         if cabinet_match:
             auction.avocat_cabinet = cabinet_match.group(0).strip()[:100]
 
         # Extract address
-        address_match = re.search(r"(\d+[,\s]+(?:rue|avenue|boulevard|cours|place)[^-\n]{5,80}[-\s]+\d{5}\s+\w+)", text, re.IGNORECASE)
+        address_match = _LAWYER_ADDRESS_RE.search(text)
         if address_match:
             auction.avocat_adresse = address_match.group(1).strip()
 
@@ -573,15 +717,26 @@ class LicitorScraper(BaseScraper):
         # Try extracting from full text if section not found
         if not lawyer.nom:
             text = soup.get_text()
-            me_match = re.search(r"(?:Maître|Me)\s+([A-ZÀ-Ü][a-zà-ü]+(?:\s+[A-ZÀ-Ü][a-zà-ü]+)*)", text)
+            me_match = _ME_NAME_RE.search(text)
             if me_match:
                 lawyer.nom = f"Me {me_match.group(1)}"
 
         return lawyer if lawyer.nom else None
 
+    def find_date_auction_urls(self, date_url: str) -> List[str]:
+        """Absolute URLs of the individual auctions listed on a date page (the page is only read for them)"""
+        return [
+            href if href.startswith("http") else f"{self.base_url}{href}"
+            for href in self.fetch_links(date_url, _AUCTION_LINKS_XPATH)
+        ]
+
     def scrape_all_tribunaux(self) -> List[Auction]:
         """Scrape auctions from all monitored tribunaux"""
-        all_auctions = []
+        # (detail page URL, tribunal name) for every auction listed on a date page
+        detail_pages = []
+        # Auctions already queued, by source ID (or URL when it has none): a listing
+        # carried over to several date pages is fetched and parsed once
+        seen = set()
 
         for slug, name in self.TRIBUNAUX.items():
             logger.info(f"[Licitor] Scraping {name}...")
@@ -591,19 +746,23 @@ class LicitorScraper(BaseScraper):
             logger.info(f"[Licitor] Found {len(auction_urls)} auction dates for {name}")
 
             for url in auction_urls:
-                soup = self.fetch_page(url)
-                if soup:
-                    # Find individual auction links on the date page
-                    auction_links = soup.select("a[href*='/annonce/']")
-                    for link in auction_links:
-                        href = link.get("href", "")
-                        full_url = href if href.startswith("http") else f"{self.base_url}{href}"
-
-                        # Parse the auction detail page
-                        auction = self.parse_auction_detail(full_url)
-                        if auction:
-                            auction.tribunal = name
-                            all_auctions.append(auction)
+                for full_url in self.find_date_auction_urls(url):
+                    match = _SOURCE_ID_RE.search(full_url)
+                    key = match.group(1) if match else full_url
+                    if key in seen:
+                        continue
+                    seen.add(key)
+                    detail_pages.append((full_url, name))
+
+        # Parse the auction detail pages in parallel (results keep the listing order)
+        all_auctions = []
+        with ThreadPoolExecutor(max_workers=self.DETAIL_WORKERS) as executor:
+            auctions = executor.map(
+                lambda page: self.parse_auction_detail(page[0], tribunal_hint=page[1]), detail_pages
+            )
+            for auction in auctions:
+                if auction:
+                    all_auctions.append(auction)
 
         logger.info(f"[Licitor] Total: {len(all_auctions)} auctions scraped")
         return all_auctions
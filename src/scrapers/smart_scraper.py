@@ -3,16 +3,59 @@ Smart scraper using LLM extraction for robust data extraction
 Combines URL discovery from existing scrapers with LLM-based data extraction
 """
 import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, date
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Set
+from urllib.parse import urlsplit, urlunsplit
+from bs4 import UnicodeDammit
 from loguru import logger
 
 from .base_scraper import BaseScraper
 from .licitor import LicitorScraper
 from .encheres_publiques import EncherePubliquesScraper
 from src.storage.models import Auction, PropertyType, AuctionStatus, PVStatus
-from src.extractors.llm_extractor import LLMExtractor, ExtractedAuctionData
-from src.extractors.photo_downloader import PhotoDownloader
+from src.extractors.llm_extractor import ExtractedAuctionData, get_llm_extractor
+from src.extractors.photo_downloader import get_photo_downloader
+
+# LLM type_bien value -> PropertyType
+_PROPERTY_TYPE_MAP = {
+    "appartement": PropertyType.APPARTEMENT,
+    "maison": PropertyType.MAISON,
+    "local_commercial": PropertyType.LOCAL_COMMERCIAL,
+    "terrain": PropertyType.TERRAIN,
+    "parking": PropertyType.PARKING,
+}
+
+
+def _normalize_url(url: str) -> str:
+    """Canonical form of an auction URL for deduplication (lowercase scheme/host, no fragment)"""
+    parts = urlsplit(url)
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path, parts.query, ""))
+
+
+def _claim_url(url: str, seen: Set[str]) -> bool:
+    """True the first time a (normalized) URL is met in seen, False for repeats"""
+    key = _normalize_url(url)
+    if key in seen:
+        return False
+    seen.add(key)
+    return True
+
+
+def _parse_iso_date(value: str) -> Optional[date]:
+    """ISO date string -> date, None if malformed"""
+    try:
+        return date.fromisoformat(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _parse_iso_datetime(value: str) -> Optional[datetime]:
+    """ISO datetime string -> datetime, None if malformed"""
+    try:
+        return datetime.fromisoformat(value)
+    except (TypeError, ValueError):
+        return None
 
 
 class SmartScraper:
@@ -34,11 +77,16 @@ class SmartScraper:
     - Self-documenting with confidence scores
     """
 
+    # Auction pages fetched and extracted concurrently (each is a page fetch plus an LLM call);
+    # page fetches still go through the owning scraper's request spacing
+    SCRAPE_WORKERS = 10
+
     def __init__(
         self,
         api_key: Optional[str] = None,
         use_llm: bool = True,
-        download_photos: bool = True
+        download_photos: bool = True,
+        batch_llm: bool = False
     ):
         """
         Initialize smart scraper
@@ -47,89 +95,72 @@ class SmartScraper:
             api_key: Anthropic API key (uses env var if not provided)
             use_llm: Whether to use LLM extraction (falls back to regex if False)
             download_photos: Whether to download photos locally
+            batch_llm: Extract pages through the Message Batches API (half the cost, but
+                results may take hours - for bulk/nightly scrapes)
         """
         self.api_key = api_key or os.environ.get("ANTHROPIC_API_KEY")
         self.use_llm = use_llm and bool(self.api_key)
         self.download_photos = download_photos
+        self.batch_llm = batch_llm
 
         # Initialize components
         self.licitor = LicitorScraper()
         self.encheres_publiques = EncherePubliquesScraper()
 
+        # One keep-alive connection pool for every page request of this smart scraper (the
+        # shared LLM extractor and photo downloader keep their own process-wide session)
+        self.session = self.licitor.session
+        self.encheres_publiques.session.close()
+        self.encheres_publiques.session = self.session
+
         if self.use_llm:
-            self.llm_extractor = LLMExtractor(api_key=self.api_key)
+            self.llm_extractor = get_llm_extractor(self.api_key)
             logger.info("[SmartScraper] LLM extraction enabled")
         else:
             self.llm_extractor = None
             logger.warning("[SmartScraper] LLM extraction disabled - using regex fallback")
 
         if self.download_photos:
-            self.photo_downloader = PhotoDownloader()
+            self.photo_downloader = get_photo_downloader()
             logger.info("[SmartScraper] Photo download enabled")
         else:
             self.photo_downloader = None
 
     def _convert_extracted_to_auction(self, extracted: ExtractedAuctionData, url: str, source: str) -> Auction:
         """Convert LLM extracted data to Auction model"""
-        auction = Auction()
-        auction.source = source
-        auction.url = url
-
-        # Location
-        auction.adresse = extracted.adresse
-        auction.code_postal = extracted.code_postal
-        auction.ville = extracted.ville
-        auction.department = extracted.department
-
-        # Property type mapping
-        type_map = {
-            "appartement": PropertyType.APPARTEMENT,
-            "maison": PropertyType.MAISON,
-            "local_commercial": PropertyType.LOCAL_COMMERCIAL,
-            "terrain": PropertyType.TERRAIN,
-            "parking": PropertyType.PARKING,
-        }
-        auction.type_bien = type_map.get(extracted.type_bien, PropertyType.AUTRE)
-
-        # Property details
-        auction.surface = extracted.surface
-        auction.nb_pieces = extracted.nb_pieces
-        auction.nb_chambres = extracted.nb_chambres
-        auction.etage = extracted.etage
-        auction.description = extracted.description
-        auction.occupation = extracted.occupation
-
-        # Auction details
-        auction.mise_a_prix = extracted.mise_a_prix
-        auction.tribunal = extracted.tribunal
-
-        # Parse sale date
-        if extracted.date_vente:
-            try:
-                auction.date_vente = date.fromisoformat(extracted.date_vente)
-            except:
-                pass
-
-        auction.heure_vente = extracted.heure_vente
-
-        # Parse visit dates
-        if extracted.dates_visite:
-            for dt_str in extracted.dates_visite:
-                try:
-                    dt = datetime.fromisoformat(dt_str)
-                    auction.dates_visite.append(dt)
-                except:
-                    pass
-
-        # Lawyer info
-        auction.avocat_nom = extracted.avocat_nom
-        auction.avocat_cabinet = extracted.avocat_cabinet
-        auction.avocat_telephone = extracted.avocat_telephone
-        auction.avocat_email = extracted.avocat_email
-        auction.avocat_adresse = extracted.avocat_adresse
-
-        # Documents
-        auction.photos = extracted.photos or []
+        auction = Auction(
+            source=source,
+            url=url,
+            # Location
+            adresse=extracted.adresse,
+            code_postal=extracted.code_postal,
+            ville=extracted.ville,
+            department=extracted.department,
+            # Property details
+            type_bien=_PROPERTY_TYPE_MAP.get(extracted.type_bien, PropertyType.AUTRE),
+            surface=extracted.surface,
+            nb_pieces=extracted.nb_pieces,
+            nb_chambres=extracted.nb_chambres,
+            etage=extracted.etage,
+            description=extracted.description,
+            occupation=extracted.occupation,
+            # Auction details
+            mise_a_prix=extracted.mise_a_prix,
+            tribunal=extracted.tribunal,
+            date_vente=_parse_iso_date(extracted.date_vente) if extracted.date_vente else None,
+            heure_vente=extracted.heure_vente,
+            # Per-item fromisoformat: a page lists a handful of visits, below the ~10 dates where
+            # a vectorised numpy datetime64 parse breaks even (and it would drop UTC offsets)
+            dates_visite=[dt for dt in map(_parse_iso_datetime, extracted.dates_visite or ()) if dt is not None],
+            # Lawyer info
+            avocat_nom=extracted.avocat_nom,
+            avocat_cabinet=extracted.avocat_cabinet,
+            avocat_telephone=extracted.avocat_telephone,
+            avocat_email=extracted.avocat_email,
+            avocat_adresse=extracted.avocat_adresse,
+            # Documents
+            photos=extracted.photos or [],
+        )
 
         if extracted.documents:
             auction.documents = extracted.documents
@@ -155,28 +186,51 @@ class SmartScraper:
 
         if self.use_llm and self.llm_extractor:
             # Use LLM extraction
-            extracted = self.llm_extractor.extract_from_url(url)
+            html = self._fetch_html(url, source)
+            extracted = self.llm_extractor.extract(html, url) if html is not None else None
 
             if extracted:
-                auction = self._convert_extracted_to_auction(extracted, url, source)
+                return self._auction_from_extracted(extracted, url, source)
+            else:
+                logger.warning(f"[SmartScraper] LLM extraction failed, falling back to regex")
 
-                # Log confidence
-                if extracted.confidence < 0.7:
-                    logger.warning(f"[SmartScraper] Low confidence ({extracted.confidence:.0%}): {url}")
-                    if extracted.extraction_notes:
-                        for note in extracted.extraction_notes:
-                            logger.warning(f"  - {note}")
+        return self._scrape_with_regex(url, source)
 
-                # Download photos if enabled
-                if self.download_photos and self.photo_downloader and extracted.photos:
-                    # We'll need auction ID after saving - for now store URLs
-                    pass
+    def _auction_from_extracted(self, extracted: ExtractedAuctionData, url: str, source: str) -> Auction:
+        """Auction for LLM extracted data, logging low-confidence extractions"""
+        auction = self._convert_extracted_to_auction(extracted, url, source)
 
-                return auction
-            else:
-                logger.warning(f"[SmartScraper] LLM extraction failed, falling back to regex")
+        # Log confidence
+        if extracted.confidence < 0.7:
+            logger.warning(f"[SmartScraper] Low confidence ({extracted.confidence:.0%}): {url}")
+            if extracted.extraction_notes:
+                for note in extracted.extraction_notes:
+                    logger.warning(f"  - {note}")
+
+        # Download photos if enabled
+        if self.download_photos and self.photo_downloader and extracted.photos:
+            # We'll need auction ID after saving - for now store URLs
+            pass
 
-        # Fallback to regex-based scraper
+        return auction
+
+    def _owning_scraper(self, url: str, source: str) -> BaseScraper:
+        """Scraper of the site serving url (Licitor unless it is an encheres-publiques page)"""
+        if "licitor" in url or "licitor" in source:
+            return self.licitor
+        if "encheres-publiques" in url or "encheres_publiques" in source:
+            return self.encheres_publiques
+        return self.licitor
+
+    def _fetch_html(self, url: str, source: str) -> Optional[str]:
+        """Fetch an auction page through its scraper's throttled fetch_content, None on failure"""
+        content = self._owning_scraper(url, source).fetch_content(url)
+        if content is None:
+            return None
+        return UnicodeDammit(content, is_html=True).unicode_markup
+
+    def _scrape_with_regex(self, url: str, source: str) -> Optional[Auction]:
+        """Fallback to regex-based scraper"""
         if "licitor" in url or "licitor" in source:
             return self.licitor.parse_auction_detail(url)
         elif "encheres-publiques" in url or "encheres_publiques" in source:
@@ -188,9 +242,50 @@ class SmartScraper:
                 auction = self.encheres_publiques.parse_auction_detail(url)
             return auction
 
-    def scrape_licitor(self) -> List[Auction]:
-        """Scrape all auctions from Licitor using smart extraction"""
+    def _scrape_urls(self, urls: List[str], source: str) -> List[Optional[Auction]]:
+        """Scrape several auction URLs in parallel, returning results in urls order"""
+        if not urls:
+            return []
+
+        if self.batch_llm and self.use_llm and self.llm_extractor:
+            return self._scrape_urls_batch(urls, source)
+
+        with ThreadPoolExecutor(max_workers=min(self.SCRAPE_WORKERS, len(urls))) as executor:
+            return list(executor.map(lambda url: self.scrape_url(url, source), urls))
+
+    def _scrape_urls_batch(self, urls: List[str], source: str) -> List[Optional[Auction]]:
+        """Fetch pages (throttled per site), extract them in one LLM batch, regex fallback for failures"""
+        with ThreadPoolExecutor(max_workers=min(self.SCRAPE_WORKERS, len(urls))) as executor:
+            htmls = list(executor.map(lambda url: self._fetch_html(url, source), urls))
+
+        fetched = [(url, html) for url, html in zip(urls, htmls) if html is not None]
+        extracted_by_url = dict(zip(
+            (url for url, _ in fetched),
+            self.llm_extractor.extract_batch(fetched)
+        ))
+
+        def finish(url: str) -> Optional[Auction]:
+            extracted = extracted_by_url.get(url)
+            if extracted:
+                return self._auction_from_extracted(extracted, url, source)
+            logger.warning(f"[SmartScraper] LLM extraction failed for {url}, falling back to regex")
+            return self._scrape_with_regex(url, source)
+
+        with ThreadPoolExecutor(max_workers=min(self.SCRAPE_WORKERS, len(urls))) as executor:
+            return list(executor.map(finish, urls))
+
+    def scrape_licitor(self, seen_urls: Optional[Set[str]] = None) -> List[Auction]:
+        """
+        Scrape all auctions from Licitor using smart extraction
+
+        Args:
+            seen_urls: Normalized URLs already scraped in this run (updated in place);
+                each auction URL is scraped at most once
+        """
+        seen_urls = set() if seen_urls is None else seen_urls
         all_auctions = []
+        # (auction URL, tribunal name) discovered on the date pages
+        auction_pages = []
 
         for slug, name in self.licitor.TRIBUNAUX.items():
             logger.info(f"[SmartScraper] Scraping Licitor - {name}...")
@@ -199,24 +294,29 @@ class SmartScraper:
             auction_urls = self.licitor.find_tribunal_auction_urls(slug)
 
             for date_url in auction_urls:
-                soup = self.licitor.fetch_page(date_url)
-                if soup:
-                    # Find individual auction links
-                    for link in soup.select("a[href*='/annonce/']"):
-                        href = link.get("href", "")
-                        full_url = href if href.startswith("http") else f"{self.licitor.base_url}{href}"
-
-                        auction = self.scrape_url(full_url, "licitor")
-                        if auction:
-                            auction.tribunal = name
-                            all_auctions.append(auction)
+                for full_url in self.licitor.find_date_auction_urls(date_url):
+                    if _claim_url(full_url, seen_urls):
+                        auction_pages.append((full_url, name))
+
+        auctions = self._scrape_urls([url for url, _ in auction_pages], "licitor")
+        for auction, (_, name) in zip(auctions, auction_pages):
+            if auction:
+                auction.tribunal = name
+                all_auctions.append(auction)
 
         logger.info(f"[SmartScraper] Licitor: {len(all_auctions)} auctions scraped")
         return all_auctions
 
-    def scrape_encheres_publiques(self) -> List[Auction]:
-        """Scrape auctions from encheres-publiques.com"""
-        all_auctions = []
+    def scrape_encheres_publiques(self, seen_urls: Optional[Set[str]] = None) -> List[Auction]:
+        """
+        Scrape auctions from encheres-publiques.com
+
+        Args:
+            seen_urls: Normalized URLs already scraped in this run (updated in place);
+                each auction URL is scraped at most once
+        """
+        seen_urls = set() if seen_urls is None else seen_urls
+        auction_urls = []
 
         # Scrape by department
         for dept in ["13", "83"]:
@@ -236,25 +336,28 @@ class SmartScraper:
 
                 for item in auction_list:
                     auction_url = item.get("url")
-                    if auction_url:
-                        auction = self.scrape_url(auction_url, "encheres_publiques")
-                        if auction:
-                            all_auctions.append(auction)
+                    if auction_url and _claim_url(auction_url, seen_urls):
+                        auction_urls.append(auction_url)
 
                 page += 1
 
+        auctions = self._scrape_urls(auction_urls, "encheres_publiques")
+        all_auctions = [auction for auction in auctions if auction]
+
         logger.info(f"[SmartScraper] EnchèresPubliques: {len(all_auctions)} auctions scraped")
         return all_auctions
 
     def scrape_all(self) -> List[Auction]:
         """Scrape all sources"""
         all_auctions = []
+        # Auction URLs scraped so far in this run, shared by all sources
+        seen_urls = set()
 
         # Licitor
-        all_auctions.extend(self.scrape_licitor())
+        all_auctions.extend(self.scrape_licitor(seen_urls))
 
         # Enchères Publiques
-        all_auctions.extend(self.scrape_encheres_publiques())
+        all_auctions.extend(self.scrape_encheres_publiques(seen_urls))
 
         logger.info(f"[SmartScraper] Total: {len(all_auctions)} auctions from all sources")
         return all_auctions
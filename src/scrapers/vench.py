@@ -2,14 +2,90 @@
 Scraper for vench.fr - Judicial real estate auctions
 """
 import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, date
+from functools import lru_cache
 from typing import List, Optional, Dict, Any
+import soupsieve
 from bs4 import BeautifulSoup
 from loguru import logger
 
 from .base_scraper import BaseScraper
+from ._text import PRICE_CHARS
 from src.storage.models import Auction, Lawyer, PropertyType, AuctionStatus, PVStatus
 
+# Listing selectors compiled once at import (cards, then table rows as a fallback)
+_SEL_LISTING_CARDS = soupsieve.compile(".vente-item, .annonce, article, .listing-item")
+_SEL_LISTING_ROWS = soupsieve.compile("table tr, .ventes-list > div")
+
+# Patterns compiled once at import (the parsers below run them on every page)
+_DATE_SLASH_RE = re.compile(r"(\d{1,2}/\d{1,2}/\d{4})")
+_CARD_PRICE_RE = re.compile(r"([\d\s]+)\s*€")
+_POSTAL_CODE_RE = re.compile(r"\b(13\d{3}|83\d{3})\b")
+_SOURCE_ID_RE = re.compile(r"/(\d+)-")
+_CITY_RE = re.compile(r"(?:13\d{3}|83\d{3})\s+([A-ZÀ-Ü][a-zà-ü\-]+(?:\s+[a-zà-ü\-]+)*)", re.IGNORECASE)
+_SURFACE_RE = re.compile(r"(\d+(?:[.,]\d+)?)\s*m[²2]")
+# Property type keywords (plain substrings of the lowercased text), in priority order
+_PROPERTY_TYPE_KEYWORDS = (
+    (PropertyType.APPARTEMENT, ("appartement", "studio", "f1", "f2", "f3", "f4", "f5")),
+    (PropertyType.MAISON, ("maison", "villa", "pavillon")),
+    (PropertyType.LOCAL_COMMERCIAL, ("local", "commerce", "bureau")),
+    (PropertyType.TERRAIN, ("terrain", "parcelle")),
+    (PropertyType.PARKING, ("parking", "garage", "box")),
+)
+_PIECES_RE = re.compile(r"(\d+)\s*(?:pièces?|pieces?)")
+_SALE_DATE_PATTERNS = (
+    re.compile(r"(?:vente|adjudication|audience)\s+(?:le\s+)?(\d{1,2}/\d{1,2}/\d{4})", re.IGNORECASE),
+    re.compile(r"(\d{1,2}/\d{1,2}/\d{4})", re.IGNORECASE),
+    re.compile(r"(\d{1,2}\s+\w+\s+\d{4})", re.IGNORECASE),
+)
+_SALE_TIME_RE = re.compile(r"[àa]\s+(\d{1,2})[hH:](\d{0,2})")
+_PRICE_PATTERNS = (
+    re.compile(r"mise\s+[àa]\s+prix\s*:?\s*([\d\s,.]+)\s*€?", re.IGNORECASE),
+    re.compile(r"prix\s*:?\s*([\d\s,.]+)\s*€", re.IGNORECASE),
+    re.compile(r"([\d\s,.]+)\s*€", re.IGNORECASE),
+)
+_VISIT_RE = re.compile(r"visite[s]?\s*:?\s*(.+?)(?:\n|$)", re.IGNORECASE)
+_DATE_SLASH_PARTS_RE = re.compile(r"(\d{1,2})/(\d{1,2})/(\d{4})")
+_DATE_FR_RE = re.compile(r"(\d{1,2})\s+(\w+)\s+(\d{4})")
+_MONTHS_FR = {
+    "janvier": 1, "février": 2, "mars": 3, "avril": 4,
+    "mai": 5, "juin": 6, "juillet": 7, "août": 8,
+    "septembre": 9, "octobre": 10, "novembre": 11, "décembre": 12
+}
+
+
+# Lawyer details
+_ME_NAME_RE = re.compile(r"(?:Maître|Me)\s+([A-ZÀ-Ü][a-zà-ü]+(?:\s+[A-ZÀ-Ü][a-zà-ü]+)*)")
+_PHONE_RE = re.compile(r"(?:Tél|Tel|Téléphone)\s*:?\s*([\d\s.]+)")
+_EMAIL_RE = re.compile(r"([a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,})")
+
+
+@lru_cache(maxsize=1024)
+def _parse_date(date_str: str) -> Optional[date]:
+    """Parse date string (memoized: the same dates recur across pages)"""
+    # DD/MM/YYYY
+    match = _DATE_SLASH_PARTS_RE.match(date_str)
+    if match:
+        try:
+            return date(int(match.group(3)), int(match.group(2)), int(match.group(1)))
+        except ValueError:
+            pass
+
+    # "15 janvier 2024"
+    match = _DATE_FR_RE.match(date_str)
+    if match:
+        day = int(match.group(1))
+        month = _MONTHS_FR.get(match.group(2).lower())
+        year = int(match.group(3))
+        if month:
+            try:
+                return date(year, month, day)
+            except ValueError:
+                pass
+
+    return None
+
 
 class VenchScraper(BaseScraper):
     """Scraper for vench.fr"""
@@ -29,6 +105,9 @@ class VenchScraper(BaseScraper):
         }
     }
 
+    # Concurrent fetch+parse of auction detail pages
+    DETAIL_WORKERS = 5
+
     def __init__(self):
         super().__init__(
             name="Vench",
@@ -49,12 +128,11 @@ class VenchScraper(BaseScraper):
         auctions = []
 
         # Find auction entries
-        cards = soup.select(".vente-item, .annonce, article, .listing-item")
+        cards = _SEL_LISTING_CARDS.select(soup)
 
         if not cards:
             # Try table structure
-            rows = soup.select("table tr, .ventes-list > div")
-            cards = rows
+            cards = _SEL_LISTING_ROWS.select(soup)
 
         for card in cards:
             try:
@@ -83,17 +161,17 @@ class VenchScraper(BaseScraper):
         text = card.get_text(strip=True)
 
         # Extract date
-        date_match = re.search(r"(\d{1,2}/\d{1,2}/\d{4})", text)
+        date_match = _DATE_SLASH_RE.search(text)
         if date_match:
             data["date_text"] = date_match.group(1)
 
         # Extract price
-        price_match = re.search(r"([\d\s]+)\s*€", text)
+        price_match = _CARD_PRICE_RE.search(text)
         if price_match:
             data["price_text"] = price_match.group(1)
 
         # Extract location
-        cp_match = re.search(r"\b(13\d{3}|83\d{3})\b", text)
+        cp_match = _POSTAL_CODE_RE.search(text)
         if cp_match:
             data["code_postal"] = cp_match.group(1)
 
@@ -110,14 +188,18 @@ class VenchScraper(BaseScraper):
         auction.url = url
 
         # Extract ID from URL
-        match = re.search(r"/(\d+)-", url)
+        match = _SOURCE_ID_RE.search(url)
         if match:
             auction.source_id = match.group(1)
 
+        # Page text, extracted (and lowercased) once for all the parsers below
+        text = soup.get_text()
+        text_lower = text.lower()
+
         # Parse content
         self._parse_location_info(soup, auction)
-        self._parse_property_info(soup, auction)
-        self._parse_sale_info(soup, auction)
+        self._parse_property_info(soup, text_lower, auction)
+        self._parse_sale_info(soup, text, text_lower, auction)
         self._parse_documents_links(soup, auction)
 
         return auction
@@ -143,80 +225,59 @@ class VenchScraper(BaseScraper):
 
         # Extract postal code
         full_text = f"{auction.adresse} {auction.description}"
-        cp_match = re.search(r"\b(13\d{3}|83\d{3})\b", full_text)
+        cp_match = _POSTAL_CODE_RE.search(full_text)
         if cp_match:
             auction.code_postal = cp_match.group(1)
             auction.department = auction.code_postal[:2]
 
         # Extract city
-        city_match = re.search(r"(?:13\d{3}|83\d{3})\s+([A-ZÀ-Ü][a-zà-ü\-]+(?:\s+[a-zà-ü\-]+)*)", full_text, re.IGNORECASE)
+        city_match = _CITY_RE.search(full_text)
         if city_match:
             auction.ville = city_match.group(1).title()
 
-    def _parse_property_info(self, soup: BeautifulSoup, auction: Auction):
-        """Parse property details"""
-        text = soup.get_text().lower()
-
-        # Type
-        type_mapping = {
-            PropertyType.APPARTEMENT: ["appartement", "studio", "f1", "f2", "f3", "f4", "f5"],
-            PropertyType.MAISON: ["maison", "villa", "pavillon"],
-            PropertyType.LOCAL_COMMERCIAL: ["local", "commerce", "bureau"],
-            PropertyType.TERRAIN: ["terrain", "parcelle"],
-            PropertyType.PARKING: ["parking", "garage", "box"],
-        }
+    def _parse_property_info(self, soup: BeautifulSoup, text: str, auction: Auction):
+        """Parse property details from the lowercased page text"""
 
-        for prop_type, keywords in type_mapping.items():
+        # Type (substring tests: faster here than a regex alternation or an automaton,
+        # and they stop at the first type found)
+        for prop_type, keywords in _PROPERTY_TYPE_KEYWORDS:
             if any(kw in text for kw in keywords):
                 auction.type_bien = prop_type
                 break
 
         # Surface
-        surface_match = re.search(r"(\d+(?:[.,]\d+)?)\s*m[²2]", text)
+        surface_match = _SURFACE_RE.search(text)
         if surface_match:
             auction.surface = float(surface_match.group(1).replace(",", "."))
 
         # Rooms
-        pieces_match = re.search(r"(\d+)\s*(?:pièces?|pieces?)", text)
+        pieces_match = _PIECES_RE.search(text)
         if pieces_match:
             auction.nb_pieces = int(pieces_match.group(1))
 
-    def _parse_sale_info(self, soup: BeautifulSoup, auction: Auction):
-        """Parse sale date, time, price"""
-        text = soup.get_text()
+    def _parse_sale_info(self, soup: BeautifulSoup, text: str, text_lower: str, auction: Auction):
+        """Parse sale date, time, price from the page text (and its lowercased copy)"""
 
         # Date
-        date_patterns = [
-            r"(?:vente|adjudication|audience)\s+(?:le\s+)?(\d{1,2}/\d{1,2}/\d{4})",
-            r"(\d{1,2}/\d{1,2}/\d{4})",
-            r"(\d{1,2}\s+\w+\s+\d{4})"
-        ]
-
-        for pattern in date_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in _SALE_DATE_PATTERNS:
+            match = pattern.search(text)
             if match:
                 date_str = match.group(1)
-                parsed = self._parse_date(date_str)
+                parsed = _parse_date(date_str)
                 if parsed:
                     auction.date_vente = parsed
                     break
 
         # Time
-        time_match = re.search(r"[àa]\s+(\d{1,2})[hH:](\d{0,2})", text)
+        time_match = _SALE_TIME_RE.search(text)
         if time_match:
             h = time_match.group(1)
             m = time_match.group(2) or "00"
             auction.heure_vente = f"{h}h{m}"
 
         # Price
-        price_patterns = [
-            r"mise\s+[àa]\s+prix\s*:?\s*([\d\s,.]+)\s*€?",
-            r"prix\s*:?\s*([\d\s,.]+)\s*€",
-            r"([\d\s,.]+)\s*€"
-        ]
-
-        for pattern in price_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in _PRICE_PATTERNS:
+            match = pattern.search(text)
             if match:
                 price = self._extract_price(match.group(1))
                 if price:
@@ -225,54 +286,24 @@ class VenchScraper(BaseScraper):
 
         # Tribunal
         for key, tribunal_info in self.TRIBUNAUX.items():
-            if key in text.lower() or tribunal_info["nom"].lower() in text.lower():
+            if key in text_lower or tribunal_info["nom"].lower() in text_lower:
                 auction.tribunal = tribunal_info["nom"]
                 break
 
         # Visit dates
-        visit_match = re.search(r"visite[s]?\s*:?\s*(.+?)(?:\n|$)", text, re.IGNORECASE)
+        visit_match = _VISIT_RE.search(text)
         if visit_match:
             visit_text = visit_match.group(1)
-            dates = re.findall(r"(\d{1,2}/\d{1,2}/\d{4})", visit_text)
+            dates = _DATE_SLASH_RE.findall(visit_text)
             for d in dates:
-                parsed = self._parse_date(d)
+                parsed = _parse_date(d)
                 if parsed:
                     auction.dates_visite.append(datetime.combine(parsed, datetime.min.time()))
 
-    def _parse_date(self, date_str: str) -> Optional[date]:
-        """Parse date string"""
-        months = {
-            "janvier": 1, "février": 2, "mars": 3, "avril": 4,
-            "mai": 5, "juin": 6, "juillet": 7, "août": 8,
-            "septembre": 9, "octobre": 10, "novembre": 11, "décembre": 12
-        }
-
-        # DD/MM/YYYY
-        match = re.match(r"(\d{1,2})/(\d{1,2})/(\d{4})", date_str)
-        if match:
-            try:
-                return date(int(match.group(3)), int(match.group(2)), int(match.group(1)))
-            except ValueError:
-                pass
-
-        # "15 janvier 2024"
-        match = re.match(r"(\d{1,2})\s+(\w+)\s+(\d{4})", date_str)
-        if match:
-            day = int(match.group(1))
-            month = months.get(match.group(2).lower())
-            year = int(match.group(3))
-            if month:
-                try:
-                    return date(year, month, day)
-                except ValueError:
-                    pass
-
-        return None
-
     def _extract_price(self, text: str) -> Optional[float]:
         """Extract price value"""
-        cleaned = re.sub(r"[^\d,.]", "", text.replace(" ", ""))
-        cleaned = cleaned.replace(",", ".")
+        # Digits, commas and dots only, in one translate pass
+        cleaned = text.translate(PRICE_CHARS).replace(",", ".")
 
         if cleaned.count(".") > 1:
             parts = cleaned.rsplit(".", 1)
@@ -285,18 +316,15 @@ class VenchScraper(BaseScraper):
 
     def _parse_documents_links(self, soup: BeautifulSoup, auction: Auction):
         """Parse document links"""
-        doc_keywords = ["cahier", "charge", "pv", "pdf", "document", "télécharger"]
-
+        # First link to a PDF (its href contains "pdf", one of the cahier/pv/document
+        # keywords, so the keyword test always held for these links)
         for link in soup.find_all("a", href=True):
             href = link.get("href", "").lower()
-            text = link.get_text().lower()
-
-            if any(kw in href or kw in text for kw in doc_keywords):
-                if ".pdf" in href:
-                    full_url = href if href.startswith("http") else f"{self.base_url}/{href.lstrip('/')}"
-                    auction.pv_url = full_url
-                    auction.pv_status = PVStatus.A_TELECHARGER
-                    break
+            if ".pdf" in href:
+                full_url = href if href.startswith("http") else f"{self.base_url}/{href.lstrip('/')}"
+                auction.pv_url = full_url
+                auction.pv_status = PVStatus.A_TELECHARGER
+                break
 
         if not auction.pv_url:
             auction.pv_status = PVStatus.A_DEMANDER
@@ -308,17 +336,17 @@ class VenchScraper(BaseScraper):
         text = soup.get_text()
 
         # Try to find Maître name
-        me_match = re.search(r"(?:Maître|Me)\s+([A-ZÀ-Ü][a-zà-ü]+(?:\s+[A-ZÀ-Ü][a-zà-ü]+)*)", text)
+        me_match = _ME_NAME_RE.search(text)
         if me_match:
             lawyer.nom = f"Me {me_match.group(1)}"
 
         # Phone
-        phone_match = re.search(r"(?:Tél|Tel|Téléphone)\s*:?\s*([\d\s.]+)", text)
+        phone_match = _PHONE_RE.search(text)
         if phone_match:
             lawyer.telephone = phone_match.group(1).strip()
 
         # Email
-        email_match = re.search(r"([a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,})", text)
+        email_match = _EMAIL_RE.search(text)
         if email_match:
             lawyer.email = email_match.group(1)
 
@@ -338,7 +366,8 @@ class VenchScraper(BaseScraper):
 
     def scrape_all_tribunaux(self) -> List[Auction]:
         """Scrape auctions from all tribunaux"""
-        all_auctions = []
+        # (detail page URL, tribunal name) for every auction listed by a tribunal
+        detail_pages = []
 
         for key, tribunal_info in self.TRIBUNAUX.items():
             logger.info(f"[Vench] Scraping {tribunal_info['nom']}...")
@@ -349,11 +378,17 @@ class VenchScraper(BaseScraper):
                 auction_data = self.parse_auction_list(soup)
                 for data in auction_data:
                     if "url" in data:
-                        auction = self.parse_auction_detail(data["url"])
-                        if auction:
-                            if not auction.tribunal:
-                                auction.tribunal = tribunal_info["nom"]
-                            all_auctions.append(auction)
+                        detail_pages.append((data["url"], tribunal_info["nom"]))
+
+        # Parse the auction detail pages in parallel (results keep the listing order)
+        all_auctions = []
+        with ThreadPoolExecutor(max_workers=self.DETAIL_WORKERS) as executor:
+            auctions = executor.map(self.parse_auction_detail, [url for url, _ in detail_pages])
+            for auction, (_, name) in zip(auctions, detail_pages):
+                if auction:
+                    if not auction.tribunal:
+                        auction.tribunal = name
+                    all_auctions.append(auction)
 
         logger.info(f"[Vench] Total: {len(all_auctions)} auctions scraped")
         return all_auctions
@@ -239,90 +239,98 @@ class Database:
 
     def save_auction(self, auction: Auction) -> int:
         """Save or update an auction"""
+        with self.get_connection() as conn:
+            return self._save_auction(conn.cursor(), auction)
+
+    def save_auctions(self, auctions: List[Auction]) -> List[int]:
+        """Save or update several auctions in a single transaction"""
         with self.get_connection() as conn:
             cursor = conn.cursor()
+            return [self._save_auction(cursor, auction) for auction in auctions]
 
-            # Serialize dates_visite
-            dates_visite_json = json.dumps([
-                d.isoformat() for d in auction.dates_visite
-            ]) if auction.dates_visite else "[]"
+    def _save_auction(self, cursor: sqlite3.Cursor, auction: Auction) -> int:
+        """Insert or update an auction on the caller's connection (committed by get_connection)"""
+        # Serialize dates_visite
+        dates_visite_json = json.dumps([
+            d.isoformat() for d in auction.dates_visite
+        ]) if auction.dates_visite else "[]"
 
-            # Serialize photos and documents
-            photos_json = json.dumps(auction.photos) if auction.photos else "[]"
-            documents_json = json.dumps(auction.documents) if auction.documents else "[]"
+        # Serialize photos and documents
+        photos_json = json.dumps(auction.photos) if auction.photos else "[]"
+        documents_json = json.dumps(auction.documents) if auction.documents else "[]"
 
-            if auction.id:
-                # Update
-                cursor.execute("""
-                    UPDATE auctions SET
-                        source = ?, source_id = ?, url = ?, adresse = ?,
-                        code_postal = ?, ville = ?, department = ?,
-                        latitude = ?, longitude = ?, type_bien = ?,
-                        surface = ?, nb_pieces = ?, nb_chambres = ?, etage = ?,
-                        description = ?, description_detaillee = ?, occupation = ?, cadastre = ?,
-                        photos = ?, documents = ?,
-                        date_vente = ?, heure_vente = ?,
-                        dates_visite = ?, date_jugement = ?, mise_a_prix = ?,
-                        prix_adjudication = ?, tribunal = ?, lawyer_id = ?,
-                        avocat_nom = ?, avocat_cabinet = ?, avocat_adresse = ?,
-                        avocat_telephone = ?, avocat_email = ?, avocat_site_web = ?,
-                        pv_status = ?, pv_url = ?, pv_local_path = ?,
-                        prix_marche_estime = ?, prix_m2_marche = ?,
-                        decote_pourcentage = ?, score_opportunite = ?,
-                        status = ?, updated_at = CURRENT_TIMESTAMP
-                    WHERE id = ?
-                """, (
-                    auction.source, auction.source_id, auction.url, auction.adresse,
-                    auction.code_postal, auction.ville, auction.department,
-                    auction.latitude, auction.longitude, auction.type_bien.value if auction.type_bien else None,
-                    auction.surface, auction.nb_pieces, auction.nb_chambres, auction.etage,
-                    auction.description, auction.description_detaillee, auction.occupation, auction.cadastre,
-                    photos_json, documents_json,
-                    auction.date_vente.isoformat() if auction.date_vente else None,
-                    auction.heure_vente, dates_visite_json,
-                    auction.date_jugement.isoformat() if auction.date_jugement else None,
-                    auction.mise_a_prix, auction.prix_adjudication, auction.tribunal,
-                    auction.lawyer_id, auction.avocat_nom, auction.avocat_cabinet, auction.avocat_adresse,
-                    auction.avocat_telephone, auction.avocat_email, auction.avocat_site_web,
-                    auction.pv_status.value if auction.pv_status else None,
-                    auction.pv_url, auction.pv_local_path, auction.prix_marche_estime,
-                    auction.prix_m2_marche, auction.decote_pourcentage, auction.score_opportunite,
-                    auction.status.value if auction.status else None, auction.id
-                ))
-                return auction.id
-            else:
-                # Insert
-                cursor.execute("""
-                    INSERT OR REPLACE INTO auctions (
-                        source, source_id, url, adresse, code_postal, ville, department,
-                        latitude, longitude, type_bien, surface, nb_pieces, nb_chambres,
-                        etage, description, description_detaillee, occupation, cadastre,
-                        photos, documents,
-                        date_vente, heure_vente, dates_visite,
-                        date_jugement, mise_a_prix, prix_adjudication, tribunal, lawyer_id,
-                        avocat_nom, avocat_cabinet, avocat_adresse, avocat_telephone, avocat_email, avocat_site_web,
-                        pv_status, pv_url, pv_local_path, prix_marche_estime, prix_m2_marche,
-                        decote_pourcentage, score_opportunite, status
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    auction.source, auction.source_id, auction.url, auction.adresse,
-                    auction.code_postal, auction.ville, auction.department,
-                    auction.latitude, auction.longitude, auction.type_bien.value if auction.type_bien else None,
-                    auction.surface, auction.nb_pieces, auction.nb_chambres, auction.etage,
-                    auction.description, auction.description_detaillee, auction.occupation, auction.cadastre,
-                    photos_json, documents_json,
-                    auction.date_vente.isoformat() if auction.date_vente else None,
-                    auction.heure_vente, dates_visite_json,
-                    auction.date_jugement.isoformat() if auction.date_jugement else None,
-                    auction.mise_a_prix, auction.prix_adjudication, auction.tribunal,
-                    auction.lawyer_id, auction.avocat_nom, auction.avocat_cabinet, auction.avocat_adresse,
-                    auction.avocat_telephone, auction.avocat_email, auction.avocat_site_web,
-                    auction.pv_status.value if auction.pv_status else None,
-                    auction.pv_url, auction.pv_local_path, auction.prix_marche_estime,
-                    auction.prix_m2_marche, auction.decote_pourcentage, auction.score_opportunite,
-                    auction.status.value if auction.status else "a_venir"
-                ))
-                return cursor.lastrowid
+        if auction.id:
+            # Update
+            cursor.execute("""
+                UPDATE auctions SET
+                    source = ?, source_id = ?, url = ?, adresse = ?,
+                    code_postal = ?, ville = ?, department = ?,
+                    latitude = ?, longitude = ?, type_bien = ?,
+                    surface = ?, nb_pieces = ?, nb_chambres = ?, etage = ?,
+                    description = ?, description_detaillee = ?, occupation = ?, cadastre = ?,
+                    photos = ?, documents = ?,
+                    date_vente = ?, heure_vente = ?,
+                    dates_visite = ?, date_jugement = ?, mise_a_prix = ?,
+                    prix_adjudication = ?, tribunal = ?, lawyer_id = ?,
+                    avocat_nom = ?, avocat_cabinet = ?, avocat_adresse = ?,
+                    avocat_telephone = ?, avocat_email = ?, avocat_site_web = ?,
+                    pv_status = ?, pv_url = ?, pv_local_path = ?,
+                    prix_marche_estime = ?, prix_m2_marche = ?,
+                    decote_pourcentage = ?, score_opportunite = ?,
+                    status = ?, updated_at = CURRENT_TIMESTAMP
+                WHERE id = ?
+            """, (
+                auction.source, auction.source_id, auction.url, auction.adresse,
+                auction.code_postal, auction.ville, auction.department,
+                auction.latitude, auction.longitude, auction.type_bien.value if auction.type_bien else None,
+                auction.surface, auction.nb_pieces, auction.nb_chambres, auction.etage,
+                auction.description, auction.description_detaillee, auction.occupation, auction.cadastre,
+                photos_json, documents_json,
+                auction.date_vente.isoformat() if auction.date_vente else None,
+                auction.heure_vente, dates_visite_json,
+                auction.date_jugement.isoformat() if auction.date_jugement else None,
+                auction.mise_a_prix, auction.prix_adjudication, auction.tribunal,
+                auction.lawyer_id, auction.avocat_nom, auction.avocat_cabinet, auction.avocat_adresse,
+                auction.avocat_telephone, auction.avocat_email, auction.avocat_site_web,
+                auction.pv_status.value if auction.pv_status else None,
+                auction.pv_url, auction.pv_local_path, auction.prix_marche_estime,
+                auction.prix_m2_marche, auction.decote_pourcentage, auction.score_opportunite,
+                auction.status.value if auction.status else None, auction.id
+            ))
+            return auction.id
+        else:
+            # Insert
+            cursor.execute("""
+                INSERT OR REPLACE INTO auctions (
+                    source, source_id, url, adresse, code_postal, ville, department,
+                    latitude, longitude, type_bien, surface, nb_pieces, nb_chambres,
+                    etage, description, description_detaillee, occupation, cadastre,
+                    photos, documents,
+                    date_vente, heure_vente, dates_visite,
+                    date_jugement, mise_a_prix, prix_adjudication, tribunal, lawyer_id,
+                    avocat_nom, avocat_cabinet, avocat_adresse, avocat_telephone, avocat_email, avocat_site_web,
+                    pv_status, pv_url, pv_local_path, prix_marche_estime, prix_m2_marche,
+                    decote_pourcentage, score_opportunite, status
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, (
+                auction.source, auction.source_id, auction.url, auction.adresse,
+                auction.code_postal, auction.ville, auction.department,
+                auction.latitude, auction.longitude, auction.type_bien.value if auction.type_bien else None,
+                auction.surface, auction.nb_pieces, auction.nb_chambres, auction.etage,
+                auction.description, auction.description_detaillee, auction.occupation, auction.cadastre,
+                photos_json, documents_json,
+                auction.date_vente.isoformat() if auction.date_vente else None,
+                auction.heure_vente, dates_visite_json,
+                auction.date_jugement.isoformat() if auction.date_jugement else None,
+                auction.mise_a_prix, auction.prix_adjudication, auction.tribunal,
+                auction.lawyer_id, auction.avocat_nom, auction.avocat_cabinet, auction.avocat_adresse,
+                auction.avocat_telephone, auction.avocat_email, auction.avocat_site_web,
+                auction.pv_status.value if auction.pv_status else None,
+                auction.pv_url, auction.pv_local_path, auction.prix_marche_estime,
+                auction.prix_m2_marche, auction.decote_pourcentage, auction.score_opportunite,
+                auction.status.value if auction.status else "a_venir"
+            ))
+            return cursor.lastrowid
 
     def _row_to_auction(self, row) -> Auction:
         """Convert database row to Auction object"""
@@ -0,0 +1,53 @@
+"""
+Tests for the cross-source validator
+"""
+import copy
+import unittest
+
+from src.scrapers.cross_validator import CrossValidator, cross_validate
+from src.storage.models import Auction
+
+
+class EnrichFromPostalBulkTest(unittest.TestCase):
+    """_enrich_from_postal_bulk must match _enrich_from_postal, including missing fields"""
+
+    def setUp(self):
+        self.validator = CrossValidator()
+
+    def assert_same_as_per_auction(self, auctions):
+        expected = copy.deepcopy(auctions)
+        for auction in expected:
+            self.validator._enrich_from_postal(auction)
+
+        self.validator._enrich_from_postal_bulk(auctions)
+
+        self.assertEqual(
+            [(a.code_postal, a.ville, a.department) for a in auctions],
+            [(a.code_postal, a.ville, a.department) for a in expected],
+        )
+
+    def test_empty_ville(self):
+        self.assert_same_as_per_auction([Auction(code_postal="13001", ville="")])
+
+    def test_no_ville_no_postal_code(self):
+        self.assert_same_as_per_auction([Auction()])
+
+    def test_unknown_postal_code(self):
+        self.assert_same_as_per_auction([Auction(code_postal="99999")])
+
+    def test_mixed_batch(self):
+        self.assert_same_as_per_auction([
+            Auction(),
+            Auction(code_postal="75015"),
+            Auction(ville="Marseille 14"),
+            Auction(ville="Nanterre", department="92"),
+        ])
+
+    def test_cross_validate_unmatched_without_ville(self):
+        results = cross_validate([Auction(code_postal="13001", ville="")], [])
+        self.assertEqual(len(results), 1)
+        self.assertEqual(results[0].department, "13")
+
+
+if __name__ == "__main__":
+    unittest.main()